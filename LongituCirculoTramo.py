@@ -1,18 +1,293 @@
+import argparse
+import itertools
 import math
-import turtle
+import os
+import sys
+import time
+
+import numpy as np
+
+# Columnas de entrada y de resultados del modo por lotes
+INPUT_COLUMNS = ('radio', 'tramo', 'tiempo')
+RESULT_COLUMNS = ('rotaciones', 'velocidad_lineal', 'velocidad_angular')
 
 def calcular_rotaciones(radio, tramo):
-    """Calcula el número de rotaciones de un círculo en un tramo dado."""
+    """Calcula el número de rotaciones de un círculo en un tramo dado (escalares o arrays)."""
     circunferencia = 2 * math.pi * radio
     rotaciones = tramo / circunferencia
     return rotaciones
 
-def animar_rotacion(radio, tramo, direccion="izquierda"):
-    """Anima la rotación de un círculo en un tramo dado."""
+def calcular_lote(radio, tramo, tiempo, out=None):
+    """
+    Rotaciones y velocidades lineal (m/s) y angular (grados/s) de muchas filas a la vez.
+
+    Las filas con tiempo <= 0 no tienen velocidades y quedan en NaN, igual
+    que el modo interactivo no las muestra.
+
+    Args:
+        radio, tramo, tiempo (array_like): Columnas de entrada.
+        out (np.ndarray | None): Array (n, 3) float64 donde escribir, para
+            reutilizar la memoria entre bloques.
+
+    Returns:
+        np.ndarray: (n, 3) con las columnas de RESULT_COLUMNS.
+    """
+    radio, tramo, tiempo = (np.asarray(c, dtype=np.float64) for c in (radio, tramo, tiempo))
+    if out is None:
+        out = np.empty((len(radio), 3))
+    rotaciones, lineal, angular = out[:, 0], out[:, 1], out[:, 2]
+
+    np.multiply(radio, 2 * math.pi, out=rotaciones)
+    np.divide(tramo, rotaciones, out=rotaciones)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(tramo, tiempo, out=lineal)
+        np.multiply(rotaciones, 360, out=angular)
+        np.divide(angular, tiempo, out=angular)
+    sin_tiempo = tiempo <= 0
+    lineal[sin_tiempo] = np.nan
+    angular[sin_tiempo] = np.nan
+    return out
+
+def _columnas_npy(data):
+    """Columnas (radio, tramo, tiempo) de un .npy (n, 3) o estructurado con esos campos."""
+    if data.dtype.names:
+        return tuple(data[name] for name in INPUT_COLUMNS)
+    return data[:, 0], data[:, 1], data[:, 2]
+
+def leer_bloques(path, chunk_rows=1_000_000):
+    """
+    Lee un archivo de telemetría por bloques de `chunk_rows` filas.
+
+    Acepta .npy (abierto con memmap, sin leerlo entero) y CSV con columnas
+    radio, tramo, tiempo; si el CSV tiene cabecera, se usan sus nombres.
+    Las líneas en blanco del CSV se ignoran.
+
+    Yields:
+        tuple: (radio, tramo, tiempo) de cada bloque.
+    """
+    if path.endswith('.npy'):
+        data = np.load(path, mmap_mode='r')
+        for start in range(0, len(data), chunk_rows):
+            yield _columnas_npy(data[start:start + chunk_rows])
+        return
+
+    with open(path) as f:
+        first = f.readline()
+        fields = [field.strip() for field in first.split(',')]
+        try:
+            float(fields[0])
+            order = (0, 1, 2)
+            pending = [first]
+        except ValueError:
+            order = tuple(fields.index(name) for name in INPUT_COLUMNS)
+            pending = []
+
+        # np.loadtxt convierte cada bloque en C; antes sólo se quitan las líneas en blanco, que no acepta
+        lines = itertools.chain(pending, f)
+        while True:
+            block = list(itertools.islice(lines, chunk_rows))
+            if not block:
+                return
+            rows = list(filter(str.strip, block))
+            if rows:
+                data = np.loadtxt(rows, delimiter=',', usecols=order, ndmin=2, comments=None)
+                yield data[:, 0], data[:, 1], data[:, 2]
+
+def _contar_filas(path):
+    """Filas de un archivo, para reservar la salida .npy antes de procesarlo."""
+    if path.endswith('.npy'):
+        return len(np.load(path, mmap_mode='r'))
+    # Se cuentan las mismas filas que lee leer_bloques: sin la cabecera ni las líneas en blanco
+    with open(path) as f:
+        first = f.readline()
+        try:
+            float(first.split(',')[0])
+            rows = 1
+        except ValueError:
+            rows = 0
+        return rows + sum(map(bool, map(str.strip, f)))
+
+# Escritura de CSV por bloques: cada valor como '%.9g' % valor (igual que np.savetxt, que
+# formatea fila a fila en Python), pero construyendo los caracteres con operaciones de NumPy
+_CIFRAS = 9
+_FILAS_TEXTO = 8192  # filas por llamada a _formatear_csv; con bloques pequeños los índices caben en caché
+_ANCHO = 16  # caracteres máximos de un valor: '-1.23456789e-100'
+
+# Cada valor se escribe copiando caracteres de una fila de _FUENTE bytes: sus 9 cifras, '0', '.', '-',
+# 'e', el signo y las 4 cifras del exponente, y un hueco (0) que se descarta al compactar
+_CERO, _PUNTO, _MENOS, _E, _SIGNO_EXP, _EXP, _HUECO = 9, 10, 11, 12, 13, 14, 18
+_FUENTE = 19
+
+# Las 4 cifras de cada número de 0 a 9999 como un uint32, y cuántos ceros tiene al final
+_CUATRO_CIFRAS = ((np.arange(10**4)[:, None] // 10 ** np.arange(3, -1, -1)) % 10 + ord('0')).astype(np.uint8)
+_CUATRO_CIFRAS = _CUATRO_CIFRAS.view(np.uint32).ravel()
+_CEROS_FINALES = sum((np.arange(10**4) % 10**k == 0).astype(np.int64) for k in range(1, 5))
+
+def _plantilla(clase, significativas, negativo):
+    """Posiciones de la fila fuente que forman un valor; clase = e + 4 en notación fija, 13 o 14 en exponencial."""
+    indices = [_MENOS] if negativo else []
+    if clase < 13:
+        e = clase - 4
+        if e >= 0:
+            indices += range(e + 1)
+            if significativas > e + 1:
+                indices += [_PUNTO, *range(e + 1, significativas)]
+        else:
+            indices += [_CERO, _PUNTO] + [_CERO] * (-e - 1) + list(range(significativas))
+    else:
+        indices.append(0)
+        if significativas > 1:
+            indices += [_PUNTO, *range(1, significativas)]
+        # Dos cifras de exponente, o tres desde 1e100
+        indices += [_E, _SIGNO_EXP, *range(_EXP + (2 if clase == 13 else 1), _EXP + 4)]
+    return indices + [_HUECO] * (_ANCHO - len(indices))
+
+_PLANTILLAS = np.array([[[_plantilla(clase, significativas, negativo) for negativo in (0, 1)]
+                         for significativas in range(_CIFRAS + 1)] for clase in range(15)], dtype=np.intp)
+
+def _potencia_de_10(values, k):
+    # values · 10^k en dos pasos, para que 10^k no se desborde con los números más pequeños
+    half = k // 2
+    with np.errstate(over='ignore', under='ignore'):
+        return values * np.power(10.0, half) * np.power(10.0, k - half)
+
+def _formatear_csv(block):
+    """Texto CSV (bytes) de un bloque (n, c), con cada valor como '%.9g' % valor."""
+    values = np.ascontiguousarray(block, dtype=np.float64).ravel()
+    count = len(values)
+    negativo = np.signbit(values)
+    magnitude = np.abs(values)
+    normal = np.isfinite(values) & (magnitude > 0)
+    magnitude[~normal] = 1
+
+    # Exponente decimal y 9 cifras significativas redondeadas; log10 puede equivocarse en uno
+    e = np.floor(np.log10(magnitude)).astype(np.int64)
+    digits = np.rint(_potencia_de_10(magnitude, _CIFRAS - 1 - e)).astype(np.int64)
+    for wrong, step in ((digits < 10 ** (_CIFRAS - 1), -1), (digits >= 10 ** _CIFRAS, 1)):
+        if wrong.any():
+            e[wrong] += step
+            digits[wrong] = np.rint(_potencia_de_10(magnitude[wrong], _CIFRAS - 1 - e[wrong])).astype(np.int64)
+    digits[~normal] = 0
+    e[~normal] = 0
+
+    # Cifras en grupos de 1 + 4 + 4; como printf, sin los ceros finales
+    high, low = np.divmod(digits, 10**4)
+    first, middle = np.divmod(high, 10**4)
+    zeros = _CEROS_FINALES[low] + np.where(low == 0, _CEROS_FINALES[middle], 0)
+    significativas = np.maximum(_CIFRAS - zeros, 1)
+
+    # Notación fija si -4 <= e < 9, como '%g'
+    clase = np.where((e >= -4) & (e < _CIFRAS), e + 4, np.where(np.abs(e) >= 100, 14, 13))
+
+    source = np.zeros((count, _FUENTE), dtype=np.uint8)
+    source[:, 0] = first + ord('0')
+    source[:, 1:5].view(np.uint32)[:, 0] = _CUATRO_CIFRAS[middle]
+    source[:, 5:9].view(np.uint32)[:, 0] = _CUATRO_CIFRAS[low]
+    source[:, [_CERO, _PUNTO, _MENOS, _E]] = np.frombuffer(b'0.-e', dtype=np.uint8)
+    source[:, _SIGNO_EXP] = np.where(e < 0, ord('-'), ord('+'))
+    source[:, _EXP:_EXP + 4].view(np.uint32)[:, 0] = _CUATRO_CIFRAS[np.abs(e)]
+
+    indices = _PLANTILLAS[clase, significativas, negativo.view(np.uint8)]
+    indices += (np.arange(count) * _FUENTE)[:, None]
+    text = np.empty((count, _ANCHO + 1), dtype=np.uint8)
+    np.take(source.ravel(), indices, out=text[:, :_ANCHO])
+
+    for special, word in ((np.isnan(values), b'nan'), (np.isposinf(values), b'inf'), (np.isneginf(values), b'-inf')):
+        if special.any():
+            text[special, :_ANCHO] = 0
+            text[special, :len(word)] = np.frombuffer(word, dtype=np.uint8)
+
+    # Comas entre columnas y salto de línea al final de cada fila; los huecos se descartan
+    text[:, _ANCHO] = ord(',')
+    text[block.shape[1] - 1::block.shape[1], _ANCHO] = ord('\n')
+    return text[text != 0].tobytes()
+
+def procesar_archivo(input_path, output_path, chunk_rows=1_000_000):
+    """
+    Calcula los resultados de un archivo completo bloque a bloque.
+
+    La memoria usada depende de `chunk_rows` y no del tamaño del archivo:
+    la salida .npy se escribe con memmap (open_memmap) y la CSV por bloques.
+
+    Returns:
+        int: Filas procesadas.
+    """
+    buffer = np.empty((chunk_rows, 3))
+    rows = 0
+    if output_path.endswith('.npy'):
+        result = np.lib.format.open_memmap(output_path, mode='w+', dtype=np.float64,
+                                           shape=(_contar_filas(input_path), 3))
+        for radio, tramo, tiempo in leer_bloques(input_path, chunk_rows):
+            n = len(radio)
+            result[rows:rows + n] = calcular_lote(radio, tramo, tiempo, out=buffer[:n])
+            rows += n
+        result.flush()
+        return rows
+
+    with open(output_path, 'wb') as f:
+        f.write((','.join(INPUT_COLUMNS + RESULT_COLUMNS) + '\n').encode())
+        for radio, tramo, tiempo in leer_bloques(input_path, chunk_rows):
+            n = len(radio)
+            block = np.column_stack((radio, tramo, tiempo, calcular_lote(radio, tramo, tiempo, out=buffer[:n])))
+            for start in range(0, n, _FILAS_TEXTO):
+                f.write(_formatear_csv(block[start:start + _FILAS_TEXTO]))
+            rows += n
+    return rows
+
+def trayectoria(radio, tramo, direccion="izquierda", frames=None, distancia_por_paso=1, inicio=(-300, 0)):
+    """
+    Posiciones y orientaciones del círculo, precalculadas para los frames de la animación.
+
+    Cada paso avanza `distancia_por_paso` y gira un ángulo fijo, así que la
+    posición tras k pasos es una suma geométrica con forma cerrada:
+    d · (1 - e^{ikg}) / (1 - e^{ig}). Sólo se calculan los pasos que se
+    muestran, de modo que el coste depende de `frames` y no del tramo.
+
+    Args:
+        frames (int | None): Frames de la animación; None para uno por paso.
+
+    Returns:
+        tuple: (x, y, heading) con un elemento por frame (heading en grados).
+    """
+    circunferencia = 2 * math.pi * radio
+    grados_por_paso = (360 * distancia_por_paso) / circunferencia
+    if direccion == "derecha":
+        grados_por_paso *= -1  # Rotación horaria
+
+    pasos = int(tramo / distancia_por_paso)
+    if frames is None or frames >= pasos:
+        k = np.arange(pasos + 1)
+    else:
+        k = np.unique(np.linspace(0, pasos, frames + 1).round().astype(np.int64))
+
+    giro = np.exp(1j * np.radians(grados_por_paso))
+    if giro == 1:
+        z = distancia_por_paso * k.astype(complex)
+    else:
+        z = distancia_por_paso * (1 - giro ** k) / (1 - giro)
+    return inicio[0] + z.real, inicio[1] + z.imag, np.mod(k * grados_por_paso, 360)
+
+def animar_rotacion(radio, tramo, direccion="izquierda", frames=300, cada=1, pausa=0.0):
+    """
+    Anima la rotación de un círculo en un tramo dado.
+
+    La trayectoria se precalcula con `trayectoria` y la pantalla se
+    redibuja sólo cada `cada` frames (tracer desactivado), así que la
+    duración depende del número de frames y no de la distancia.
+
+    Args:
+        frames (int | None): Frames de la animación; None para uno por paso como antes.
+        cada (int): Frames entre actualizaciones de la pantalla.
+        pausa (float): Segundos de espera tras cada actualización.
+    """
+    import turtle
+
+    x, y, heading = trayectoria(radio, tramo, direccion, frames)
 
     ventana = turtle.Screen()
     ventana.title("Rotación de un círculo")
     ventana.setup(width=800, height=400)
+    ventana.tracer(0)
 
     # Configuración del círculo
     circulo = turtle.Turtle()
@@ -20,27 +295,104 @@ def animar_rotacion(radio, tramo, direccion="izquierda"):
     circulo.shapesize(radio)
     circulo.color("blue")
     circulo.penup()
-    circulo.goto(-300, 0)  # Posición inicial a la izquierda
+    circulo.goto(x[0], y[0])  # Posición inicial a la izquierda
     circulo.pendown()
-
-    # Parámetros de movimiento
-    circunferencia = 2 * math.pi * radio
-    distancia_por_paso = 1  # Ajustable para suavizar la animación
-    grados_por_paso = (360 * distancia_por_paso) / circunferencia
+    ventana.update()
 
     # Animación
-    if direccion == "derecha":
-        grados_por_paso *= -1  # Rotación horaria
-
-    for _ in range(int(tramo / distancia_por_paso)):
-        circulo.forward(distancia_por_paso)
-        circulo.left(grados_por_paso)
+    for frame in range(1, len(x)):
+        circulo.goto(x[frame], y[frame])
+        circulo.setheading(heading[frame])
+        if frame % cada == 0 or frame == len(x) - 1:
+            ventana.update()
+            if pausa:
+                time.sleep(pausa)
 
     ventana.mainloop()
 
+def exportar_rotacion(radio, tramo, out_dir, direccion="izquierda", frames=300, dpi=100):
+    """
+    Guarda la animación como secuencia de PNG sin ventana (backend Agg).
+
+    Cada frame muestra el recorrido hasta ese momento, el círculo y una
+    marca de su orientación. Los archivos se llaman como los de RenderHeadless.
+
+    Returns:
+        int: Número de frames escritos.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from galaxias.RenderHeadless import frame_path
+
+    x, y, heading = trayectoria(radio, tramo, direccion, frames)
+    # shapesize(radio) escala la forma de 20 píxeles de la tortuga
+    tamano = 10 * radio
+    os.makedirs(out_dir, exist_ok=True)
+
+    fig, ax = plt.subplots(figsize=(8, 4), dpi=dpi)
+    ax.set_xlim(-400, 400)
+    ax.set_ylim(-200, 200)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    ax.set_title("Rotación de un círculo")
+    recorrido, = ax.plot([], [], color='black', linewidth=1)
+    circulo = plt.Circle((x[0], y[0]), tamano, color='blue')
+    ax.add_patch(circulo)
+    marca, = ax.plot([], [], color='white', linewidth=2)
+
+    for frame in range(len(x)):
+        recorrido.set_data(x[:frame + 1], y[:frame + 1])
+        circulo.center = (x[frame], y[frame])
+        angulo = np.radians(heading[frame])
+        marca.set_data([x[frame], x[frame] + tamano * np.cos(angulo)], [y[frame], y[frame] + tamano * np.sin(angulo)])
+        fig.savefig(frame_path(out_dir, frame))
+    plt.close(fig)
+    return len(x)
+
+def main_animacion(argv):
+    """Modo animación: python LongituCirculoTramo.py animar radio tramo [--frames N] [--exportar carpeta]."""
+    parser = argparse.ArgumentParser(description="Animación de la rotación de un círculo en un tramo")
+    parser.add_argument('radio', type=float)
+    parser.add_argument('tramo', type=float)
+    parser.add_argument('--direccion', choices=('izquierda', 'derecha'), default='izquierda')
+    parser.add_argument('--frames', type=int, default=300, help="Frames de la animación (0: uno por paso)")
+    parser.add_argument('--cada', type=int, default=1, help="Frames entre actualizaciones de la pantalla")
+    parser.add_argument('--pausa', type=float, default=0.0, help="Segundos entre actualizaciones")
+    parser.add_argument('--exportar', help="Carpeta donde guardar los frames en PNG en lugar de mostrarlos")
+    args = parser.parse_args(argv)
+
+    frames = args.frames or None
+    if args.exportar:
+        written = exportar_rotacion(args.radio, args.tramo, args.exportar, args.direccion, frames)
+        print(f"{written} frames guardados en {args.exportar}")
+    else:
+        animar_rotacion(args.radio, args.tramo, args.direccion, frames, args.cada, args.pausa)
+
+def main_lotes(argv):
+    """Modo por lotes: python LongituCirculoTramo.py entrada.(csv|npy) salida.(csv|npy)."""
+    parser = argparse.ArgumentParser(description="Rotaciones y velocidades de un archivo de telemetría de ruedas")
+    parser.add_argument('input', help="CSV (radio,tramo,tiempo) o .npy (n, 3) o estructurado")
+    parser.add_argument('output', help="Salida .csv o .npy (rotaciones, velocidad_lineal, velocidad_angular)")
+    parser.add_argument('--chunk', type=int, default=1_000_000, help="Filas por bloque")
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    rows = procesar_archivo(args.input, args.output, args.chunk)
+    elapsed = time.perf_counter() - start_time
+    print(f"{rows} filas en {elapsed:.2f} s ({rows / max(elapsed, 1e-9) / 1e6:.1f} millones de filas/s)")
+
 def main():
     """Función principal del programa."""
 
+    # Con argumentos se anima directamente o se procesan archivos por lotes en lugar de preguntar
+    if len(sys.argv) > 1 and sys.argv[1] == 'animar':
+        main_animacion(sys.argv[2:])
+        return
+    if len(sys.argv) > 1:
+        main_lotes(sys.argv[1:])
+        return
+
     print("=== Simulación de rotación de círculo ===")
     radio = float(input("Radio del círculo (metros): "))
     tramo = float(input("Longitud del tramo (metros, predeterminado = 1): ") or 1)
@@ -0,0 +1,368 @@
+import numpy as np
+
+from .MotorSimulacion import partition
+
+# Niveles del árbol: 2**MAX_DEPTH celdas por lado en el nivel más fino
+MAX_DEPTH = 16
+
+def _spread_bits(v):
+    """Intercala ceros entre los bits de enteros de 16 bits (para códigos de Morton)."""
+    v = v.astype(np.uint64)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x00FF00FF)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x0F0F0F0F)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x33333333)
+    v = (v | (v << np.uint64(1))) & np.uint64(0x55555555)
+    return v
+
+class QuadTree:
+    """
+    Quadtree de Barnes–Hut construido nivel a nivel con códigos de Morton.
+
+    Los cuerpos se ordenan por código de Morton; los nodos de cada nivel son
+    los tramos de cuerpos que comparten prefijo, así que la masa y el centro
+    de masas de todos los nodos de un nivel salen de una sola suma por
+    tramos (np.add.reduceat), sin recorrer el árbol en Python.
+
+    Args:
+        x, y (np.ndarray): Posiciones de los cuerpos.
+        mass (np.ndarray): Masas de los cuerpos.
+        max_depth (int): Profundidad máxima del árbol (<= 16).
+    """
+
+    def __init__(self, x, y, mass, max_depth=MAX_DEPTH):
+        self.max_depth = max_depth
+
+        # Cuadrado que contiene todos los cuerpos
+        x0, y0 = x.min(), y.min()
+        self.size = max(x.max() - x0, y.max() - y0) * (1 + 1e-9) + 1e-12
+        cells = 1 << max_depth
+        ix = np.minimum(((x - x0) / self.size * cells).astype(np.int64), cells - 1)
+        iy = np.minimum(((y - y0) / self.size * cells).astype(np.int64), cells - 1)
+        code = _spread_bits(ix) | (_spread_bits(iy) << np.uint64(1))
+
+        order = np.argsort(code, kind='stable')
+        code = code[order]
+        m = mass[order]
+        mx = m * x[order]
+        my = m * y[order]
+
+        # Nodos por nivel: claves ordenadas, primer cuerpo, número de cuerpos, masa y centro de masas
+        # y radio: distancia del centro de masas a la esquina más lejana de la caja de sus cuerpos
+        self.order = order
+        self.sorted_x, self.sorted_y, self.sorted_mass = x[order], y[order], m
+        sx, sy = self.sorted_x, self.sorted_y
+
+        # Se construye de abajo arriba: cada nivel suma los nodos del nivel
+        # siguiente, no los cuerpos, y los hijos de un nodo son el tramo de
+        # nodos del nivel siguiente que comparten su clave
+        levels = [None] * (max_depth + 1)
+        children = [None] * max_depth
+        start = np.flatnonzero(np.r_[True, code[1:] != code[:-1]])
+        key = code[start]
+        sums = np.add.reduceat(np.stack((m, mx, my)), start, axis=1)
+        lows = np.minimum.reduceat(np.stack((sx, sy)), start, axis=1)
+        highs = np.maximum.reduceat(np.stack((sx, sy)), start, axis=1)
+        for level in range(max_depth, -1, -1):
+            if level < max_depth:
+                parent = key >> np.uint64(2)
+                first = np.flatnonzero(np.r_[True, parent[1:] != parent[:-1]])
+                children[level] = (first, np.r_[first[1:], len(parent)])
+                key, start = parent[first], start[first]
+                if len(first) < len(parent):
+                    sums = np.add.reduceat(sums, first, axis=1)
+                    lows = np.minimum.reduceat(lows, first, axis=1)
+                    highs = np.maximum.reduceat(highs, first, axis=1)
+            com = sums[1:] / sums[0]
+            half = np.maximum(highs - com, com - lows)
+            levels[level] = (key, start, np.diff(np.r_[start, len(code)]), sums[0], com[0], com[1],
+                             np.sqrt(half[0] * half[0] + half[1] * half[1]))
+        self.keys, self.start, self.count, self.mass, self.com_x, self.com_y, self.radius = map(list, zip(*levels))
+        self.child_start, self.child_end = map(list, zip(*children)) if max_depth else ([], [])
+
+    def _groups(self, group_size):
+        """
+        Agrupa los cuerpos ordenados en tramos contiguos de como mucho `group_size`.
+
+        Cada grupo es el nodo más alto del árbol con <= group_size cuerpos, así
+        que los grupos se adaptan a la densidad (pequeños en el bulbo).
+        """
+        n = len(self.order)
+        level_of_body = np.full(n, self.max_depth)
+        assigned = np.zeros(n, dtype=bool)
+        for level in range(self.max_depth + 1):
+            count = np.repeat(self.count[level], self.count[level])
+            new = ~assigned & (count <= group_size)
+            level_of_body[new] = level
+            assigned |= new
+
+        # Un grupo nuevo empieza donde cambia el nivel o el nodo del cuerpo
+        boundary = np.zeros(n, dtype=bool)
+        boundary[0] = True
+        boundary[1:] = level_of_body[1:] != level_of_body[:-1]
+        for level in range(1, self.max_depth + 1):
+            at_level = level_of_body == level
+            boundary[self.start[level][1:]] |= at_level[self.start[level][1:]]
+        return np.flatnonzero(boundary)
+
+    def accelerations(self, theta=0.5, softening=0.05, G=1.0, group_size=32, leaf_size=1, group_weight=2.0,
+                      body_factor=0.6, dtype=np.float64, part=0, num_parts=1, out=None):
+        """
+        Aceleración gravitatoria sobre todos los cuerpos con el criterio de apertura `theta`.
+
+        El árbol se recorre por niveles con una frontera de pares (grupo, nodo)
+        en lugar de (cuerpo, nodo). Con los radios reales de los cuerpos de
+        cada uno alrededor de su centro y d la distancia entre centros:
+
+        - radio_nodo + group_weight · radio_grupo < theta · d: el nodo se acepta
+          para todo el grupo y su efecto se desarrolla a primer orden
+          (aceleración y tensor de marea en el centro del grupo). El error de
+          ese desarrollo crece con (radio_grupo / d)² con un coeficiente mayor
+          que el del monopolo, de ahí el peso del radio del grupo.
+        - Si no, con body_theta = body_factor · theta,
+          radio_nodo < body_theta · (d - radio_grupo): el monopolo del nodo se
+          suma sobre cada cuerpo del grupo sin abrirlo más.
+        - Los nodos cercanos con como mucho `leaf_size` cuerpos se suman cuerpo a cuerpo.
+        - El resto se abre.
+
+        Con theta = 0.7, en un disco uniforme de 3000 cuerpos el error del
+        percentil 99 frente a la suma directa es de un 5-6% de la fuerza
+        mediana (tests/test_barnes_hut.py).
+
+        Cada grupo se calcula por separado, así que varios procesos pueden
+        repartirse los grupos con `part` y `num_parts` sobre el mismo árbol:
+        el resultado de cada cuerpo no depende del reparto.
+
+        Args:
+            dtype: Tipo de la suma directa del campo cercano; con float32 es
+                casi el doble de rápida, con un error relativo del orden de 1e-6.
+            part, num_parts (int): Calcular sólo los grupos de la parte `part`
+                de `num_parts`, en tramos de cuerpos ordenados de tamaño parecido.
+            out (tuple | None): Arrays (ax, ay) donde escribir; con varias partes
+                sólo se escriben los cuerpos de la parte.
+
+        Returns:
+            tuple: (ax, ay) en el orden original de los cuerpos.
+        """
+        x, y = self.sorted_x, self.sorted_y
+        n = len(x)
+        eps2 = softening * softening
+
+        # Grupos: tramo [g_start, g_start + g_count) de cuerpos ordenados
+        g_start = self._groups(group_size)
+        g_count = np.diff(np.r_[g_start, n])
+        num_groups = len(g_start)
+        group_of_body = np.repeat(np.arange(num_groups), g_count)
+        g_cx = np.add.reduceat(x, g_start) / g_count
+        g_cy = np.add.reduceat(y, g_start) / g_count
+        g_radius = np.sqrt(np.maximum.reduceat((x - g_cx[group_of_body]) ** 2 + (y - g_cy[group_of_body]) ** 2, g_start))
+        g_reach = group_weight * g_radius
+        body_theta = body_factor * theta
+
+        # Grupos de esta parte y su tramo de cuerpos [lo, hi)
+        bodies = partition(n, part, num_parts)
+        first, last = np.searchsorted(g_start, (bodies.start, bodies.stop))
+        lo, hi = (g_start[first], g_start[last] if last < num_groups else n) if first < last else (0, 0)
+        result_x, result_y = out if out is not None else (np.zeros(n), np.zeros(n))
+        if lo == hi:
+            return result_x, result_y
+
+        # Desarrollo en el centro de cada grupo: aceleración y tensor de marea (xx, xy, yy)
+        far = np.zeros((5, num_groups))
+        near_group, near_x, near_y, near_mass = [], [], [], []
+
+        group = np.arange(first, last)
+        node = np.zeros(len(group), dtype=np.intp)
+        for level in range(self.max_depth + 1):
+            if len(group) == 0:
+                break
+            com_x, com_y = self.com_x[level][node], self.com_y[level][node]
+            dx = com_x - g_cx[group]
+            dy = com_y - g_cy[group]
+            d2 = dx * dx + dy * dy
+            radius = self.radius[level][node]
+            limit = theta * theta * d2
+
+            # Monopolo válido para cada cuerpo del grupo (radio_nodo < body_theta · (d - radio_grupo));
+            # para todo el grupo además hace falta que el desarrollo de marea lo sea
+            reach = radius + body_theta * g_radius[group]
+            monopole = reach * reach < body_theta * body_theta * d2
+            reach = radius + g_reach[group]
+            accept = monopole & (reach * reach < limit)
+            near = ~accept & (monopole | (self.count[level][node] <= leaf_size) | (level == self.max_depth))
+            # Las selecciones van por índices (take): indexar con máscaras es varias veces más lento
+            opened = np.flatnonzero(~accept & ~near)
+            accept = np.flatnonzero(accept)
+            near = np.flatnonzero(near)
+
+            # Campo lejano: aceleración de Plummer y su gradiente en el centro del grupo
+            g, fx, fy = group.take(accept), dx.take(accept), dy.take(accept)
+            s2 = d2.take(accept) + eps2
+            inv_s3 = G * self.mass[level].take(node.take(accept)) / (s2 * np.sqrt(s2))
+            inv_s5 = 3 * inv_s3 / s2
+            for row, weights in enumerate((fx * inv_s3, fy * inv_s3,
+                                           fx * fx * inv_s5 - inv_s3, fx * fy * inv_s5, fy * fy * inv_s5 - inv_s3)):
+                far[row] += np.bincount(g, weights=weights, minlength=num_groups)
+
+            # Campo cercano: el monopolo del nodo (o el propio cuerpo) sobre cada cuerpo del grupo;
+            # se suma al final con los pares de todos los niveles
+            near_group.append(group.take(near))
+            near_x.append(com_x.take(near))
+            near_y.append(com_y.take(near))
+            near_mass.append(self.mass[level].take(node.take(near)))
+            if level == self.max_depth:
+                break
+
+            # Abrir el resto: cada par se reemplaza por sus hijos
+            open_node = node.take(opened)
+            start = self.child_start[level][open_node]
+            counts = self.child_end[level][open_node] - start
+            group = np.repeat(group.take(opened), counts)
+            node = np.repeat(start, counts) + (np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts))
+
+        ax, ay = self._direct(np.concatenate(near_group), np.concatenate(near_x), np.concatenate(near_y),
+                              np.concatenate(near_mass), g_start, g_count, G, eps2, lo, hi, dtype)
+
+        # Evaluar el desarrollo en la posición de cada cuerpo
+        group_of_body = group_of_body[lo:hi]
+        rx = x[lo:hi] - g_cx[group_of_body]
+        ry = y[lo:hi] - g_cy[group_of_body]
+        ax += far[0][group_of_body] + far[2][group_of_body] * rx + far[3][group_of_body] * ry
+        ay += far[1][group_of_body] + far[3][group_of_body] * rx + far[4][group_of_body] * ry
+
+        # Volver al orden original
+        result_x[self.order[lo:hi]] = ax
+        result_y[self.order[lo:hi]] = ay
+        return result_x, result_y
+
+    def _direct(self, group, px, py, pm, g_start, g_count, G, eps2, lo, hi, dtype):
+        """
+        Suma directa de masas puntuales (px, py, pm) sobre cada cuerpo de su grupo.
+
+        Devuelve la aceleración de los cuerpos ordenados [lo, hi). Se recorren
+        las posiciones dentro del grupo (como mucho group_size). Con los pares
+        ordenados de grupo más grande a más pequeño, los que llegan a cada
+        posición son un prefijo: cada vuelta es un solo cálculo vectorizado
+        sobre vistas, sin expandir los pares cuerpo a cuerpo. Los pares de un
+        mismo grupo quedan seguidos y cada vuelta los suma por tramos.
+        """
+        x, y = self.sorted_x.astype(dtype, copy=False), self.sorted_y.astype(dtype, copy=False)
+        ax = np.zeros(hi - lo)
+        ay = np.zeros(hi - lo)
+        size = g_count[group]
+        order = np.lexsort((group, -size))
+        group, size = group[order], size[order]
+        px, py = px[order].astype(dtype), py[order].astype(dtype)
+        pm = (G * pm[order]).astype(dtype)
+        eps2 = dtype(eps2)
+
+        # Tramo de pares de cada grupo, su primer cuerpo y el primer cuerpo del grupo de cada par
+        segment = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+        segment_body = g_start[group[segment]] - lo
+        pair_body = g_start[group]
+        # reached[a]: pares cuyo grupo tiene más de `a` cuerpos; segments[a]: sus tramos
+        reached = np.searchsorted(-size, -np.arange(size.max(initial=0)), side='left')
+        segments = np.searchsorted(segment, reached)
+        for a, (stop, k) in enumerate(zip(reached, segments)):
+            i = pair_body[:stop] + a
+
+            # El propio cuerpo aporta dx = dy = 0
+            dx = px[:stop] - x[i]
+            dy = py[:stop] - y[i]
+            s2 = dx * dx
+            s2 += dy * dy
+            s2 += eps2
+            weight = pm[:stop] / (s2 * np.sqrt(s2))
+            dx *= weight
+            dy *= weight
+            body = segment_body[:k] + a
+            ax[body] += np.add.reduceat(dx, segment[:k])
+            ay[body] += np.add.reduceat(dy, segment[:k])
+        return ax, ay
+
+class NBodySimulation:
+    """
+    Integrador leapfrog (kick-drift-kick) con fuerzas de Barnes–Hut.
+
+    Las posiciones, velocidades y aceleraciones son arrays sueltos para que
+    MotorSimulacion pueda ponerlos en memoria compartida y repartir cada paso
+    entre procesos (`step_partition`).
+
+    Args:
+        x, y (np.ndarray): Posiciones iniciales.
+        vx, vy (np.ndarray): Velocidades iniciales.
+        mass (np.ndarray): Masas.
+        theta (float): Ángulo de apertura; más grande es más rápido y menos preciso.
+        softening (float): Suavizado para evitar fuerzas infinitas en encuentros cercanos.
+        G (float): Constante gravitatoria en las unidades de la simulación.
+    """
+
+    # Tipo de la suma directa del campo cercano: el error de float32 (~1e-6)
+    # queda muy por debajo del de Barnes–Hut y la suma va casi el doble de rápida
+    near_dtype = np.float32
+
+    def __init__(self, x, y, vx, vy, mass, theta=0.5, softening=0.05, G=1.0):
+        self.x, self.y = np.array(x, dtype=float), np.array(y, dtype=float)
+        self.vx, self.vy = np.array(vx, dtype=float), np.array(vy, dtype=float)
+        self.mass = np.asarray(mass, dtype=float)
+        self.theta = theta
+        self.softening = softening
+        self.G = G
+        self.offsets = np.column_stack((self.x, self.y))
+        self.ax, self.ay = np.zeros(len(self.x)), np.zeros(len(self.x))
+        self._accelerations()
+
+    def _accelerations(self, part=0, num_parts=1):
+        tree = QuadTree(self.x, self.y, self.mass)
+        tree.accelerations(self.theta, self.softening, self.G, dtype=self.near_dtype,
+                           part=part, num_parts=num_parts, out=(self.ax, self.ay))
+
+    def step(self, dt):
+        """Avanza un paso de tiempo y devuelve las posiciones (N, 2)."""
+        return self.step_partition(dt)
+
+    def step_partition(self, dt, part=0, num_parts=1, barrier=None):
+        """
+        Avanza un paso sólo para la parte `part` de `num_parts`.
+
+        Cada parte mueve su tramo de cuerpos y calcula las fuerzas de sus
+        grupos del árbol, que cada proceso construye entero a partir de las
+        posiciones compartidas. `barrier` (uno por parte) separa la deriva del
+        cálculo de fuerzas y éste del último medio impulso.
+
+        Returns:
+            np.ndarray: Posiciones (N, 2); sólo el tramo de la parte está al día.
+        """
+        index = partition(len(self.x), part, num_parts)
+
+        # Medio impulso, deriva completa, fuerzas nuevas y otro medio impulso
+        self.vx[index] += 0.5 * dt * self.ax[index]
+        self.vy[index] += 0.5 * dt * self.ay[index]
+        self.x[index] += dt * self.vx[index]
+        self.y[index] += dt * self.vy[index]
+        if barrier is not None:
+            barrier.wait()
+        self._accelerations(part, num_parts)
+        if barrier is not None:
+            barrier.wait()
+        self.vx[index] += 0.5 * dt * self.ax[index]
+        self.vy[index] += 0.5 * dt * self.ay[index]
+
+        self.offsets[index, 0] = self.x[index]
+        self.offsets[index, 1] = self.y[index]
+        return self.offsets
+
+def circular_velocities(r, theta, mass, softening=0.05, G=1.0):
+    """
+    Velocidades de órbitas circulares para discos dados en coordenadas polares.
+
+    Usa la masa encerrada dentro de cada radio (aproximación de simetría
+    circular), de modo que el disco empieza cerca del equilibrio.
+
+    Returns:
+        tuple: (vx, vy) de cada cuerpo.
+    """
+    order = np.argsort(r)
+    enclosed = np.empty_like(r, dtype=float)
+    enclosed[order] = np.cumsum(mass[order])
+    speed = np.sqrt(G * enclosed * r * r / (r * r + softening * softening) ** 1.5)
+    return -speed * np.sin(theta), speed * np.cos(theta)
@@ -0,0 +1,253 @@
+import itertools
+import multiprocessing as mp
+import operator
+import time
+import sys
+
+def _formato_tiempo(segundos):
+    minutos, segundos = divmod(int(segundos), 60)
+    horas, minutos = divmod(minutos, 60)
+    return f"{horas}:{minutos:02d}:{segundos:02d}" if horas else f"{minutos:02d}:{segundos:02d}"
+
+def _formato_cantidad(valor):
+    for unidad in ('', 'k', 'M', 'G'):
+        if abs(valor) < 1000:
+            return f"{valor:.1f}{unidad}"
+        valor /= 1000
+    return f"{valor:.1f}T"
+
+class BarraProgreso:
+    """
+    Barra de carga para trabajo real: envuelve iterables o se avanza a mano.
+
+    Sólo se redibuja cada `intervalo` segundos, y el reloj no se consulta en
+    cada elemento: el número de elementos entre consultas se ajusta a la
+    velocidad medida para que haya unas pocas por intervalo. Al envolver un
+    iterable, los elementos hasta la próxima consulta se entregan como un
+    bloque con itertools.chain, así que no hay código de Python por
+    elemento; si la fuente sabe cuántos elementos le quedan, el bloque ni
+    siquiera se copia.
+
+    La velocidad se suaviza con una media móvil exponencial (`suavizado` es
+    el peso de la medida nueva) y de ella sale el tiempo restante.
+
+    Args:
+        iterable: Iterable o generador a envolver (opcional).
+        total (int | None): Número de elementos; por defecto, len(iterable) si existe.
+        descripcion (str): Texto delante de la barra.
+        longitud_barra (int): Caracteres de la barra.
+        intervalo (float): Segundos mínimos entre redibujados.
+        suavizado (float): Peso de la última medida en la velocidad (0-1).
+        unidad (str): Nombre de los elementos en la velocidad.
+        stream: Salida de la barra (por defecto, sys.stderr).
+    """
+
+    def __init__(self, iterable=None, total=None, descripcion='', longitud_barra=50, intervalo=0.1,
+                 suavizado=0.3, unidad='it', stream=None):
+        if total is None and iterable is not None and hasattr(iterable, '__len__'):
+            total = len(iterable)
+        self.iterable = iterable
+        self.total = total
+        self.descripcion = descripcion
+        self.longitud_barra = longitud_barra
+        self.intervalo = intervalo
+        self.suavizado = suavizado
+        self.unidad = unidad
+        self.stream = stream or sys.stderr
+
+        self.n = 0
+        self.velocidad = None
+        self.inicio = self._ultimo_tiempo = time.perf_counter()
+        self._ultimo_n = 0
+        self._paso = 1
+        self._siguiente = 1
+        self._cerrada = False
+        self._dibujar(self.inicio)
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._bloques())
+
+    def _bloques(self):
+        # Los elementos se entregan por bloques hasta la próxima consulta del reloj:
+        # chain recorre cada bloque en C, sin código de Python por elemento. El
+        # avance se cuenta al pedir el bloque siguiente, cuando el anterior ya se procesó.
+        fuente = iter(self.iterable)
+        try:
+            # Un range se trocea en ranges, que no copian nada ni añaden un islice por elemento
+            if isinstance(self.iterable, range):
+                hecho = 0
+                while hecho < len(self.iterable):
+                    bloque = self.iterable[hecho:hecho + max(1, self._siguiente - self.n)]
+                    yield bloque
+                    hecho += len(bloque)
+                    self.avanzar(len(bloque))
+                return
+
+            # Iteradores que saben cuánto les queda (listas, tuplas, rangos...): el bloque es
+            # un islice sobre la fuente, sin copiarlo, y se cuenta con lo que quedaba antes y después
+            if hasattr(fuente, '__length_hint__'):
+                restantes = operator.length_hint(fuente)
+                while restantes > 0:
+                    yield itertools.islice(fuente, max(1, self._siguiente - self.n))
+                    quedan = operator.length_hint(fuente)
+                    self.avanzar(restantes - quedan)
+                    restantes = quedan
+
+            # Generadores y lo que quede: la única forma de contar el bloque sin código por
+            # elemento es copiarlo, que cuesta poco al lado de producir los elementos en Python
+            while True:
+                bloque = list(itertools.islice(fuente, max(1, self._siguiente - self.n)))
+                if not bloque:
+                    return
+                yield bloque
+                self.avanzar(len(bloque))
+        finally:
+            self.cerrar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def avanzar(self, cantidad=1):
+        """Suma `cantidad` elementos completados."""
+        self.n += cantidad
+        if self.n >= self._siguiente:
+            self._comprobar()
+
+    def actualizar(self, n):
+        """Fija el número de elementos completados (por ejemplo, leído de un contador compartido)."""
+        self.n = n
+        if self.n >= self._siguiente:
+            self._comprobar()
+
+    def seguir(self, contador, terminado, espera=0.05):
+        """
+        Sigue un contador compartido por otros procesos hasta que `terminado()` sea cierto.
+
+        Args:
+            contador: Valor de `contador_compartido`, que los procesos avanzan con AvanceCompartido.
+            terminado (callable): Devuelve True cuando el trabajo ha acabado.
+            espera (float): Segundos entre lecturas del contador.
+        """
+        while not terminado():
+            self.actualizar(contador.value)
+            time.sleep(espera)
+        self.actualizar(contador.value)
+        self.cerrar()
+
+    def _comprobar(self):
+        ahora = time.perf_counter()
+        transcurrido = ahora - self._ultimo_tiempo
+        if transcurrido < self.intervalo:
+            # Todavía no toca redibujar: consultar el reloj con menos frecuencia
+            self._paso = max(1, self._paso * 2) if transcurrido < self.intervalo / 8 else self._paso
+            self._siguiente = self.n + self._paso
+            return
+
+        medida = (self.n - self._ultimo_n) / transcurrido
+        if self.velocidad is None:
+            self.velocidad = medida
+        else:
+            self.velocidad = self.suavizado * medida + (1 - self.suavizado) * self.velocidad
+        self._ultimo_tiempo = ahora
+        self._ultimo_n = self.n
+
+        # Unas cuatro consultas del reloj por intervalo a la velocidad actual
+        self._paso = max(1, int(self.velocidad * self.intervalo / 4))
+        self._siguiente = self.n + self._paso
+        self._dibujar(ahora)
+
+    def _dibujar(self, ahora):
+        partes = [self.descripcion] if self.descripcion else []
+        if self.total:
+            fraccion = min(self.n / self.total, 1.0)
+            llenos = int(fraccion * self.longitud_barra)
+            partes.append(f"[{'=' * llenos}{' ' * (self.longitud_barra - llenos)}]{fraccion * 100:5.1f}%")
+            partes.append(f"{self.n}/{self.total}")
+        else:
+            partes.append(f"{self.n}")
+        if self.velocidad:
+            partes.append(f"{_formato_cantidad(self.velocidad)} {self.unidad}/s")
+            if self.total:
+                partes.append(f"ETA {_formato_tiempo(max(self.total - self.n, 0) / self.velocidad)}")
+        partes.append(_formato_tiempo(ahora - self.inicio))
+        self.stream.write('\r' + ' '.join(partes))
+        self.stream.flush()
+
+    def cerrar(self):
+        """Dibuja el estado final y termina la línea."""
+        if self._cerrada:
+            return
+        self._cerrada = True
+        ahora = time.perf_counter()
+        if ahora > self.inicio and self.n:
+            self.velocidad = self.n / (ahora - self.inicio)
+        self._dibujar(ahora)
+        self.stream.write('\n')
+        self.stream.flush()
+
+def contador_compartido():
+    """Contador entero en memoria compartida para repartir el progreso entre procesos."""
+    return mp.Value('q', 0)
+
+class AvanceCompartido:
+    """
+    Avance de un proceso trabajador sobre un contador compartido.
+
+    Los incrementos se acumulan localmente y se suman al contador (con su
+    cerrojo) cada `lote` elementos o al cerrar, para no tomar el cerrojo en
+    cada elemento.
+
+    Args:
+        contador: Valor de `contador_compartido`.
+        lote (int): Elementos acumulados antes de publicarlos.
+    """
+
+    def __init__(self, contador, lote=1000):
+        self.contador = contador
+        self.lote = lote
+        self.pendiente = 0
+
+    def avanzar(self, cantidad=1):
+        self.pendiente += cantidad
+        if self.pendiente >= self.lote:
+            self.vaciar()
+
+    def vaciar(self):
+        """Publica los elementos acumulados."""
+        if self.pendiente:
+            with self.contador.get_lock():
+                self.contador.value += self.pendiente
+            self.pendiente = 0
+
+    def envolver(self, iterable):
+        """Recorre `iterable` avanzando el contador compartido."""
+        try:
+            for item in iterable:
+                yield item
+                self.pendiente += 1
+                if self.pendiente >= self.lote:
+                    self.vaciar()
+        finally:
+            self.vaciar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.vaciar()
+
+def barra_de_carga(duracion, longitud_barra=50):
+    """Simula una carga de `duracion` segundos con la barra de progreso."""
+    for _ in BarraProgreso(range(longitud_barra), longitud_barra=longitud_barra, stream=sys.stdout):
+        #Espera un tiempo para simular la carga
+        time.sleep(duracion / longitud_barra)
+
+if __name__ == "__main__":
+    #Durasion de carga de barra (segundos)
+    duracion_total = 50 # se puede ajustar
+
+    #llamar la funcion
+    barra_de_carga(duracion_total)
@@ -0,0 +1,155 @@
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .BarraCarga import BarraProgreso
+
+# Parámetros de GalaxiaGM.create_galaxy que se pueden barrer
+PARAMETERS = ('arm_tightness', 'arm_spread', 'num_arms', 'inner_radius_factor')
+
+# Área dibujada en cada miniatura (la misma para todas, para poder compararlas)
+EXTENT = (-10.5, 10.5, -10.5, 10.5)
+
+def parameter_grid(**values):
+    """
+    Todas las combinaciones de los valores dados, en orden de producto cartesiano.
+
+    Example:
+        parameter_grid(num_arms=[2, 3], arm_spread=[0.1, 0.2]) -> 4 diccionarios
+    """
+    unknown = set(values) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(f"Parámetros desconocidos: {', '.join(sorted(unknown))} (opciones: {', '.join(PARAMETERS)})")
+    names = list(values)
+    return [dict(zip(names, combo)) for combo in itertools.product(*(values[name] for name in names))]
+
+def variant_key(params, options):
+    """Hash estable de una variante: parámetros de la galaxia y opciones de render."""
+    payload = json.dumps({'params': params, 'options': options}, sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+def render_variant(params, options, path):
+    """
+    Genera una variante y guarda su miniatura en `path`.
+
+    Se escribe en un archivo temporal y se renombra al final, así que una
+    miniatura a medias nunca se toma por una ya calculada.
+    """
+    from .GalaxiaGM import create_galaxy
+    from .RasterGalaxia import rasterize, save_image
+
+    x_inner, y_inner, x_outer, y_outer = create_galaxy(options['num_stars_inner'], options['num_stars_outer'],
+                                                       seed=options['seed'], **params)
+    image = rasterize([(x_inner, y_inner, 'gold', 0.6), (x_outer, y_outer, 'cyan', 0.4)],
+                      width=options['size'], height=options['size'], extent=EXTENT, gain='auto')
+    tmp_path = path + '.tmp.png'
+    save_image(tmp_path, image)
+    os.replace(tmp_path, path)
+    return path
+
+def contact_sheet(paths, columns, size, padding=2):
+    """
+    Une miniaturas cuadradas de `size` píxeles en una sola imagen RGB.
+
+    Las celdas van por filas, en el orden de `paths`, separadas por `padding` píxeles negros.
+    """
+    import matplotlib.image as mpimg
+
+    rows = -(-len(paths) // columns)
+    cell = size + padding
+    sheet = np.zeros((rows * cell + padding, columns * cell + padding, 3), dtype=np.float32)
+    for i, path in enumerate(paths):
+        row, col = divmod(i, columns)
+        top, left = padding + row * cell, padding + col * cell
+        sheet[top:top + size, left:left + size] = mpimg.imread(path)[..., :3]
+    return sheet
+
+def sweep(grid, out_dir, workers=None, num_stars_inner=5000, num_stars_outer=15000, size=128, seed=0,
+          columns=None):
+    """
+    Renderiza cada variante de `grid` en un pool de procesos y compone la hoja de contactos.
+
+    Las miniaturas se guardan en out_dir/variantes/<hash>.png, con el hash de
+    los parámetros y las opciones de render; las que ya existen no se
+    recalculan, así que ampliar la rejilla sólo calcula las celdas nuevas.
+
+    Args:
+        grid (list): Diccionarios de parámetros (ver `parameter_grid`).
+        out_dir (str): Carpeta de salida.
+        workers (int | None): Procesos del pool; por defecto, uno por núcleo.
+        num_stars_inner, num_stars_outer (int): Estrellas de cada variante.
+        size (int): Lado de las miniaturas en píxeles.
+        seed (int): Semilla común a todas las variantes.
+        columns (int | None): Columnas de la hoja; por defecto, casi cuadrada.
+
+    Returns:
+        dict: computed (variantes calculadas), cached (reutilizadas), seconds y las
+        rutas de la hoja (sheet) y del índice (index).
+    """
+    options = {'num_stars_inner': num_stars_inner, 'num_stars_outer': num_stars_outer, 'size': size, 'seed': seed}
+    cache_dir = os.path.join(out_dir, 'variantes')
+    os.makedirs(cache_dir, exist_ok=True)
+
+    entries = []
+    for params in grid:
+        key = variant_key(params, options)
+        entries.append({'key': key, 'params': params, 'path': os.path.join(cache_dir, f'{key}.png')})
+    missing = {entry['key']: entry for entry in entries if not os.path.exists(entry['path'])}
+
+    start_time = time.perf_counter()
+    if missing:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool, \
+                BarraProgreso(total=len(missing), unidad='variantes') as barra:
+            futures = [pool.submit(render_variant, entry['params'], options, entry['path'])
+                       for entry in missing.values()]
+            for future in as_completed(futures):
+                future.result()
+                barra.avanzar()
+
+    # Hoja de contactos e índice con la posición de cada variante
+    from .RasterGalaxia import save_image
+
+    columns = columns or max(1, int(np.ceil(np.sqrt(len(entries)))))
+    sheet_path = os.path.join(out_dir, 'hoja_contactos.png')
+    if entries:
+        save_image(sheet_path, contact_sheet([entry['path'] for entry in entries], columns, size))
+    index_path = os.path.join(out_dir, 'indice.json')
+    with open(index_path, 'w') as f:
+        json.dump({'options': options, 'columns': columns,
+                   'variants': [{'row': i // columns, 'col': i % columns, 'key': entry['key'], 'params': entry['params']}
+                                for i, entry in enumerate(entries)]}, f, indent=2)
+
+    return {'computed': len(missing), 'cached': len(entries) - len(missing),
+            'seconds': time.perf_counter() - start_time, 'sheet': sheet_path, 'index': index_path}
+
+def main(argv=None):
+    """Barre parámetros de GalaxiaGM.create_galaxy y guarda una hoja de contactos."""
+    parser = argparse.ArgumentParser(description="Barrido de parámetros de GalaxiaGM con miniaturas en paralelo")
+    parser.add_argument('out', help="Carpeta de salida (miniaturas, hoja de contactos e índice)")
+    parser.add_argument('--arm-tightness', type=float, nargs='+', default=[1.5])
+    parser.add_argument('--arm-spread', type=float, nargs='+', default=[0.1])
+    parser.add_argument('--num-arms', type=int, nargs='+', default=[2])
+    parser.add_argument('--inner-radius-factor', type=float, nargs='+', default=[0.2])
+    parser.add_argument('--inner', type=int, default=5000, help="Estrellas del bulbo por variante")
+    parser.add_argument('--outer', type=int, default=15000, help="Estrellas de los brazos por variante")
+    parser.add_argument('--size', type=int, default=128, help="Lado de cada miniatura en píxeles")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--columns', type=int, default=None)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    grid = parameter_grid(arm_tightness=args.arm_tightness, arm_spread=args.arm_spread,
+                          num_arms=args.num_arms, inner_radius_factor=args.inner_radius_factor)
+    result = sweep(grid, args.out, args.workers, args.inner, args.outer, args.size, args.seed, args.columns)
+    print(f"{result['computed']} variantes calculadas y {result['cached']} reutilizadas "
+          f"en {result['seconds']:.1f} s")
+    print(f"Hoja de contactos: {result['sheet']}")
+
+if __name__ == "__main__":
+    main()
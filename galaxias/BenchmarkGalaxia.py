@@ -0,0 +1,207 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+# Número de estrellas por defecto: de 10^3 a 10^7
+DEFAULT_SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+
+def _create_galaxy(n):
+    from .GalaxiaGM import create_galaxy
+    return lambda: create_galaxy(num_stars_inner=n // 4, num_stars_outer=n - n // 4, seed=0)
+
+def _generar_bulbo(n):
+    from .GalaxiaGPT import generar_bulbo
+    return lambda: generar_bulbo(n, radio_bulbo=2, seed=0)
+
+def _generar_brazos(n):
+    from .GalaxiaGPT import generar_brazos
+    return lambda: generar_brazos(n, 3, rotacion=2.5, dispersión=0.8, radio_max=12, seed=0)
+
+def _temperature_to_rgb(n):
+    from .ColorEstelar import temperature_to_rgb
+    temperatures = np.random.default_rng(0).uniform(3000, 30000, n)
+    return lambda: temperature_to_rgb(temperatures)
+
+def _distance_to_color(n):
+    from .EscenaNebulosa import distance_to_color
+    distances = np.random.default_rng(0).uniform(0, 30, n)
+    return lambda: distance_to_color(distances)
+
+def _step_nebulosa(n):
+    # Sólo la física y los colores de un frame, sin dibujo, con el gas de la escena por defecto
+    from .EscenaNebulosa import NebulaScene
+    scene = NebulaScene(n, 2000, seed=42)
+
+    def frame():
+        scene.step(0.02)
+        scene.update_colors(0.5)
+    return frame
+
+def _step_nbody(n):
+    # Un paso de gravedad real (Barnes–Hut) en un solo proceso
+    from .EscenaGalaxia import GalaxyScene
+    scene = GalaxyScene(n, seed=42)
+    scene.enable_nbody()
+    return lambda: scene.step(0.01)
+
+def _update(scene):
+    """Un frame de `update` de la animación: física, artistas y dibujo del canvas."""
+    def setup(n):
+        from .RenderHeadless import _BUILDERS
+
+        # La nebulosa crece entera con n: el gas guarda la proporción de la escena por defecto (2000 por 3000 estrellas)
+        options = {'num_stars': n, 'num_nebula_particles': max(1, 2 * n // 3), 'seed': 42, 'snapshot': None,
+                   'speed': 0.02, 'dpi': 100, 'filter': 'Visible', 'color_balance': 0.5, 'boost': False, 'push': None}
+        fig, advance, draw = _BUILDERS[scene](options)
+
+        def frame():
+            advance(1)
+            draw()
+            fig.canvas.draw()
+        return frame
+    return setup
+
+# Caso -> (función que prepara los datos y devuelve la operación a medir, máximo de estrellas por defecto)
+# Dibujar con matplotlib no escala a 10^7 puntos en tiempo razonable: esos casos
+# se limitan salvo que se pida --no-limit.
+CASES = {
+    'create_galaxy': (_create_galaxy, None),
+    'generar_bulbo': (_generar_bulbo, None),
+    'generar_brazos': (_generar_brazos, None),
+    'temperature_to_rgb': (_temperature_to_rgb, None),
+    'distance_to_color': (_distance_to_color, None),
+    'step_nebulosa': (_step_nebulosa, 10**6),
+    'step_nbody': (_step_nbody, 10**5),
+    'update_galaxia': (_update('galaxia'), 10**6),
+    'update_nebulosa': (_update('nebulosa'), 10**6),
+}
+
+def measure(operation, repeat=5, min_time=0.2):
+    """
+    Mide una operación: mediana de tiempo de pared y pico de memoria.
+
+    El pico se mide en una ejecución aparte con tracemalloc (NumPy le informa
+    de sus reservas), para que su coste no entre en los tiempos.
+
+    Returns:
+        dict: seconds (mediana), runs, peak_mb y fps (1 / seconds).
+    """
+    operation()  # calentamiento: importaciones, cachés de color, primer dibujo
+
+    times = []
+    start = time.perf_counter()
+    while len(times) < repeat or (time.perf_counter() - start < min_time and len(times) < 1000):
+        t0 = time.perf_counter()
+        operation()
+        times.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    try:
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    seconds = statistics.median(times)
+    return {'seconds': seconds, 'runs': len(times), 'peak_mb': peak / 2**20, 'fps': 1 / seconds if seconds else None}
+
+def run(cases=None, sizes=DEFAULT_SIZES, repeat=5, limits=True):
+    """
+    Ejecuta los casos pedidos para cada número de estrellas.
+
+    Returns:
+        dict: {'meta': {...}, 'results': [{'case', 'stars', 'seconds', 'runs', 'peak_mb', 'fps'}, ...]}
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    results = []
+    for name in cases or CASES:
+        setup, limit = CASES[name]
+        for n in sizes:
+            if limits and limit is not None and n > limit:
+                print(f"{name:<20} {n:>10,}  omitido (límite {limit:,}; usa --no-limit)")
+                continue
+            result = {'case': name, 'stars': n, **measure(setup(n), repeat)}
+            plt.close('all')
+            results.append(result)
+            print(f"{name:<20} {n:>10,}  {result['seconds'] * 1e3:10.2f} ms  {result['peak_mb']:9.1f} MB"
+                  f"  {result['fps']:9.1f} fps", flush=True)
+
+    meta = {
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+    return {'meta': meta, 'results': results}
+
+def compare(baseline, current, threshold=0.1):
+    """
+    Compara dos resultados de `run` caso a caso.
+
+    Returns:
+        list: (case, stars, time_ratio, memory_ratio, regression) de los casos presentes en ambos.
+    """
+    base = {(r['case'], r['stars']): r for r in baseline['results']}
+    rows = []
+    for result in current['results']:
+        old = base.get((result['case'], result['stars']))
+        if old is None:
+            continue
+        time_ratio = result['seconds'] / old['seconds']
+        memory_ratio = result['peak_mb'] / old['peak_mb'] if old['peak_mb'] else 1.0
+        regression = time_ratio > 1 + threshold or memory_ratio > 1 + threshold
+        rows.append((result['case'], result['stars'], time_ratio, memory_ratio, regression))
+    return rows
+
+def main(argv=None):
+    """Mide las partes críticas de los scripts de galaxias y compara con una línea base."""
+    parser = argparse.ArgumentParser(description="Benchmarks de generación, color y animación de galaxias")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="Ejecuta los benchmarks")
+    run_parser.add_argument('--cases', nargs='+', choices=CASES, default=None)
+    run_parser.add_argument('--sizes', nargs='+', type=lambda s: int(float(s)), default=DEFAULT_SIZES)
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--no-limit', action='store_true', help="Ignora el máximo de estrellas de cada caso")
+    run_parser.add_argument('--out', help="Archivo JSON donde guardar los resultados (línea base)")
+
+    compare_parser = commands.add_parser('compare', help="Compara dos archivos de resultados")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help="Empeoramiento relativo tolerado en tiempo o memoria (0.1 = 10%%)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        report = run(args.cases, args.sizes, args.repeat, limits=not args.no_limit)
+        if args.out:
+            with open(args.out, 'w') as f:
+                json.dump(report, f, indent=2)
+            print(f"Resultados guardados en {args.out}")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    rows = compare(baseline, current, args.threshold)
+    for case, stars, time_ratio, memory_ratio, regression in rows:
+        flag = '  REGRESIÓN' if regression else ''
+        print(f"{case:<20} {stars:>10,}  tiempo x{time_ratio:5.2f}  memoria x{memory_ratio:5.2f}{flag}")
+    if any(row[-1] for row in rows):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
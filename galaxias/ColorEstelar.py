@@ -0,0 +1,100 @@
+import numpy as np
+
+# Rango de temperaturas (Kelvin) que cubren las tablas de color
+T_MIN = 1000
+T_MAX = 40000
+
+# Número de entradas de cada tabla (≈10 K por entrada)
+LUT_SIZE = 4096
+
+FILTERS = ('Visible', 'Infrarrojo', 'Ultravioleta', 'H-Alpha')
+
+# Tablas de color ya calculadas, una por filtro
+_lut_cache = {}
+
+def temperature_to_rgb(temperatures):
+    """
+    Convierte un array de temperaturas en colores RGB de cuerpo negro.
+
+    Args:
+        temperatures (array_like): Temperaturas en Kelvin, de cualquier forma.
+
+    Returns:
+        np.ndarray: Array float32 con forma (..., 3) y valores entre 0 y 1.
+    """
+    temperature = np.clip(np.asarray(temperatures, dtype=np.float32), T_MIN, T_MAX)
+
+    # Normalizar temperatura
+    t = (temperature - T_MIN) / (T_MAX - T_MIN)
+
+    rgb = np.empty(t.shape + (3,), dtype=np.float32)
+    # Rojo para temperaturas bajas
+    rgb[..., 0] = np.where(t > 0.1, 1.0 - 0.8 * (t - 0.1), 1.0)
+    # Verde
+    rgb[..., 1] = 1.0 - 2.0 * np.abs(t - 0.5)
+    # Azul para temperaturas altas
+    rgb[..., 2] = np.where(t < 0.9, 1.0 - 0.8 * (0.9 - t), 1.0)
+
+    return np.clip(rgb, 0, 1, out=rgb)
+
+def _infrared(temperatures):
+    # En infrarrojo, mostramos más las estrellas frías
+    rgb = np.zeros(np.shape(temperatures) + (3,), dtype=np.float32)
+    rgb[..., 0] = np.clip((temperatures - 2000) / 2000, 0, 1)
+    return rgb
+
+def _ultraviolet(temperatures):
+    # En ultravioleta, mostramos más las estrellas calientes
+    rgb = np.zeros(np.shape(temperatures) + (3,), dtype=np.float32)
+    rgb[..., 2] = np.clip((40000 - temperatures) / 38000, 0, 1)
+    return rgb
+
+def _h_alpha(temperatures):
+    # Filtro H-Alpha (emisión de hidrógeno)
+    rgb = np.zeros(np.shape(temperatures) + (3,), dtype=np.float32)
+    rgb[..., 0] = np.clip((temperatures - 5000) / 10000, 0, 1)
+    return rgb
+
+_FILTER_FUNCS = {
+    'Visible': temperature_to_rgb,
+    'Infrarrojo': _infrared,
+    'Ultravioleta': _ultraviolet,
+    'H-Alpha': _h_alpha,
+}
+
+def filter_lut(label='Visible'):
+    """
+    Devuelve la tabla de colores (LUT_SIZE, 3) de un filtro, calculándola una sola vez.
+    """
+    lut = _lut_cache.get(label)
+    if lut is None:
+        if label not in _FILTER_FUNCS:
+            raise ValueError(f"Filtro desconocido: {label!r} (opciones: {', '.join(FILTERS)})")
+        grid = np.linspace(T_MIN, T_MAX, LUT_SIZE, dtype=np.float32)
+        lut = _FILTER_FUNCS[label](grid)
+        lut.setflags(write=False)
+        _lut_cache[label] = lut
+    return lut
+
+def temperature_index(temperatures):
+    """
+    Cuantiza las temperaturas a índices de las tablas de color.
+
+    Los índices se calculan una vez por campo de estrellas; cambiar de filtro
+    es después una sola indexación con `colors_from_index`.
+    """
+    t = np.asarray(temperatures, dtype=np.float32)
+    idx = np.rint((t - T_MIN) * ((LUT_SIZE - 1) / (T_MAX - T_MIN)))
+    return np.clip(idx, 0, LUT_SIZE - 1).astype(np.uint16)
+
+def colors_from_index(index, label='Visible', out=None):
+    """
+    Colores (N, 3) float32 para índices de `temperature_index` con el filtro dado.
+    """
+    return np.take(filter_lut(label), index, axis=0, out=out)
+
+def filter_colors(temperatures, label='Visible', out=None):
+    """
+    Colores (N, 3) float32 de un array de temperaturas con el filtro dado.
+    """
+    return colors_from_index(temperature_index(temperatures), label, out=out)
@@ -0,0 +1,454 @@
+import copy
+from functools import partial
+
+import numpy as np
+
+from .MotorSimulacion import partition
+from .PoolParticulas import Emitter, ParticlePool, PoolColumn
+from .RejillaEspacial import SpatialGrid
+from .SnapshotGalaxia import load_snapshot, save_snapshot
+
+# Empuje estelar por defecto, el mismo en Nebulosa.py, RenderHeadless y EstrellasPygame
+interaction_strength = 10.0
+
+def _new_stars(rng, n, simulation_size):
+    """Campos de `n` estrellas nuevas, con las mismas distribuciones que las iniciales."""
+    return {'r': rng.uniform(0, simulation_size, n), 'theta': rng.uniform(0, 2 * np.pi, n),
+            'speed': rng.uniform(0.5, 1.5, n), 'size': rng.uniform(1, 8, n)}
+
+def _new_gas(rng, n, simulation_size):
+    """Campos de `n` partículas de nebulosa nuevas, en la zona central como las reubicadas."""
+    return {'offsets': rng.uniform(-simulation_size, simulation_size, (n, 2)),
+            'size': rng.uniform(0.1, 3, n), 'alpha': rng.uniform(0.05, 0.3, n)}
+
+# Gradiente de color basados en distancias al centro
+def distance_to_color(distance, simulation_size=15):
+    """Colores (N, 3) iniciales para un array de distancias al centro."""
+    norm_dist = np.asarray(distance) / (simulation_size * 1.5)
+    r = np.clip(0.8 + 0.5 * norm_dist, 0, 1)
+    g = np.clip(0.5 + 0.3 * norm_dist, 0, 1)
+    b = np.clip(1.0 + 0.7 * norm_dist, 0, 1)
+    return np.stack((r, g, b), axis=-1)
+
+# Colores ajustados por el slider de gradiente
+def adjusted_color(distance, color_balance, simulation_size=15, out=None):
+    """Escribe en `out` (N, 3) los colores para un array de distancias al centro."""
+    norm_dist = np.asarray(distance) / (simulation_size * 1.5)
+    if out is None:
+        out = np.empty(norm_dist.shape + (3,))
+    np.clip(0.8 + color_balance * norm_dist, 0, 1, out=out[..., 0])
+    np.clip(0.5 + (1 - color_balance) * norm_dist * 0.5, 0, 1, out=out[..., 1])
+    np.clip(1.0 - color_balance * norm_dist * 0.7, 0, 1, out=out[..., 2])
+    return out
+
+class NebulaScene:
+    """
+    Estado de la simulación de Nebulosa.py, sin dependencias gráficas.
+
+    Las partículas de nebulosa se colorean por bandas de distancia: sólo se
+    recalcula el color de las que cambian de banda entre un frame y otro, y
+    el de las estrellas sólo cuando cambia el balance de color. Todos los
+    frames escriben en buffers preasignados.
+
+    Las estrellas empujan a las partículas de gas que tienen a menos de
+    `interaction_radius`; los vecinos se buscan con una rejilla espacial
+    sobre las estrellas, así que el coste es casi lineal en el número de
+    partículas en lugar de estrellas × partículas. Con muchas estrellas el
+    alcance se reduce (`push_radius`) para que cada partícula tenga de media
+    unas `max_push_neighbors` estrellas cerca: si no, los pares crecen con
+    estrellas × gas aunque la rejilla los encuentre sin comparar todos.
+
+    El ruido de cada frame sale de un generador sembrado con (seed, frame),
+    así que cualquier proceso puede reproducir el frame N avanzando la física.
+
+    Estrellas y gas viven en pools de capacidad fija (ver PoolParticulas):
+    cada partícula tiene una vida, al cumplirla (o, el gas, al salir del
+    área) deja su hueco libre, y dos emisores hacen nacer estrellas y gas
+    nuevos al ritmo con que mueren. Las estrellas se apagan en el último
+    décimo de su vida y el gas aparece y se desvanece en el primero y el
+    último; la memoria y el coste por frame no cambian con las horas.
+    La edad avanza 0.001 por unidad de velocidad y frame, como siempre.
+
+    Args:
+        num_stars (int): Número de estrellas.
+        num_nebula_particles (int): Número de partículas de nebulosa.
+        simulation_size (float): Radio del área simulada.
+        erosion_factor (float): Factor de erosión del tamaño con la edad.
+        seed (int): Semilla de los datos iniciales y del ruido de cada frame.
+        interaction_radius (float): Alcance del empuje de cada estrella sobre el gas.
+        interaction_strength (float): Intensidad del empuje; 0 lo desactiva.
+        star_lifetime (float): Edad media a la que muere una estrella.
+        gas_lifetime (float): Edad media a la que muere una partícula de nebulosa.
+    """
+
+    num_color_bands = 256
+
+    # Estrellas que empujan de media a cada partícula de gas (unas 30 en la escena por defecto)
+    max_push_neighbors = 32
+
+    # Fracción de la vida en la que las partículas aparecen o se desvanecen
+    fade_fraction = 0.1
+
+    # Campos de los pools, accesibles como stars_<campo> y nebula_<campo>
+    stars_r = PoolColumn('stars', 'r')
+    stars_theta = PoolColumn('stars', 'theta')
+    stars_speed = PoolColumn('stars', 'speed')
+    stars_size = PoolColumn('stars', 'size')
+    stars_age = PoolColumn('stars', 'age')
+    stars_lifetime = PoolColumn('stars', 'lifetime')
+    stars_alive = PoolColumn('stars', 'alive')
+    nebula_offsets = PoolColumn('gas', 'offsets')
+    nebula_size = PoolColumn('gas', 'size')
+    nebula_alpha = PoolColumn('gas', 'alpha')
+    nebula_age = PoolColumn('gas', 'age')
+    nebula_lifetime = PoolColumn('gas', 'lifetime')
+    nebula_alive = PoolColumn('gas', 'alive')
+
+    # Columnas guardadas en las instantáneas (ver SnapshotGalaxia)
+    snapshot_columns = ('stars_r', 'stars_theta', 'stars_speed', 'stars_size', 'stars_age',
+                        'nebula_offsets', 'nebula_size', 'nebula_alpha')
+    lifecycle_columns = ('stars_lifetime', 'stars_alive', 'nebula_age', 'nebula_lifetime', 'nebula_alive')
+
+    # Estado que cambia en cada paso, salidas que se dibujan y parámetros de
+    # cada paso cuando la física corre en procesos aparte (ver MotorSimulacion).
+    # Los nacimientos cambian radios, tamaños y alfas, así que también se comparten.
+    shared_columns = snapshot_columns + lifecycle_columns + (
+        'stars_offsets', 'stars_size_adjusted', 'stars_alpha', 'nebula_alpha_adjusted')
+    output_columns = ('stars_r', 'stars_offsets', 'stars_size_adjusted', 'stars_alpha',
+                      'nebula_offsets', 'nebula_size', 'nebula_alpha_adjusted')
+    step_params = ('effective_speed', 'interaction_strength')
+
+    def __init__(self, num_stars=3000, num_nebula_particles=2000, simulation_size=15,
+                 erosion_factor=0.98, seed=42, interaction_radius=1.5, interaction_strength=interaction_strength,
+                 star_lifetime=1.0, gas_lifetime=0.05):
+        self.num_stars = num_stars
+        self.num_nebula_particles = num_nebula_particles
+        self.simulation_size = simulation_size
+        self.erosion_factor = erosion_factor
+        self.seed = seed
+        self.interaction_radius = interaction_radius
+        self.interaction_strength = interaction_strength
+        self.star_lifetime = star_lifetime
+        self.gas_lifetime = gas_lifetime
+        self.frame = 0
+
+        # Crear datos iniciales
+        rng = np.random.default_rng(seed)
+        self.stars = ParticlePool(num_stars, r=float, theta=float, speed=float, size=float)
+        self.gas = ParticlePool(num_nebula_particles, offsets=(float, (2,)), size=float, alpha=float)
+
+        # Estrellas
+        self.stars_r[:] = rng.uniform(0, simulation_size, num_stars)
+        self.stars_theta[:] = rng.uniform(0, 2 * np.pi, num_stars)
+        self.stars_speed[:] = rng.uniform(0.5, 1.5, num_stars)
+        self.stars_size[:] = rng.uniform(1, 8, num_stars)
+
+        # Partículas nebulosa
+        self.nebula_x[:] = rng.uniform(-simulation_size * 1.5, simulation_size * 1.5, num_nebula_particles)
+        self.nebula_y[:] = rng.uniform(-simulation_size * 1.5, simulation_size * 1.5, num_nebula_particles)
+        self.nebula_size[:] = rng.uniform(0.1, 3, num_nebula_particles)
+        self.nebula_alpha[:] = rng.uniform(0.05, 0.3, num_nebula_particles)
+
+        self._init_lifecycle(rng)
+        self._init_buffers()
+
+    def _init_lifecycle(self, rng):
+        # Vidas repartidas para que las muertes no lleguen todas a la vez; el gas
+        # empieza con edades al azar, como si la nebulosa llevara tiempo encendida
+        self.stars_alive[:] = True
+        self.stars_lifetime[:] = rng.uniform(0.5, 1.5, self.num_stars) * self.star_lifetime
+        self.nebula_alive[:] = True
+        self.nebula_lifetime[:] = rng.uniform(0.5, 1.5, self.num_nebula_particles) * self.gas_lifetime
+        self.nebula_age[:] = rng.uniform(0, 1, self.num_nebula_particles) * self.nebula_lifetime
+
+    @classmethod
+    def from_snapshot(cls, path):
+        """
+        Carga una escena guardada con `save_snapshot` sin regenerarla.
+
+        Las columnas se abren con numpy.memmap en modo copia al escribir, así
+        que el archivo no cambia aunque la simulación avance.
+        """
+        columns, attrs = load_snapshot(path, mode='c')
+        scene = cls.__new__(cls)
+        scene.stars = ParticlePool.from_columns(
+            {name[len('stars_'):]: array for name, array in columns.items() if name.startswith('stars_')})
+        scene.gas = ParticlePool.from_columns(
+            {name[len('nebula_'):]: array for name, array in columns.items() if name.startswith('nebula_')})
+        scene.num_stars = len(scene.stars_r)
+        scene.num_nebula_particles = len(scene.nebula_offsets)
+        scene.simulation_size = attrs['simulation_size']
+        scene.erosion_factor = attrs['erosion_factor']
+        scene.seed = attrs['seed']
+        scene.frame = attrs['frame']
+        scene.interaction_radius = attrs.get('interaction_radius', 1.5)
+        scene.interaction_strength = attrs.get('interaction_strength', interaction_strength)
+        scene.star_lifetime = attrs.get('star_lifetime', 1.0)
+        scene.gas_lifetime = attrs.get('gas_lifetime', 0.05)
+        if any(name not in columns for name in cls.lifecycle_columns):
+            # Instantánea anterior a los pools: todas vivas, con vidas nuevas
+            for name, like in (('stars_lifetime', scene.stars_r), ('stars_alive', scene.stars_r),
+                               ('nebula_age', scene.nebula_size), ('nebula_lifetime', scene.nebula_size),
+                               ('nebula_alive', scene.nebula_size)):
+                setattr(scene, name, np.zeros(len(like), dtype=bool if name.endswith('alive') else float))
+            scene._init_lifecycle(np.random.default_rng((scene.seed, scene.frame)))
+        scene._init_buffers()
+        return scene
+
+    def save_snapshot(self, path):
+        """Guarda el estado de la escena (posiciones, radios, ángulos, tamaños y edades)."""
+        save_snapshot(path, {name: getattr(self, name) for name in self.snapshot_columns + self.lifecycle_columns},
+                      simulation_size=self.simulation_size, erosion_factor=self.erosion_factor,
+                      seed=self.seed, frame=self.frame, interaction_radius=self.interaction_radius,
+                      interaction_strength=self.interaction_strength, star_lifetime=self.star_lifetime,
+                      gas_lifetime=self.gas_lifetime)
+
+    def __copy__(self):
+        # Los pools se copian aparte: reemplazar una columna en la copia (por
+        # ejemplo, por memoria compartida en MotorSimulacion) no toca el original
+        scene = self.__class__.__new__(self.__class__)
+        scene.__dict__.update(self.__dict__)
+        scene.stars = copy.copy(self.stars)
+        scene.gas = copy.copy(self.gas)
+        return scene
+
+    @property
+    def nebula_x(self):
+        return self.nebula_offsets[:, 0]
+
+    @property
+    def nebula_y(self):
+        return self.nebula_offsets[:, 1]
+
+    def _init_buffers(self):
+        num_stars = self.num_stars
+        num_nebula_particles = self.num_nebula_particles
+        simulation_size = self.simulation_size
+
+        # Bandas de distancia para colorear la nebulosa
+        self.band_width = simulation_size * 2 * np.sqrt(2) / self.num_color_bands
+        self.band_centers = (np.arange(self.num_color_bands) + 0.5) * self.band_width
+        self.band_palette = np.empty((self.num_color_bands, 3))
+
+        # Estado cacheado entre frames y buffers preasignados
+        # La distancia de cada estrella al centro es stars_r, que no cambia
+        self.color_balance = None
+        self.stars_offsets = np.empty((num_stars, 2))
+        self.stars_colors = np.empty((num_stars, 3))
+        self.stars_size_adjusted = np.array(self.stars_size)
+        self.stars_alpha = np.ones(num_stars)
+        self._stars_turns = np.empty(num_stars)
+        self._stars_angle = np.empty(num_stars, dtype=np.float32)
+        self._stars_trig = np.empty(num_stars, dtype=np.float32)
+        self._stars_fade = np.empty(num_stars)
+        self._stars_color_r = np.empty(num_stars)
+        self._update_star_offsets()
+
+        # Emisores: en equilibrio nacen tantas partículas como mueren
+        self.star_emitter = Emitter(num_stars / self.star_lifetime,
+                                    partial(_new_stars, simulation_size=simulation_size),
+                                    (0.5 * self.star_lifetime, 1.5 * self.star_lifetime))
+        self.gas_emitter = Emitter(num_nebula_particles / self.gas_lifetime,
+                                   partial(_new_gas, simulation_size=simulation_size),
+                                   (0.5 * self.gas_lifetime, 1.5 * self.gas_lifetime))
+
+        self.nebula_colors = np.empty((num_nebula_particles, 3))
+        self._nebula_scratch = np.empty(num_nebula_particles)
+        self._nebula_fade = np.empty(num_nebula_particles)
+        self.nebula_alpha_adjusted = np.empty(num_nebula_particles)
+        self._update_gas_alpha(slice(None))
+        self._nebula_band = np.full(num_nebula_particles, -1, dtype=np.intp)
+        self._nebula_new_band = np.empty(num_nebula_particles, dtype=np.intp)
+        self._nebula_band_changed = np.empty(num_nebula_particles, dtype=bool)
+        self._out_of_bounds = np.empty(num_nebula_particles, dtype=bool)
+        self._out_of_bounds_y = np.empty(num_nebula_particles, dtype=bool)
+
+        # Rejillas espaciales sobre la nebulosa y las estrellas, con celdas del tamaño del alcance del empuje
+        extent = (-simulation_size * 2, simulation_size * 2, -simulation_size * 2, simulation_size * 2)
+        self.nebula_grid = SpatialGrid(self.interaction_radius, extent)
+
+        # Alcance del empuje: interaction_radius, salvo que con esa densidad media de estrellas
+        # cada partícula de gas tuviera más de max_push_neighbors estrellas cerca
+        expected = num_stars * (self.interaction_radius / simulation_size) ** 2
+        self.push_radius = self.interaction_radius * min(1.0, np.sqrt(self.max_push_neighbors / max(expected, 1)))
+        self.star_grid = SpatialGrid(self.push_radius, extent)
+
+    def initial_colors(self):
+        """Colores iniciales (estrellas, nebulosa) según la distancia al centro."""
+        return (distance_to_color(self.stars_r, self.simulation_size),
+                distance_to_color(np.hypot(self.nebula_x, self.nebula_y), self.simulation_size))
+
+    def _update_star_offsets(self, index=slice(None)):
+        # Coseno y seno en float32, que numpy vectoriza y son unas 20 veces más rápidos;
+        # el ángulo, que crece sin límite, se reduce antes a [0, 2π) en float64
+        theta, turns, angle = self.stars_theta[index], self._stars_turns[index], self._stars_angle[index]
+        np.multiply(theta, 1 / (2 * np.pi), out=turns)
+        np.floor(turns, out=turns)
+        turns *= -2 * np.pi
+        np.add(turns, theta, out=angle, casting='same_kind')
+
+        r, trig = self.stars_r[index], self._stars_trig[index]
+        np.multiply(r, np.cos(angle, out=trig), out=self.stars_offsets[index, 0])
+        np.multiply(r, np.sin(angle, out=trig), out=self.stars_offsets[index, 1])
+
+    def step(self, effective_speed):
+        """Avanza un frame de física: rotación, ruido de la nebulosa y envejecimiento."""
+        rng = np.random.default_rng((self.seed, self.frame))
+        self.frame += 1
+        self._step_stars(effective_speed, rng, slice(None))
+        self._step_gas(effective_speed, rng, slice(None))
+
+    def output_slices(self, part, num_parts):
+        """Tramos de estrellas y de gas que escribe la parte `part` de `num_parts`."""
+        stars = partition(self.num_stars, part, num_parts)
+        gas = partition(self.num_nebula_particles, part, num_parts)
+        return {'stars_r': stars, 'stars_offsets': stars, 'stars_size_adjusted': stars, 'stars_alpha': stars,
+                'nebula_offsets': gas, 'nebula_size': gas, 'nebula_alpha_adjusted': gas}
+
+    def step_partition(self, params, part, num_parts, barrier):
+        """
+        Avanza un frame sólo para las estrellas y el gas de la parte `part` de `num_parts`.
+
+        El empuje sobre el gas necesita las posiciones de todas las estrellas,
+        así que las partes se esperan en `barrier` antes de mover el gas. El
+        ruido de cada parte se siembra con (seed, frame, part).
+        """
+        effective_speed, self.interaction_strength = params
+        slices = self.output_slices(part, num_parts)
+        rng = np.random.default_rng((self.seed, self.frame, part))
+        self.frame += 1
+        self._step_stars(effective_speed, rng, slices['stars_offsets'])
+        barrier.wait()
+        self._step_gas(effective_speed, rng, slices['nebula_offsets'])
+
+    def _step_stars(self, effective_speed, rng, index):
+        # Envejecimiento: las que cumplen su vida dejan hueco y nacen otras
+        elapsed = 0.001 * effective_speed
+        self.stars.advance_age(elapsed, index)
+        self.star_emitter.emit(self.stars, elapsed, rng, index)
+
+        # Mover estrellas (movimiento espiral)
+        self.stars_theta[index] += effective_speed * self.stars_speed[index] * (
+            1 - self.stars_r[index] / (self.simulation_size * 2))
+        self._update_star_offsets(index)
+
+        # Efecto de erosión (envejecimiento)
+        age = self.stars_age[index]
+        size_adjusted = self.stars_size_adjusted[index]
+        np.power(self.erosion_factor, age, out=size_adjusted)
+        size_adjusted *= self.stars_size[index]
+        alpha = self.stars_alpha[index]
+        np.multiply(1 - age, 0.7, out=alpha)
+        alpha += 0.3
+
+        # Se apagan al final de su vida (los huecos libres quedan invisibles)
+        fade = self.stars.lifetime_fraction(index, out=self._stars_fade[index])
+        np.subtract(1, fade, out=fade)
+        fade *= 1 / self.fade_fraction
+        np.clip(fade, 0, 1, out=fade)
+        alpha *= fade
+        np.clip(alpha, 0, 1, out=alpha)
+
+    def _update_gas_alpha(self, index):
+        # El gas aparece y se desvanece en los extremos de su vida
+        fade = self.gas.lifetime_fraction(index, out=self._nebula_fade[index])
+        np.minimum(fade, 1 - fade, out=fade)
+        fade *= 1 / self.fade_fraction
+        np.clip(fade, 0, 1, out=fade)
+        np.multiply(self.nebula_alpha[index], fade, out=self.nebula_alpha_adjusted[index])
+
+    def _step_gas(self, effective_speed, rng, index):
+        size = self.simulation_size
+        nebula_x, nebula_y = self.nebula_x[index], self.nebula_y[index]
+
+        # Mover partículas de nebulosa (movimiento más caótico)
+        noise = self._nebula_scratch[index]
+        for coord in (nebula_x, nebula_y):
+            rng.standard_normal(out=noise)
+            noise *= 0.5 * effective_speed
+            coord += noise
+
+        # Retirar partículas que salen del área visible
+        out_of_bounds = self._out_of_bounds[index]
+        out_of_bounds_y = self._out_of_bounds_y[index]
+        np.greater(np.abs(nebula_x, out=noise), size * 2, out=out_of_bounds)
+        np.greater(np.abs(nebula_y, out=noise), size * 2, out=out_of_bounds_y)
+        out_of_bounds |= out_of_bounds_y
+        if out_of_bounds.any():
+            self.gas.retire(out_of_bounds, index)
+
+        # Envejecimiento y gas nuevo en los huecos libres
+        elapsed = 0.001 * effective_speed
+        self.gas.advance_age(elapsed, index)
+        self.gas_emitter.emit(self.gas, elapsed, rng, index)
+        self._update_gas_alpha(index)
+
+        # Empuje de las estrellas sobre el gas cercano
+        if self.interaction_strength > 0:
+            self._push_gas(effective_speed, nebula_x, nebula_y)
+
+    def particles_near(self, x, y, radius):
+        """
+        Partículas de nebulosa a distancia <= radius de cada punto (x, y).
+
+        Returns:
+            tuple: (query_idx, particle_idx, dist2) con un par por vecino.
+        """
+        return self.nebula_grid.update(self.nebula_x, self.nebula_y).query_radius(x, y, radius)
+
+    def _push_gas(self, effective_speed, nebula_x, nebula_y):
+        stars_x, stars_y = self.stars_offsets[:, 0], self.stars_offsets[:, 1]
+        gas_idx, star_idx, dist2 = self.star_grid.update(stars_x, stars_y).query_radius(
+            nebula_x, nebula_y, self.push_radius)
+        if len(gas_idx) == 0:
+            return
+
+        # Empuje radial que decrece linealmente hasta anularse en push_radius
+        dist = np.sqrt(dist2) + 1e-9
+        push = effective_speed * self.interaction_strength * (1 - dist / self.push_radius) / dist
+        dx = (nebula_x[gas_idx] - stars_x[star_idx]) * push
+        dy = (nebula_y[gas_idx] - stars_y[star_idx]) * push
+        nebula_x += np.bincount(gas_idx, weights=dx, minlength=len(nebula_x))
+        nebula_y += np.bincount(gas_idx, weights=dy, minlength=len(nebula_y))
+
+    def update_colors(self, color_balance):
+        """
+        Actualiza los colores cacheados.
+
+        Returns:
+            tuple: (stars_changed, nebula_changed) indicando qué colores cambiaron.
+        """
+        dirty = color_balance != self.color_balance
+        if dirty:
+            self.color_balance = color_balance
+            adjusted_color(self.stars_r, color_balance, self.simulation_size, out=self.stars_colors)
+            adjusted_color(self.band_centers, color_balance, self.simulation_size, out=self.band_palette)
+            self._stars_color_r[:] = self.stars_r
+            stars_changed = True
+        else:
+            # Sólo las estrellas nacidas desde el último frame tienen otro radio
+            born = np.flatnonzero(self.stars_r != self._stars_color_r)
+            if len(born):
+                self.stars_colors[born] = adjusted_color(self.stars_r[born], color_balance, self.simulation_size)
+                self._stars_color_r[born] = self.stars_r[born]
+            stars_changed = len(born) > 0
+
+        # Bandas de distancia de la nebulosa
+        new_band = self._nebula_new_band
+        np.hypot(self.nebula_x, self.nebula_y, out=self._nebula_scratch)
+        np.floor_divide(self._nebula_scratch, self.band_width, out=self._nebula_scratch)
+        new_band[:] = self._nebula_scratch
+        np.minimum(new_band, self.num_color_bands - 1, out=new_band)
+        np.not_equal(new_band, self._nebula_band, out=self._nebula_band_changed)
+
+        if dirty:
+            np.take(self.band_palette, new_band, axis=0, out=self.nebula_colors)
+            nebula_changed = True
+        else:
+            changed = np.flatnonzero(self._nebula_band_changed)
+            self.nebula_colors[changed] = self.band_palette[new_band[changed]]
+            nebula_changed = len(changed) > 0
+        if nebula_changed:
+            self._nebula_band[:] = new_band
+
+        return stars_changed, nebula_changed
@@ -0,0 +1,355 @@
+import argparse
+import os
+import time
+
+import numpy as np
+
+from .ColorEstelar import FILTERS
+
+# Intervalo de FuncAnimation en GalaxiaV2 y Nebulosa: las velocidades de los
+# sliders son por frame de 50 ms, así que cada paso fijo las escala a su duración
+REFERENCE_INTERVAL = 0.05
+
+def pack_colors(rgb, shifts, losses=(0, 0, 0), out=None):
+    """
+    Empaqueta colores RGB (N, 3) entre 0 y 1 en enteros de píxel uint32.
+
+    `shifts` y `losses` son los de la superficie (Surface.get_shifts() y
+    Surface.get_losses()), así que el resultado se escribe tal cual en
+    pygame.surfarray.pixels2d.
+    """
+    channels = np.clip(np.asarray(rgb, dtype=np.float32) * 255, 0, 255).astype(np.uint32)
+    if out is None:
+        out = np.empty(len(channels), dtype=np.uint32)
+    out.fill(0)
+    for channel in range(3):
+        out |= (channels[:, channel] >> losses[channel]) << shifts[channel]
+    return out
+
+class Viewport:
+    """
+    Proyección de coordenadas de la simulación a píxeles de la ventana.
+
+    Args:
+        width, height (int): Tamaño de la ventana en píxeles.
+        radius (float): Radio de la simulación que cabe en el lado corto.
+    """
+
+    def __init__(self, width, height, radius):
+        self.width = width
+        self.height = height
+        self.radius = radius
+        self.zoom = 1.0
+        self._scratch = {}
+
+    @property
+    def scale(self):
+        """Píxeles por unidad de la simulación."""
+        return self.zoom * min(self.width, self.height) / (2 * self.radius)
+
+    def _buffers(self, n, dtype):
+        key = (n, np.dtype(dtype))
+        if key not in self._scratch:
+            self._scratch[key] = (np.empty(n, dtype=dtype), np.empty(n, dtype=np.int64),
+                                  np.empty(n, dtype=np.int64), np.empty(n, dtype=bool))
+        return self._scratch[key]
+
+    def pixel_index(self, x, y):
+        """
+        Índices planos (fila * ancho + columna) de los puntos dentro de la ventana.
+
+        Returns:
+            tuple: (index, visible); `visible` es None si todos los puntos caen
+            dentro, o la máscara de los que se dibujan (en el orden de `index`).
+        """
+        scratch, col, row, visible = self._buffers(len(x), x.dtype)
+        scale = self.scale
+        # floor y no truncar: lo que cae a menos de un píxel del borde izquierdo o
+        # superior iría a la columna o fila 0
+        np.multiply(x, scale, out=scratch)
+        scratch += self.width / 2
+        col[:] = np.floor(scratch, out=scratch)
+        np.multiply(y, -scale, out=scratch)
+        scratch += self.height / 2
+        row[:] = np.floor(scratch, out=scratch)
+
+        # Vistos sin signo, los negativos son enormes: una comparación por eje basta
+        np.less(col.view(np.uint64), self.width, out=visible)
+        visible &= row.view(np.uint64) < self.height
+        row *= self.width
+        row += col
+        if visible.all():
+            return row, None
+        return row[visible], visible
+
+class GalaxyView:
+    """
+    Rotación de GalaxiaV2 para el renderizador en tiempo real.
+
+    Copia radios, ángulos y velocidades angulares de la escena en float32:
+    los senos y cosenos en float32 son unas diez veces más rápidos, y con
+    medio millón de estrellas son la mayor parte del frame. El ángulo se
+    reduce a [0, 2π) de vez en cuando para no perder precisión.
+
+    Teclas: ↑/↓ velocidad de rotación, 1-4 filtro de color.
+    """
+
+    max_speed = 0.1
+    wrap_every = 64
+
+    def __init__(self, scene, speed=0.02, label='Visible'):
+        self.scene = scene
+        self.radius = scene.galaxy_radius * 1.2
+        self.r = np.asarray(scene.r, dtype=np.float32)
+        self.theta = np.remainder(scene.theta, 2 * np.pi).astype(np.float32)
+        self.angular_speed = np.asarray(scene.angular_speed, dtype=np.float32)
+        self.x = np.empty_like(self.r)
+        self.y = np.empty_like(self.r)
+        self.speed = speed
+        self.label = label
+        self.steps = 0
+        self._colors = None
+        self._packed_label = None
+
+    def handle_key(self, key, keys):
+        if key == keys.K_UP:
+            self.speed = min(self.speed + 0.005, self.max_speed)
+        elif key == keys.K_DOWN:
+            self.speed = max(self.speed - 0.005, 0.0)
+        elif keys.K_1 <= key < keys.K_1 + len(FILTERS):
+            self.label = FILTERS[key - keys.K_1]
+
+    def step(self, steps, dt):
+        """Avanza `steps` pasos de `dt` segundos (la rotación cuesta lo mismo para cualquier número)."""
+        self.theta += np.float32(steps * self.speed * dt / REFERENCE_INTERVAL) * self.angular_speed
+        self.steps += steps
+        if self.steps >= self.wrap_every:
+            self.steps = 0
+            np.remainder(self.theta, np.float32(2 * np.pi), out=self.theta)
+
+    def layers(self, shifts, losses):
+        """Capas a dibujar, de atrás adelante: [(x, y, colores empaquetados), ...]."""
+        np.cos(self.theta, out=self.x)
+        self.x *= self.r
+        np.sin(self.theta, out=self.y)
+        self.y *= self.r
+        if self._packed_label != self.label:
+            self._packed_label = self.label
+            self._colors = pack_colors(self.scene.colors(self.label), shifts, losses, out=self._colors)
+        return [(self.x, self.y, self._colors)]
+
+    def status(self):
+        return f"{len(self.r):,} estrellas  rotación {self.speed:.3f}  filtro {self.label}"
+
+class NebulaView:
+    """
+    Nebulosa.py para el renderizador en tiempo real, con la física de NebulaScene.
+
+    El gas se dibuja debajo de las estrellas; el alfa de cada partícula
+    (que cambia al aparecer y desvanecerse) oscurece su color sobre el fondo negro.
+
+    Teclas: ↑/↓ velocidad, ←/→ gradiente de color, T turbo, [/] empuje estelar.
+    """
+
+    max_speed = 0.1
+    boost_factor = 3.8
+
+    def __init__(self, scene, speed=0.02, color_balance=0.5, push=None):
+        self.scene = scene
+        self.radius = scene.simulation_size * 1.5
+        self.speed = speed
+        self.color_balance = color_balance
+        # Por defecto, el empuje de la escena (el mismo que el slider de Nebulosa.py)
+        self.push = scene.interaction_strength if push is None else push
+        self.boost = False
+        self._gas = None
+        self._stars = None
+        self._shaded = np.empty((scene.num_stars, 3))
+        self._gas_shaded = np.empty((scene.num_nebula_particles, 3))
+
+    def handle_key(self, key, keys):
+        if key == keys.K_UP:
+            self.speed = min(self.speed + 0.005, self.max_speed)
+        elif key == keys.K_DOWN:
+            self.speed = max(self.speed - 0.005, 0.0)
+        elif key == keys.K_RIGHT:
+            self.color_balance = min(self.color_balance + 0.05, 1.0)
+        elif key == keys.K_LEFT:
+            self.color_balance = max(self.color_balance - 0.05, 0.0)
+        elif key == keys.K_t:
+            self.boost = not self.boost
+        elif key == keys.K_RIGHTBRACKET:
+            self.push = min(self.push + 5, 50.0)
+        elif key == keys.K_LEFTBRACKET:
+            self.push = max(self.push - 5, 0.0)
+
+    def step(self, steps, dt):
+        """Avanza `steps` pasos de física de `dt` segundos."""
+        effective_speed = self.speed * (self.boost_factor if self.boost else 1.0) * dt / REFERENCE_INTERVAL
+        self.scene.interaction_strength = self.push
+        for _ in range(steps):
+            self.scene.step(effective_speed)
+
+    def layers(self, shifts, losses):
+        """Capas a dibujar, de atrás adelante: [(x, y, colores empaquetados), ...]."""
+        scene = self.scene
+        scene.update_colors(self.color_balance)
+        np.multiply(scene.nebula_colors, scene.nebula_alpha_adjusted[:, None], out=self._gas_shaded)
+        self._gas = pack_colors(self._gas_shaded, shifts, losses, out=self._gas)
+        np.multiply(scene.stars_colors, scene.stars_alpha[:, None], out=self._shaded)
+        self._stars = pack_colors(self._shaded, shifts, losses, out=self._stars)
+        return [(scene.nebula_x, scene.nebula_y, self._gas),
+                (scene.stars_offsets[:, 0], scene.stars_offsets[:, 1], self._stars)]
+
+    def status(self):
+        turbo = "  TURBO" if self.boost else ""
+        return (f"{self.scene.num_stars:,} estrellas  {self.scene.num_nebula_particles:,} partículas  "
+                f"velocidad {self.speed:.3f}  gradiente {self.color_balance:.2f}  empuje {self.push:.0f}{turbo}")
+
+def draw_layers(pixels, viewport, layers):
+    """Escribe las capas en `pixels` (alto * ancho, uint32) con escrituras vectorizadas."""
+    for x, y, colors in layers:
+        index, visible = viewport.pixel_index(x, y)
+        pixels[index] = colors if visible is None else colors[visible]
+
+def run(view, width=1280, height=800, tick_rate=60, max_steps=5, fps_limit=0, max_frames=None):
+    """
+    Bucle en tiempo real de prueva.py con paso de tiempo fijo.
+
+    La física avanza en pasos de 1/tick_rate s, tantos como haya acumulado
+    el reloj (como mucho `max_steps` por frame, para que un frame lento no
+    encadene otros más lentos). Las estrellas se escriben directamente en el
+    buffer de píxeles de la ventana con pygame.surfarray; si las filas de la
+    superficie tienen relleno, se dibuja en un array propio y se copia con
+    blit_array.
+
+    Teclas comunes: espacio pausa, +/- zoom, Esc o Q salir; el resto las
+    define `view`.
+
+    Args:
+        view: GalaxyView o NebulaView.
+        width, height (int): Tamaño de la ventana.
+        tick_rate (int): Pasos de física por segundo.
+        max_steps (int): Pasos de física como máximo por frame dibujado.
+        fps_limit (int): Frames por segundo como máximo (0: sin límite).
+        max_frames (int | None): Terminar tras este número de frames.
+
+    Returns:
+        float: Frames por segundo medios.
+    """
+    import pygame
+
+    pygame.init()
+    screen = pygame.display.set_mode((width, height))
+    pygame.display.set_caption("Estrellas en tiempo real")
+    font = pygame.font.Font(None, 22)
+    clock = pygame.time.Clock()
+    viewport = Viewport(width, height, view.radius)
+    shifts, losses = screen.get_shifts()[:3], screen.get_losses()[:3]
+    frame_buffer = None
+
+    dt = 1 / tick_rate
+    accumulated = 0.0
+    paused = False
+    frames = 0
+    text = None
+    next_text = 0.0
+    start_time = last = time.perf_counter()
+
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key in (pygame.K_ESCAPE, pygame.K_q):
+                    running = False
+                elif event.key == pygame.K_SPACE:
+                    paused = not paused
+                elif event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                    viewport.zoom *= 1.25
+                elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                    viewport.zoom /= 1.25
+                else:
+                    view.handle_key(event.key, pygame)
+
+        # Paso de tiempo fijo
+        now = time.perf_counter()
+        accumulated = min(accumulated + now - last, max_steps * dt)
+        last = now
+        steps = int(accumulated / dt)
+        accumulated -= steps * dt
+        if steps and not paused:
+            view.step(steps, dt)
+
+        # Dibujo directo en el buffer de píxeles
+        layers = view.layers(shifts, losses)
+        surface_pixels = pygame.surfarray.pixels2d(screen)
+        rows = surface_pixels.T
+        if rows.flags.c_contiguous:
+            pixels = rows.reshape(-1)
+        else:
+            if frame_buffer is None:
+                frame_buffer = np.zeros((height, width), dtype=np.uint32)
+            pixels = frame_buffer.reshape(-1)
+        pixels.fill(0)
+        draw_layers(pixels, viewport, layers)
+        del surface_pixels, rows
+        if frame_buffer is not None:
+            pygame.surfarray.blit_array(screen, frame_buffer.T)
+
+        # Contador de fps: el texto se rehace dos veces por segundo
+        if now >= next_text:
+            next_text = now + 0.5
+            label = f"{clock.get_fps():5.1f} fps  {view.status()}{'  PAUSA' if paused else ''}"
+            text = font.render(label, True, (255, 255, 255))
+        screen.blit(text, (8, 8))
+
+        pygame.display.flip()
+        clock.tick(fps_limit)
+        frames += 1
+        if max_frames is not None and frames >= max_frames:
+            running = False
+
+    pygame.quit()
+    return frames / (time.perf_counter() - start_time)
+
+def main(argv=None):
+    """Abre la galaxia o la nebulosa en una ventana de pygame."""
+    parser = argparse.ArgumentParser(description="Galaxia y nebulosa en tiempo real con pygame")
+    parser.add_argument('scene', nargs='?', choices=('galaxia', 'nebulosa'), default='galaxia')
+    parser.add_argument('--stars', type=int, default=None,
+                        help="Estrellas (por defecto, 500000 en la galaxia y 3000 en la nebulosa)")
+    parser.add_argument('--gas', type=int, default=2000, help="Partículas de nebulosa")
+    parser.add_argument('--snapshot', help="Instantánea de la escena (ver SnapshotGalaxia)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--size', default='1280x800', help="Tamaño de la ventana, ANCHOxALTO")
+    parser.add_argument('--tick-rate', type=int, default=60, help="Pasos de física por segundo")
+    parser.add_argument('--fps-limit', type=int, default=0, help="Máximo de frames por segundo (0: sin límite)")
+    parser.add_argument('--frames', type=int, default=None, help="Salir tras N frames e imprimir los fps medios")
+    args = parser.parse_args(argv)
+    width, height = (int(v) for v in args.size.lower().split('x'))
+
+    if args.scene == 'galaxia':
+        from .EscenaGalaxia import GalaxyScene
+
+        if args.snapshot and os.path.exists(args.snapshot):
+            scene = GalaxyScene.from_snapshot(args.snapshot)
+        else:
+            scene = GalaxyScene(args.stars or 500_000, seed=args.seed)
+        view = GalaxyView(scene)
+    else:
+        from .EscenaNebulosa import NebulaScene
+
+        if args.snapshot and os.path.exists(args.snapshot):
+            scene = NebulaScene.from_snapshot(args.snapshot)
+        else:
+            scene = NebulaScene(args.stars or 3000, args.gas, seed=args.seed)
+        view = NebulaView(scene)
+
+    fps = run(view, width, height, args.tick_rate, fps_limit=args.fps_limit, max_frames=args.frames)
+    if args.frames:
+        print(f"{fps:.1f} fps")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import argparse
+
+import numpy as np
+
+# Parámetros de la galaxia
+num_stars = 1000
+arms = 2
+spread = 0.5
+rotation = 5
+
+def generate_spiral(num_stars=num_stars, arms=arms, spread=spread, rotation=rotation, seed=None):
+    """
+    Estrellas de una galaxia espiral: la misma espiral girada una vez por brazo, con ruido.
+
+    Returns:
+        tuple: (x_all, y_all, arm_id), arrays float32 de arms × num_stars
+        estrellas y el brazo (uint8) de cada una.
+    """
+    rng = np.random.default_rng(seed)
+
+    # Generar estrellas
+    r = rng.random(num_stars) ** 0.5  # distribuye más estrellas en el centro
+    theta = r * rotation * 2 * np.pi
+
+    x = r * np.cos(theta)
+    y = r * np.sin(theta)
+
+    # Añadir curvatura tipo espiral
+    # Arrays preasignados: cada brazo escribe su tramo y guarda su número de población
+    arm_offset = (2 * np.pi) / arms
+    x_all = np.empty(arms * num_stars, dtype=np.float32)
+    y_all = np.empty(arms * num_stars, dtype=np.float32)
+    arm_id = np.repeat(np.arange(arms, dtype=np.uint8), num_stars)
+
+    for i in range(arms):
+        angle_offset = i * arm_offset
+        x_rot = x * np.cos(angle_offset) - y * np.sin(angle_offset)
+        y_rot = x * np.sin(angle_offset) + y * np.cos(angle_offset)
+
+        arm_slice = slice(i * num_stars, (i + 1) * num_stars)
+        x_all[arm_slice] = x_rot + rng.normal(0, spread, num_stars)
+        y_all[arm_slice] = y_rot + rng.normal(0, spread, num_stars)
+
+    return x_all, y_all, arm_id
+
+def plot_spiral(x_all, y_all, arm_id):
+    """Muestra la galaxia con un color alterno por brazo."""
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import to_rgb
+
+    # Color alterno por brazo
+    palette = np.array([to_rgb('deepskyblue'), to_rgb('orchid')])
+    colors = palette[arm_id % 2]
+
+    # Graficar
+    plt.figure(figsize=(8, 8))
+    plt.scatter(x_all, y_all, c=colors, s=1, alpha=0.7)
+    plt.axis('off')
+    plt.title("🌌 Galaxia estilo Andrómeda", fontsize=14)
+    plt.show()
+
+def main(argv=None):
+    """Genera la galaxia espiral y la muestra en una ventana."""
+    parser = argparse.ArgumentParser(description="Galaxia espiral de brazos simétricos")
+    parser.add_argument('--stars', type=int, default=num_stars, help="Estrellas por brazo")
+    parser.add_argument('--arms', type=int, default=arms, help="Número de brazos")
+    parser.add_argument('--seed', type=int, default=None, help="Semilla de la galaxia")
+    args = parser.parse_args(argv)
+
+    plot_spiral(*generate_spiral(args.stars, args.arms, seed=args.seed))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+# Lado de los bloques en que se evalúa la imagen
+TILE = 512
+
+# Máximo de bytes de geometría (radio y ángulo, 8 por píxel) que se cachean por
+# imagen: unos 4000 × 4000 píxeles; las imágenes mayores la calculan por bloque
+GEOMETRY_CACHE_BYTES = 128 * 2**20
+
+def _tiles(size, tile):
+    """Bloques (fila0, fila1, col0, col1) que cubren una imagen size × size."""
+    edges = list(range(0, size, tile)) + [size]
+    return [(r0, r1, c0, c1) for r0, r1 in zip(edges[:-1], edges[1:]) for c0, c1 in zip(edges[:-1], edges[1:])]
+
+def _axes(size, extent):
+    """Coordenadas x (columnas) e y (filas) en float32, como np.linspace del meshgrid original."""
+    x0, x1, y0, y1 = extent
+    return np.linspace(x0, x1, size, dtype=np.float32), np.linspace(y0, y1, size, dtype=np.float32)
+
+def _tile_geometry(xs, ys, radio=None, angulo=None):
+    """Radio y ángulo de un bloque a partir de sus coordenadas, sin crear el meshgrid."""
+    shape = (len(ys), len(xs))
+    radio = np.empty(shape, dtype=np.float32) if radio is None else radio
+    angulo = np.empty(shape, dtype=np.float32) if angulo is None else angulo
+    np.hypot(ys[:, None], xs[None, :], out=radio)
+    np.arctan2(ys[:, None], xs[None, :], out=angulo)
+    return radio, angulo
+
+@lru_cache(maxsize=2)
+def field_geometry(size, extent=(-5, 5, -5, 5), tile=TILE):
+    """
+    Radio y ángulo (float32) de cada bloque de la imagen, cacheados por tamaño y extensión.
+
+    Cambiar los parámetros de los brazos no vuelve a calcular la geometría.
+    La caché guarda las dos últimas resoluciones: 8 bytes por píxel cada una;
+    render_field sólo la usa por debajo de GEOMETRY_CACHE_BYTES.
+
+    Returns:
+        list: [((fila0, fila1, col0, col1), radio, angulo), ...]
+    """
+    xs, ys = _axes(size, extent)
+    return [((r0, r1, c0, c1), *_tile_geometry(xs[c0:c1], ys[r0:r1])) for r0, r1, c0, c1 in _tiles(size, tile)]
+
+def render_field(size=1000, extent=(-5, 5, -5, 5), core_width=0.5, arm_frequency=2, arm_count=5, arm_decay=3,
+                 tile=TILE, workers=None, cache=False, out=None):
+    """
+    Densidad de la galaxia (núcleo + brazos espirales) en float32, bloque a bloque.
+
+    galaxia = exp(-radio² / core_width) + sin(arm_frequency·radio + arm_count·ángulo) · exp(-radio / arm_decay)
+
+    Cada hilo evalúa bloques de tile × tile con sus propios buffers de
+    trabajo (NumPy suelta el GIL en las operaciones elementales), así que la
+    memoria temporal depende del tamaño del bloque y no de la imagen.
+
+    Args:
+        size (int): Lado de la imagen en píxeles.
+        extent (tuple): (x0, x1, y0, y1) del área representada.
+        core_width (float): Anchura del núcleo.
+        arm_frequency (float): Vueltas de los brazos por unidad de radio.
+        arm_count (int): Número de brazos.
+        arm_decay (float): Distancia de caída del brillo de los brazos.
+        tile (int): Lado de los bloques.
+        workers (int | None): Hilos; por defecto, los de ThreadPoolExecutor.
+        cache (bool): Reutilizar radio y ángulo con `field_geometry` entre
+            llamadas con el mismo tamaño (por ejemplo, al variar los brazos).
+            Sólo se cachea hasta GEOMETRY_CACHE_BYTES; sin caché la geometría
+            se calcula por bloque y la memoria queda acotada por él.
+        out (np.ndarray | None): Array (size, size) float32 donde escribir,
+            por ejemplo un np.memmap para impresiones a 8k.
+
+    Returns:
+        np.ndarray: Imagen (size, size) float32, con la fila 0 en y0 (origin='lower').
+    """
+    if out is None:
+        out = np.empty((size, size), dtype=np.float32)
+    xs, ys = _axes(size, extent)
+    scratch = threading.local()
+
+    def buffers(shape):
+        if getattr(scratch, 'shape', None) != shape:
+            scratch.shape = shape
+            scratch.arrays = [np.empty(shape, dtype=np.float32) for _ in range(4)]
+        return scratch.arrays
+
+    def evaluate(block):
+        (r0, r1, c0, c1), radio, angulo = block
+        nucleo, brazos, geo_r, geo_a = buffers((r1 - r0, c1 - c0))
+        if radio is None:
+            radio, angulo = _tile_geometry(xs[c0:c1], ys[r0:r1], geo_r, geo_a)
+
+        # Núcleo
+        np.multiply(radio, radio, out=nucleo)
+        nucleo *= np.float32(-1 / core_width)
+        np.exp(nucleo, out=nucleo)
+
+        # Brazos espirales
+        np.multiply(radio, np.float32(arm_frequency), out=brazos)
+        target = out[r0:r1, c0:c1]
+        np.multiply(angulo, np.float32(arm_count), out=target)
+        target += brazos
+        np.sin(target, out=target)
+        np.multiply(radio, np.float32(-1 / arm_decay), out=brazos)
+        np.exp(brazos, out=brazos)
+        target *= brazos
+
+        # Combinar componentes
+        target += nucleo
+
+    if cache and 8 * size * size <= GEOMETRY_CACHE_BYTES:
+        blocks = field_geometry(size, tuple(extent), tile)
+    else:
+        blocks = [(bounds, None, None) for bounds in _tiles(size, tile)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(evaluate, blocks))
+    return out
+
+def star_field(count, extent=(-5, 5, -5, 5), size_range=(0.1, 1.5), alpha_range=(0.3, 1.0), seed=None):
+    """
+    Estrellas de fondo con posición, tamaño y opacidad uniformes al azar.
+
+    Returns:
+        tuple: (x, y, sizes, alphas), arrays de `count` elementos.
+    """
+    rng = np.random.default_rng(seed)
+    x0, x1, y0, y1 = extent
+    return (rng.uniform(x0, x1, count), rng.uniform(y0, y1, count),
+            rng.uniform(*size_range, count), rng.uniform(*alpha_range, count))
+
+def draw_stars(ax, x, y, sizes, alphas, color='white'):
+    """
+    Dibuja todas las estrellas de fondo con un solo scatter.
+
+    La opacidad de cada estrella va en el canal alfa de su color RGBA, así
+    que hay un artista en total en lugar de uno por estrella.
+    """
+    from matplotlib.colors import to_rgb
+
+    rgba = np.empty((len(x), 4))
+    rgba[:, :3] = to_rgb(color)
+    rgba[:, 3] = alphas
+    return ax.scatter(x, y, s=sizes, c=rgba)
+
+def composite_stars(image, x, y, alphas, extent=(-5, 5, -5, 5), color='white'):
+    """
+    Compone las estrellas de fondo directamente en una imagen RGB (origin='lower').
+
+    Cada estrella cubre su píxel con su opacidad; varias estrellas en el
+    mismo píxel se combinan como capas superpuestas: la transparencia que
+    queda es el producto de (1 - alpha), calculado con una suma de
+    logaritmos por píxel (np.bincount). El coste no depende de matplotlib.
+
+    Args:
+        image (np.ndarray): Imagen (alto, ancho, 3) float que se modifica.
+        x, y, alphas (np.ndarray): Posiciones y opacidades de las estrellas.
+        extent (tuple): (x0, x1, y0, y1) que cubre la imagen.
+        color: Color de las estrellas.
+
+    Returns:
+        np.ndarray: La misma imagen.
+    """
+    from matplotlib.colors import to_rgb
+
+    height, width = image.shape[:2]
+    x0, x1, y0, y1 = extent
+    col = np.floor((np.asarray(x) - x0) * (width / (x1 - x0))).astype(np.int64)
+    row = np.floor((np.asarray(y) - y0) * (height / (y1 - y0))).astype(np.int64)
+    inside = (col >= 0) & (col < width) & (row >= 0) & (row < height)
+    pixel = row[inside] * width + col[inside]
+
+    log_transparency = np.log1p(-np.minimum(np.asarray(alphas)[inside], 1 - 1e-7))
+    transparency = np.exp(np.bincount(pixel, weights=log_transparency, minlength=width * height))
+    transparency = transparency.reshape(height, width, 1).astype(image.dtype)
+    image *= transparency
+    image += (1 - transparency) * np.asarray(to_rgb(color), dtype=image.dtype)
+    return image
+
+def plot_field(galaxia, extent=(-5, 5, -5, 5), num_stars=500, composite=False, seed=None):
+    """
+    Muestra la densidad con el colormap azul y dorado y estrellas de fondo.
+
+    Con `composite` las estrellas se componen en la imagen en lugar de
+    dibujarse como un scatter encima.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import LinearSegmentedColormap
+
+    # Configuración del tamaño de la imagen
+    fig, ax = plt.subplots(figsize=(10, 10), facecolor='black')
+    ax.set_facecolor('black')
+
+    # Crear un colormap personalizado con dos colores (azul y dorado)
+    colors = ["#1a1a2e", "#e6b422"]  # Azul oscuro y dorado
+    cmap = LinearSegmentedColormap.from_list("andromeda", colors)
+
+    # Estrellas aleatorias como puntos brillantes
+    x_star, y_star, size_star, alpha_star = star_field(num_stars, extent, seed=seed)
+
+    # Mostrar la galaxia
+    if composite:
+        norm = plt.Normalize(galaxia.min(), galaxia.max())
+        image = cmap(norm(galaxia), bytes=False)[..., :3].astype(np.float32)
+        composite_stars(image, x_star, y_star, alpha_star, extent)
+        img = ax.imshow(image, extent=list(extent), origin='lower')
+    else:
+        img = ax.imshow(galaxia, cmap=cmap, extent=list(extent), origin='lower')
+        draw_stars(ax, x_star, y_star, size_star, alpha_star)
+
+    # Configuración del gráfico
+    ax.axis('off')
+    plt.tight_layout()
+
+    # Mostrar el resultado
+    plt.show()
+
+def main(argv=None):
+    """Calcula la densidad de la galaxia y la muestra con estrellas de fondo."""
+    parser = argparse.ArgumentParser(description="Campo de densidad de una galaxia espiral")
+    parser.add_argument('--size', type=int, default=1000, help="Lado de la imagen en píxeles")
+    parser.add_argument('--stars', type=int, default=500, help="Estrellas de fondo")
+    parser.add_argument('--composite', action='store_true', help="Componer las estrellas en la imagen")
+    args = parser.parse_args(argv)
+
+    # Parámetros de la galaxia
+    galaxia = render_field(size=args.size)
+    plot_field(galaxia, num_stars=args.stars, composite=args.composite)
+
+if __name__ == "__main__":
+    main()
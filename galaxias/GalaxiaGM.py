@@ -0,0 +1,171 @@
+import argparse
+
+import numpy as np
+
+# Formato de cada bloque de estrellas generado por `iter_galaxy_chunks`
+STAR_DTYPE = np.dtype([('x', np.float32), ('y', np.float32), ('population', np.uint8)])
+INNER = 0  # Población interior (amarilla - bulbo/halo)
+OUTER = 1  # Población exterior (azul - brazos espirales)
+
+# Estrellas por tramo de números aleatorios: fijo para que la galaxia no dependa del tamaño de bloque
+BLOCK_SIZE = 1 << 16
+
+def iter_galaxy_chunks(num_stars_inner=5000, num_stars_outer=15000, arm_tightness=1.5, arm_spread=0.1, num_arms=2, inner_radius_factor=0.2, chunk_size=1_000_000, seed=None):
+    """
+    Genera la galaxia espiral por bloques de tamaño fijo sin construir listas de Python.
+
+    Las estrellas se numeran primero las interiores y después las de cada
+    brazo; cada bloque cubre un tramo consecutivo de esa numeración, así que
+    la memoria usada es la de un bloque aunque la galaxia no quepa en RAM.
+    Los números aleatorios se sacan siempre en tramos de BLOCK_SIZE
+    estrellas, de modo que la galaxia no depende de `chunk_size`.
+
+    Args:
+        num_stars_inner (int): Número de estrellas para la población interior (amarilla).
+        num_stars_outer (int): Número de estrellas para la población exterior (azul);
+            se reparten por igual entre los brazos.
+        arm_tightness (float): Qué tan apretados están los brazos espirales.
+        arm_spread (float): Dispersión de las estrellas alrededor de los brazos.
+        num_arms (int): Número de brazos espirales.
+        inner_radius_factor (float): Factor que define el radio del bulbo interior.
+        chunk_size (int): Estrellas por bloque.
+        seed (int | np.random.Generator | None): Semilla o generador aleatorio.
+
+    Yields:
+        np.ndarray: Bloque estructurado con campos x, y (float32) y population (INNER/OUTER).
+    """
+    rng = np.random.default_rng(seed)
+    stars_per_arm = num_stars_outer // num_arms
+    total = num_stars_inner + stars_per_arm * num_arms
+
+    def fill(stars, start):
+        """Estrellas [start, start + len(stars)) de la numeración."""
+        # Población de estrellas interiores (amarillas - bulbo/halo)
+        # Distribución más concéntrica y uniforme
+        n_inner = max(0, min(start + len(stars), num_stars_inner) - start)
+        if n_inner:
+            theta_inner = 2 * np.pi * rng.random(n_inner, dtype=np.float32)
+            radius_inner = rng.power(0.5, n_inner).astype(np.float32) * np.float32(inner_radius_factor * 10) # Más estrellas cerca del centro
+            stars['x'][:n_inner] = radius_inner * np.cos(theta_inner)
+            stars['y'][:n_inner] = radius_inner * np.sin(theta_inner)
+            stars['population'][:n_inner] = INNER
+
+        # Población de estrellas exteriores (azules - brazos espirales)
+        n_outer = len(stars) - n_inner
+        if n_outer:
+            # Ángulo base del brazo de cada estrella
+            first = start + n_inner - num_stars_inner
+            arm = np.arange(first, first + n_outer) // stars_per_arm
+            arm_angle = (2 * np.pi / num_arms) * arm
+
+            # Generar radios y ángulos para cada brazo
+            r_arm = rng.random(n_outer, dtype=np.float32) * np.float32((1 - inner_radius_factor) * 10) + np.float32(inner_radius_factor * 10)
+            theta_arm = arm_tightness * np.log(r_arm + 1e-5) + arm_angle + (rng.standard_normal(n_outer, dtype=np.float32) * arm_spread)
+
+            # Convertir a coordenadas cartesianas
+            stars['x'][n_inner:] = r_arm * np.cos(theta_arm)
+            stars['y'][n_inner:] = r_arm * np.sin(theta_arm)
+            stars['population'][n_inner:] = OUTER
+
+    # Último tramo de BLOCK_SIZE generado, para los bloques que empiezan o acaban a mitad de uno
+    block = np.empty(min(BLOCK_SIZE, total), dtype=STAR_DTYPE)
+    block_start = block_stop = 0
+    for start in range(0, total, chunk_size):
+        stop = min(start + chunk_size, total)
+        chunk = np.empty(stop - start, dtype=STAR_DTYPE)
+        pos = start
+        while pos < stop:
+            if pos == block_stop:
+                block_start, block_stop = pos, min(pos + BLOCK_SIZE, total)
+                if block_stop <= stop:
+                    # El tramo entero cabe en el bloque: se genera en su sitio
+                    fill(chunk[pos - start:block_stop - start], pos)
+                    pos = block_stop
+                    continue
+                fill(block[:block_stop - block_start], block_start)
+            end = min(stop, block_stop)
+            chunk[pos - start:end - start] = block[pos - block_start:end - block_start]
+            pos = end
+        yield chunk
+
+def create_galaxy(num_stars_inner=5000, num_stars_outer=15000, arm_tightness=1.5, arm_spread=0.1, num_arms=2, inner_radius_factor=0.2, seed=None):
+    """
+    Crea datos para una galaxia espiral con dos poblaciones de estrellas de diferentes colores.
+
+    Es la concatenación de los bloques de `iter_galaxy_chunks` con la misma semilla.
+
+    Args:
+        num_stars_inner (int): Número de estrellas para la población interior (amarilla).
+        num_stars_outer (int): Número de estrellas para la población exterior (azul).
+        arm_tightness (float): Qué tan apretados están los brazos espirales.
+        arm_spread (float): Dispersión de las estrellas alrededor de los brazos.
+        num_arms (int): Número de brazos espirales.
+        inner_radius_factor (float): Factor que define el radio del bulbo interior.
+        seed (int | np.random.Generator | None): Semilla o generador aleatorio.
+
+    Returns:
+        tuple: Tupla con las coordenadas x, y (float32) para la población interior y exterior.
+    """
+    total = num_stars_inner + (num_stars_outer // num_arms) * num_arms
+    # Un solo bloque: cada tramo de números aleatorios se escribe directamente en su sitio
+    chunks = iter_galaxy_chunks(num_stars_inner, num_stars_outer, arm_tightness, arm_spread, num_arms, inner_radius_factor,
+                                chunk_size=max(total, 1), seed=seed)
+    stars = next(chunks, np.empty(0, dtype=STAR_DTYPE))
+
+    # Las estrellas interiores van primero, seguidas de las de los brazos
+    inner, outer = stars[:num_stars_inner], stars[num_stars_inner:]
+    return (np.ascontiguousarray(inner['x']), np.ascontiguousarray(inner['y']),
+            np.ascontiguousarray(outer['x']), np.ascontiguousarray(outer['y']))
+
+def plot_galaxy(x_inner, y_inner, x_outer, y_outer):
+    """
+    Grafica la galaxia con las dos poblaciones de estrellas.
+    """
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(10, 10))
+    plt.style.use('dark_background') # Fondo oscuro para simular el espacio
+
+    # Plot de la población interior (amarilla)
+    plt.scatter(x_inner, y_inner, s=1, color='gold', alpha=0.6, label='Estrellas antiguas (bulbo/halo)')
+
+    # Plot de la población exterior (azul)
+    plt.scatter(x_outer, y_outer, s=0.5, color='cyan', alpha=0.4, label='Estrellas jóvenes (brazos espirales)')
+
+    plt.title('Diseño de Galaxia Espiral (Inspirado en Andrómeda)', fontsize=16)
+    plt.xlabel('Coordenada X', fontsize=12)
+    plt.ylabel('Coordenada Y', fontsize=12)
+    plt.axis('off') # Ocultar los ejes para una mejor visualización espacial
+    plt.legend(loc='upper right', fontsize=10)
+    plt.grid(False)
+    plt.tight_layout()
+    plt.show()
+
+def render_galaxy(x_inner, y_inner, x_outer, y_outer, filename, size=1024):
+    """
+    Rasteriza la galaxia directamente en un PNG, sin crear un punto de matplotlib por estrella.
+
+    El tiempo depende del tamaño de la imagen y no del número de estrellas,
+    así que sirve para galaxias de decenas de millones de estrellas.
+    """
+    from .RasterGalaxia import rasterize, save_image
+
+    image = rasterize([
+        (x_inner, y_inner, 'gold', 0.6),
+        (x_outer, y_outer, 'cyan', 0.4),
+    ], width=size, height=size)
+    save_image(filename, image)
+
+def main(argv=None):
+    """Muestra la galaxia en una ventana (RasterGalaxia la renderiza en PNG)."""
+    parser = argparse.ArgumentParser(description="Galaxia espiral de dos poblaciones (inspirada en Andrómeda)")
+    parser.add_argument('--inner', type=int, default=5000, help="Estrellas del bulbo")
+    parser.add_argument('--outer', type=int, default=15000, help="Estrellas de los brazos")
+    parser.add_argument('--seed', type=int, default=None, help="Semilla de la galaxia")
+    args = parser.parse_args(argv)
+
+    x_inner, y_inner, x_outer, y_outer = create_galaxy(args.inner, args.outer, seed=args.seed)
+    plot_galaxy(x_inner, y_inner, x_outer, y_outer)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
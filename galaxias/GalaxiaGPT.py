@@ -0,0 +1,204 @@
+import argparse
+
+import numpy as np
+
+def generar_bulbo(n, radio_bulbo, seed=None):
+    """
+    Estrellas (n, 3) del bulbo: una gaussiana de escala `radio_bulbo`, aplanada en Z.
+
+    Args:
+        seed (int | np.random.Generator | None): Semilla o generador aleatorio.
+    """
+    coords = np.random.default_rng(seed).normal(scale=radio_bulbo, size=(n, 3))
+    coords[:,2] *= 0.1  # aplanar ligeramente en Z
+    return coords
+
+def generar_brazos(n, n_brazos, rotacion=2, dispersión=0.5, radio_max=10, out=None, seed=None):
+    """
+    Estrellas (n, 3) en float32 repartidas en `n_brazos` brazos espirales.
+
+    Todo el ruido sale de una sola llamada al generador, escrita directamente
+    en el buffer de salida; después se le suma la espiral de cada brazo. Si
+    n no es múltiplo de n_brazos, los primeros brazos tienen una estrella
+    más, así que siempre se devuelven n estrellas.
+
+    Args:
+        out (np.ndarray | None): Buffer (n, 3) float32 contiguo que se reutiliza,
+            por ejemplo en una animación que regenera la galaxia.
+        seed (int | np.random.Generator | None): Semilla o generador del ruido.
+    """
+    if out is None:
+        out = np.empty((n, 3), dtype=np.float32)
+    elif out.shape != (n, 3) or out.dtype != np.float32 or not out.flags.c_contiguous:
+        raise ValueError(f"`out` debe ser un array float32 contiguo de forma {(n, 3)}")
+
+    # Ruido de las tres coordenadas (z, más fino) en un solo bloque
+    np.random.default_rng(seed).standard_normal(dtype=np.float32, out=out)
+    out[:, :2] *= np.float32(dispersión)
+    out[:, 2] *= np.float32(dispersión * 0.1)
+
+    counts = np.full(n_brazos, n // n_brazos)
+    counts[:n % n_brazos] += 1
+    start = 0
+    for i, count in enumerate(counts):
+        stop = start + count
+        # Parámetro a lo largo del brazo, de 0 a 1 (como np.linspace)
+        t = np.arange(count, dtype=np.float32)
+        t /= np.float32(max(count - 1, 1))
+        θ = t * np.float32(rotacion * 2*np.pi)
+        θ += np.float32(i * 2*np.pi/n_brazos)
+        r = t
+        r *= np.float32(radio_max)
+        trig = np.cos(θ)
+        trig *= r
+        out[start:stop, 0] += trig
+        np.sin(θ, out=trig)
+        trig *= r
+        out[start:stop, 1] += trig
+        start = stop
+    return out
+
+class LevelOfDetail:
+    """
+    Versiones diezmadas de una nube de puntos para dibujarla a distintos niveles de detalle.
+
+    Los puntos se barajan una vez; cada nivel es un prefijo del array
+    barajado, así que es una muestra uniforme (conserva la forma de la
+    densidad) y no ocupa memoria extra. Cada nivel tiene `factor` veces
+    menos puntos que el anterior, hasta `min_points`.
+
+    Args:
+        points (np.ndarray): Puntos (N, 3).
+        factor (int): Reducción entre un nivel y el siguiente.
+        min_points (int): Tamaño mínimo del nivel más grueso.
+        seed (int | None): Semilla del barajado.
+    """
+
+    def __init__(self, points, factor=4, min_points=1000, seed=None):
+        rng = np.random.default_rng(seed)
+        self.points = points[rng.permutation(len(points))]
+        self.counts = [len(points)]
+        while self.counts[-1] // factor >= min_points:
+            self.counts.append(self.counts[-1] // factor)
+
+    def visible_fraction(self, limits):
+        """Fracción de puntos dentro de los límites (x, y, z) de la vista, estimada con el nivel más grueso."""
+        sample = self.points[:self.counts[-1]]
+        inside = np.ones(len(sample), dtype=bool)
+        for axis, (low, high) in enumerate(limits):
+            inside &= (sample[:, axis] >= low) & (sample[:, axis] <= high)
+        return inside.mean() if len(sample) else 0.0
+
+    def level(self, budget, limits=None):
+        """Puntos del nivel más detallado cuyos puntos visibles caben en `budget`."""
+        fraction = 1.0 if limits is None else max(self.visible_fraction(limits), 1 / max(self.counts[-1], 1))
+        for count in self.counts:
+            if count * fraction <= budget:
+                return count
+        return self.counts[-1]
+
+class LODViewer:
+    """
+    Scatter 3D que baja de detalle mientras se gira o se hace zoom.
+
+    Al pulsar el ratón o usar la rueda se dibuja el nivel que cabe en
+    `interactive_budget`; tras `idle_ms` sin interacción se vuelve a dibujar
+    con `still_budget`. Cada punto de un nivel diezmado representa
+    N / n puntos, así que su opacidad sube a 1 - (1 - alpha)**(N / n) para
+    que el brillo de la nube no cambie con el nivel.
+
+    Args:
+        ax: Ejes 3D.
+        populations (list): Pares (LevelOfDetail, estilo) donde estilo son
+            argumentos de ax.scatter (s, color, alpha, label).
+        interactive_budget (int): Puntos visibles por población al interactuar.
+        still_budget (int | None): Puntos visibles por población en reposo; None para todos.
+        idle_ms (int): Espera tras la última interacción antes del detalle completo.
+    """
+
+    def __init__(self, ax, populations, interactive_budget=20_000, still_budget=None, idle_ms=300):
+        self.ax = ax
+        self.populations = populations
+        self.interactive_budget = interactive_budget
+        self.still_budget = still_budget
+        self.scatters = [None] * len(populations)
+        self.counts = [None] * len(populations)
+
+        canvas = ax.figure.canvas
+        self.timer = canvas.new_timer(interval=idle_ms)
+        self.timer.single_shot = True
+        self.timer.add_callback(self.draw, False)
+        canvas.mpl_connect('button_press_event', self._on_interaction)
+        canvas.mpl_connect('scroll_event', self._on_interaction)
+        canvas.mpl_connect('button_release_event', self._on_release)
+        self.draw(False)
+
+    def _on_interaction(self, event):
+        if event.inaxes is self.ax:
+            self.timer.stop()
+            self.draw(True)
+            if event.name == 'scroll_event':
+                self.timer.start()
+
+    def _on_release(self, event):
+        self.timer.start()
+
+    def draw(self, interacting):
+        """Dibuja cada población con el nivel que corresponde a la vista actual."""
+        budget = self.interactive_budget if interacting else self.still_budget
+        limits = (self.ax.get_xlim(), self.ax.get_ylim(), self.ax.get_zlim())
+        changed = False
+        for i, (lod, style) in enumerate(self.populations):
+            count = lod.counts[0] if budget is None else lod.level(budget, limits)
+            if count == self.counts[i]:
+                continue
+            if self.scatters[i] is not None:
+                self.scatters[i].remove()
+            points = lod.points[:count]
+            alpha = 1 - (1 - style.get('alpha', 1.0)) ** (lod.counts[0] / count)
+            self.scatters[i] = self.ax.scatter(points[:, 0], points[:, 1], points[:, 2], **{**style, 'alpha': alpha})
+            self.counts[i] = count
+            changed = True
+        if changed:
+            self.ax.figure.canvas.draw_idle()
+
+def main(argv=None):
+    """Muestra la galaxia 3D, con niveles de detalle opcionales (--lod)."""
+    import matplotlib.pyplot as plt
+
+    parser = argparse.ArgumentParser(description="Galaxia 3D de bulbo y brazos espirales")
+    parser.add_argument('--stars', type=int, default=8000, help="Estrellas en los brazos")
+    parser.add_argument('--bulge', type=int, default=2000, help="Estrellas en el bulbo")
+    parser.add_argument('--lod', action='store_true', help="Niveles de detalle: menos puntos mientras se gira la vista")
+    parser.add_argument('--lod-budget', type=int, default=20_000, help="Puntos visibles por población al girar")
+    parser.add_argument('--still-budget', type=int, default=None,
+                        help="Puntos visibles por población en reposo (por defecto, todos)")
+    parser.add_argument('--seed', type=int, default=None, help="Semilla de la galaxia")
+    args = parser.parse_args(argv)
+
+    # parámetros
+    n_bulbo = args.bulge
+    n_brazos = 3
+    n_estrellas = args.stars
+
+    rng = np.random.default_rng(args.seed)
+    bulbo = generar_bulbo(n_bulbo, radio_bulbo=2, seed=rng)
+    brazos = generar_brazos(n_estrellas, n_brazos, rotacion=2.5, dispersión=0.8, radio_max=12, seed=rng)
+
+    fig = plt.figure(figsize=(8,8))
+    ax = fig.add_subplot(111, projection='3d')
+    if args.lod:
+        viewer = LODViewer(ax, [
+            (LevelOfDetail(bulbo, seed=0), dict(s=1, color='gold', alpha=0.7, label='bulbo')),
+            (LevelOfDetail(brazos, seed=1), dict(s=0.5, color='blue', alpha=0.5, label='brazos')),
+        ], interactive_budget=args.lod_budget, still_budget=args.still_budget)
+    else:
+        ax.scatter(bulbo[:,0], bulbo[:,1], bulbo[:,2], s=1, color='gold', alpha=0.7, label='bulbo')
+        ax.scatter(brazos[:,0], brazos[:,1], brazos[:,2], s=0.5, color='blue', alpha=0.5, label='brazos')
+    ax.set_axis_off()
+    # Con millones de puntos, loc='best' recorre todos los datos en cada dibujo
+    plt.legend(loc='upper right' if args.lod else 'best')
+    plt.show()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import argparse
+import os
+
+from .EscenaGalaxia import GalaxyScene
+from .MotorSimulacion import SimulationEngine
+from .PerfilFrames import FrameProfiler
+from .PlanificadorFrames import FrameScheduler
+
+# Parámetros de la galaxia
+num_stars = 2000
+galaxy_radius = 10
+arm_count = 4
+arm_width = 0.5
+rotation_speed = 0.02
+bulge_size = 3
+
+
+parser = argparse.ArgumentParser(description="Galaxia con filtros de color (ventana de matplotlib)")
+parser.add_argument('--snapshot', help="Archivo de instantánea de la escena")
+parser.add_argument('--nbody', action='store_true', help="Gravedad real (Barnes–Hut) en lugar de rotación fija")
+parser.add_argument('--theta', type=float, default=0.7, help="Ángulo de apertura de Barnes–Hut")
+parser.add_argument('--workers', type=int, default=0,
+                    help="Procesos para la física (0: en el bucle de dibujo, como siempre)")
+parser.add_argument('--profile', action='store_true', help="Percentiles por fase de cada frame en pantalla")
+parser.add_argument('--profile-alloc', action='store_true', help="Medir también la memoria reservada por fase")
+parser.add_argument('--trace', help="Archivo JSON de traza de Chrome con las fases de cada frame")
+parser.add_argument('--adaptive', action='store_true',
+                    help="Bajar la calidad (puntos dibujados, física por partes, frames) para mantener el ritmo")
+parser.add_argument('--target-ms', type=float, default=50, help="Tiempo por frame objetivo con --adaptive")
+parser.add_argument('--schedule-log', help="Archivo JSON con las decisiones de --adaptive")
+
+
+def build_window(args):
+    """
+    Crea la figura, los controles y la animación de la galaxia.
+
+    Returns:
+        tuple: (fig, ani, finish); `finish` detiene los procesos de física y
+        guarda la traza y las métricas pedidas, después de plt.show().
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.animation import FuncAnimation
+    from matplotlib.colors import LinearSegmentedColormap
+    import matplotlib.cm as cm
+    from matplotlib.widgets import RadioButtons, Slider
+
+    # Crear datos de estrellas: posiciones, temperaturas, tamaños y colores
+    # Instantánea opcional: si existe se carga sin regenerar, si no se crea al terminar de generar
+    if args.snapshot and os.path.exists(args.snapshot):
+        scene = GalaxyScene.from_snapshot(args.snapshot)
+    else:
+        scene = GalaxyScene(num_stars, galaxy_radius, arm_count, arm_width, bulge_size, seed=42)
+        if args.snapshot:
+            scene.save_snapshot(args.snapshot)
+    if args.nbody:
+        scene.enable_nbody(theta=args.theta)
+
+    # Física en procesos aparte: los controles no esperan a que termine cada paso.
+    # Se arranca antes de crear la figura, para que los procesos no hereden la interfaz
+    engine = None
+    if args.workers > 0:
+        engine = SimulationEngine(scene, args.workers).start(rotation_speed)
+
+    # Configuración inicial
+    plt.style.use('dark_background')
+    fig, ax = plt.subplots(figsize=(10, 8))
+    plt.subplots_adjust(left=0.1, right=0.75, bottom=0.25)
+
+    # Perfil por fase de cada frame (apagado no cuesta nada)
+    profiler = FrameProfiler(enabled=args.profile or args.profile_alloc or args.trace is not None,
+                             track_allocations=args.profile_alloc)
+
+    # Calidad adaptativa (apagada, siempre completa)
+    scheduler = FrameScheduler(args.target_ms / 1e3, enabled=args.adaptive, subsets=args.workers == 0)
+
+    colors = scene.colors('Visible')
+
+    # Dibujar las estrellas
+    scatter = ax.scatter(scene.offsets[:, 0], scene.offsets[:, 1], c=colors, s=scene.sizes, alpha=0.8, edgecolors='none')
+
+    # Configuración del gráfico
+    ax.set_xlim(-scene.galaxy_radius*1.2, scene.galaxy_radius*1.2)
+    ax.set_ylim(-scene.galaxy_radius*1.2, scene.galaxy_radius*1.2)
+    ax.set_title('Simulación de Galaxia con Filtros de Color', pad=20)
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    # Crear widgets para los filtros
+    rax = plt.axes([0.78, 0.5, 0.15, 0.3])
+    radio = RadioButtons(rax, ('Visible', 'Infrarrojo', 'Ultravioleta', 'H-Alpha'), active=0)
+
+    # Crear slider para la rotación
+    ax_rot = plt.axes([0.2, 0.1, 0.6, 0.03])
+    rot_slider = Slider(
+        ax=ax_rot, label='Velocidad Rotación', 
+        valmin=0, valmax=0.1, valinit=rotation_speed
+    )
+
+    # Función para aplicar filtros
+    def apply_filter(label):
+        nonlocal colors
+    
+        # Cada filtro tiene su tabla de color; cambiar de filtro es una sola indexación
+        new_colors = scene.colors(label)
+    
+        colors = new_colors
+        scatter.set_color(scheduler.decimate(colors))
+        fig.canvas.draw_idle()
+
+    radio.on_clicked(apply_filter)
+
+    # Función de animación para rotación
+    def update(frame):
+        # Actualizar velocidad de rotación desde el slider
+        rotation_speed = rot_slider.val
+    
+        # Rotar las estrellas (más rápido cerca del centro) y actualizar el scatter plot;
+        # con --workers sólo se recoge el último frame calculado
+        with profiler.phase('fisica'):
+            if engine is not None:
+                engine.set_params(rotation_speed)
+                engine.sync(scene)
+            else:
+                scheduler.step(scene, rotation_speed)
+
+        # Con --adaptive puede dibujarse sólo una de cada N estrellas
+        with profiler.phase('artistas'):
+            if scheduler.changed:
+                scatter.set_color(scheduler.decimate(colors))
+                scatter.set_sizes(scheduler.decimate(scene.sizes))
+            scatter.set_offsets(scheduler.decimate(scene.offsets))
+    
+        return (scatter,) + profiler.tick()
+
+    # Crear la animación
+    ani = FuncAnimation(fig, update, frames=200, interval=50, blit=True)
+    profiler.instrument(ani)
+    scheduler.instrument(ani)
+    if args.profile:
+        profiler.add_overlay(ax)
+
+    # Barra de color para temperatura
+    cax = plt.axes([0.78, 0.15, 0.03, 0.3])
+    cmap = LinearSegmentedColormap.from_list('temp_cmap', 
+                                            [(1, 0, 0), (1, 1, 0), (1, 1, 1), (0.5, 0.7, 1)])
+    norm = plt.Normalize(3000, 30000)
+    cb = plt.colorbar(cm.ScalarMappable(norm=norm, cmap=cmap), cax=cax)
+    cb.set_label('Temperatura (K)')
+
+    def finish():
+        if engine is not None:
+            engine.close()
+        if args.trace:
+            profiler.save_trace(args.trace)
+        if args.schedule_log:
+            scheduler.save_metrics(args.schedule_log)
+
+    return fig, ani, finish
+
+
+def main(argv=None):
+    """Abre la simulación de la galaxia en una ventana de matplotlib."""
+    import matplotlib.pyplot as plt
+
+    fig, ani, finish = build_window(parser.parse_args(argv))
+    plt.show()
+    finish()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import copy
+import ctypes
+import math
+import multiprocessing as mp
+import sys
+import threading
+import time
+
+import numpy as np
+
+def partition(n, part, num_parts):
+    """Tramo de índices [lo, hi) de la parte `part` al repartir n elementos en `num_parts`."""
+    return slice(n * part // num_parts, n * (part + 1) // num_parts)
+
+def default_start_method():
+    """
+    Forma de crear los procesos: fork donde es seguro, spawn en el resto.
+
+    Windows no tiene fork, y en macOS hacer fork de un proceso que ya abrió
+    una ventana (Cocoa, los hilos de matplotlib) puede colgar o romper el hijo.
+    """
+    if sys.platform != 'darwin' and 'fork' in mp.get_all_start_methods():
+        return 'fork'
+    return 'spawn'
+
+def _shared_array(ctx, like):
+    """
+    Memoria compartida (RawArray) con la forma, el tipo y los datos de `like`.
+
+    Returns:
+        tuple: (raw, dtype, forma); se envía tal cual a los procesos, también con spawn.
+    """
+    like = np.asarray(like)
+    shared = (ctx.RawArray(ctypes.c_byte, max(1, like.nbytes)), like.dtype, like.shape)
+    _view(shared)[...] = like
+    return shared
+
+def _view(shared):
+    """Array de NumPy sobre la memoria de `_shared_array`, en cualquier proceso."""
+    raw, dtype, shape = shared
+    return np.frombuffer(raw, dtype=dtype, count=math.prod(shape)).reshape(shape)
+
+def _worker(scene, columns, part, num_parts, engine):
+    """Bucle de un proceso: avanza su tramo de partículas y escribe en el buffer trasero."""
+    for name, shared in columns.items():
+        setattr(scene, name, _view(shared))
+    slices = scene.output_slices(part, num_parts)
+    try:
+        while True:
+            engine.barrier.wait()
+            scene.step_partition(tuple(engine.step_params), part, num_parts, engine.barrier)
+
+            back = engine.buffers[1 - engine.front.value]
+            for name, index in slices.items():
+                back[name][index] = getattr(scene, name)[index]
+
+            # Sólo un proceso publica el frame terminado y marca el ritmo
+            if engine.barrier.wait() == 0:
+                engine._publish()
+    except threading.BrokenBarrierError:
+        pass
+
+class SimulationEngine:
+    """
+    Física de una escena en procesos aparte, desacoplada del bucle de dibujo.
+
+    El estado que cambia en cada paso (`scene.shared_columns`) vive en memoria
+    compartida y cada proceso avanza sólo su tramo de índices; las salidas que
+    se dibujan (`scene.output_columns`) tienen doble buffer: los procesos
+    escriben el trasero mientras la interfaz lee el delantero, y al terminar
+    el paso se intercambian. La interfaz nunca espera a la física: `sync`
+    copia el último frame completo en su propia escena.
+
+    Donde es seguro, los procesos se crean con fork y heredan la escena sin
+    copiarla; en Windows y macOS se usa spawn y la escena se envía serializada,
+    sin las columnas compartidas, que cada proceso vuelve a abrir sobre la
+    misma memoria. Con fork el motor tiene que arrancarse antes de crear la
+    figura de matplotlib, para que los procesos no hereden la interfaz.
+
+    Args:
+        scene: GalaxyScene o NebulaScene ya creada; se usa como estado inicial.
+        workers (int): Procesos que se reparten las partículas.
+        interval (float): Segundos mínimos entre pasos (0.05 = 20 pasos/s, como FuncAnimation).
+        start_method (str | None): 'fork' o 'spawn'; por defecto, `default_start_method()`.
+    """
+
+    def __init__(self, scene, workers=1, interval=0.05, start_method=None):
+        ctx = mp.get_context(start_method or default_start_method())
+        self.workers = max(1, workers)
+        self.interval = interval
+
+        self.params = ctx.RawArray(ctypes.c_double, len(scene.step_params))
+        self.step_params = ctx.RawArray(ctypes.c_double, len(scene.step_params))
+        self.front = ctx.RawValue(ctypes.c_int, 0)
+        self.frame = ctx.RawValue(ctypes.c_long, 0)
+        self.lock = ctx.Lock()
+        self.barrier = ctx.Barrier(self.workers)
+        self.last_publish = ctx.RawValue(ctypes.c_double, 0.0)
+
+        # Copia de la escena para los procesos; su estado en memoria compartida se abre en cada proceso
+        columns = {name: _shared_array(ctx, getattr(scene, name)) for name in scene.shared_columns}
+        shared = copy.copy(scene)
+        for name in scene.shared_columns:
+            setattr(shared, name, None)
+        self._buffers = [{name: _shared_array(ctx, getattr(scene, name)) for name in scene.output_columns}
+                         for _ in range(2)]
+        self.buffers = [{name: _view(array) for name, array in buffer.items()} for buffer in self._buffers]
+
+        self.processes = [ctx.Process(target=_worker, args=(shared, columns, part, self.workers, self), daemon=True)
+                          for part in range(self.workers)]
+
+    def __getstate__(self):
+        # Con spawn el motor viaja a los procesos: sin ellos mismos y sin las vistas
+        # de NumPy, que se volverían a abrir sobre la memoria compartida
+        state = self.__dict__.copy()
+        del state['processes'], state['buffers']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.buffers = [{name: _view(array) for name, array in buffer.items()} for buffer in self._buffers]
+
+    def set_params(self, *values):
+        """Parámetros de los próximos pasos, en el orden de `scene.step_params`."""
+        self.params[:] = values
+
+    def start(self, *values):
+        """Arranca los procesos con los parámetros iniciales."""
+        self.set_params(*values)
+        self.step_params[:] = self.params[:]
+        self.last_publish.value = time.perf_counter()
+        for process in self.processes:
+            process.start()
+        return self
+
+    def _publish(self):
+        with self.lock:
+            self.front.value = 1 - self.front.value
+            self.frame.value += 1
+        self.step_params[:] = self.params[:]
+
+        delay = self.interval - (time.perf_counter() - self.last_publish.value)
+        if delay > 0:
+            time.sleep(delay)
+        self.last_publish.value = time.perf_counter()
+
+    def sync(self, scene):
+        """
+        Copia en `scene` las salidas del último frame completo.
+
+        Returns:
+            int: Número de pasos completados desde el arranque.
+        """
+        with self.lock:
+            front = self.buffers[self.front.value]
+            for name, array in front.items():
+                getattr(scene, name)[...] = array
+            return self.frame.value
+
+    def close(self):
+        """Detiene los procesos."""
+        self.barrier.abort()
+        for process in self.processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,217 @@
+import argparse
+import os
+
+from .EscenaNebulosa import NebulaScene
+from .MotorSimulacion import SimulationEngine
+from .PerfilFrames import FrameProfiler
+from .PlanificadorFrames import FrameScheduler
+
+# Parámetros de la simulación
+num_stars = 3000
+num_nebula_paticles = 2000
+simulation_size = 15
+base_speed = 0.02
+erosion_factor = 0.98
+
+
+parser = argparse.ArgumentParser(description="Nebulosa con estrellas (ventana de matplotlib)")
+parser.add_argument('--snapshot', help="Archivo de instantánea de la escena")
+parser.add_argument('--workers', type=int, default=0,
+                    help="Procesos para la física (0: en el bucle de dibujo, como siempre)")
+parser.add_argument('--profile', action='store_true', help="Percentiles por fase de cada frame en pantalla")
+parser.add_argument('--profile-alloc', action='store_true', help="Medir también la memoria reservada por fase")
+parser.add_argument('--trace', help="Archivo JSON de traza de Chrome con las fases de cada frame")
+parser.add_argument('--adaptive', action='store_true',
+                    help="Bajar la calidad (puntos dibujados, física por partes, frames) para mantener el ritmo")
+parser.add_argument('--target-ms', type=float, default=50, help="Tiempo por frame objetivo con --adaptive")
+parser.add_argument('--schedule-log', help="Archivo JSON con las decisiones de --adaptive")
+
+
+def build_window(args):
+    """
+    Crea la figura, los controles y la animación de la nebulosa.
+
+    Returns:
+        tuple: (fig, ani, finish); `finish` guarda la traza y las métricas
+        pedidas y detiene los procesos de física, después de plt.show().
+    """
+    import matplotlib.pyplot as plt
+    import matplotlib.cm as cm
+    from matplotlib.animation import FuncAnimation
+    from matplotlib.colors import LinearSegmentedColormap
+    from matplotlib.widgets import Slider, Button
+
+    # Crear datos iniciales
+    # Instantánea opcional: si existe se carga sin regenerar, si no se crea al terminar de generar
+    if args.snapshot and os.path.exists(args.snapshot):
+        scene = NebulaScene.from_snapshot(args.snapshot)
+    else:
+        scene = NebulaScene(num_stars, num_nebula_paticles, simulation_size, erosion_factor, seed=42)
+        if args.snapshot:
+            scene.save_snapshot(args.snapshot)
+
+    # Física en procesos aparte: los controles no esperan a que termine cada paso.
+    # Se arranca antes de crear la figura, para que los procesos no hereden la interfaz
+    engine = None
+    if args.workers > 0:
+        engine = SimulationEngine(scene, args.workers).start(base_speed, scene.interaction_strength)
+
+    # Configuración inicial
+    plt.style.use('dark_background')
+
+    # Se corrige plt.subplot por plt.subplots
+    fig, ax = plt.subplots(figsize=(12, 10))
+    plt.subplots_adjust(left=0.1, right=0.85, bottom=0.25)
+
+    # Perfil por fase de cada frame (apagado no cuesta nada)
+    profiler = FrameProfiler(enabled=args.profile or args.profile_alloc or args.trace is not None,
+                             track_allocations=args.profile_alloc)
+
+    # Calidad adaptativa (apagada, siempre completa)
+    scheduler = FrameScheduler(args.target_ms / 1e3, enabled=args.adaptive, subsets=args.workers == 0)
+
+    # Colores iniciales
+    stars_colors, nebula_colors = scene.initial_colors()
+
+    # Crear los scatter plots
+    stars_scatter = ax.scatter(scene.stars_offsets[:, 0], scene.stars_offsets[:, 1],
+                               c=stars_colors,
+                               s=scene.stars_size,
+                               alpha=0.9,
+                               edgecolors='none')
+
+    nebula_scatter = ax.scatter(scene.nebula_x, scene.nebula_y,
+                                c=nebula_colors,
+                                s=scene.nebula_size,
+                                alpha=scene.nebula_alpha_adjusted,
+                                edgecolors='none')
+
+    # Configuración del gráfico
+    ax.set_xlim(-scene.simulation_size * 1.5, scene.simulation_size * 1.5)
+    ax.set_ylim(-scene.simulation_size * 1.5, scene.simulation_size * 1.5)
+    ax.set_title('Nebulosa con Estrellas - Simulación', pad=20)
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    # Controles
+    ax_speed = plt.axes([0.2, 0.15, 0.6, 0.03])
+    speed_slider = Slider(ax_speed, 'Velocidad', 0, 0.1, valinit=base_speed)
+
+    ax_color = plt.axes([0.2, 0.1, 0.6, 0.03])
+    # Se corrige el nombre de la variable speed_slider por color_slider
+    color_slider = Slider(ax_color, 'Gradiente Color', 0, 1, valinit=0.5)
+
+    ax_push = plt.axes([0.2, 0.05, 0.5, 0.03])
+    push_slider = Slider(ax_push, 'Empuje estelar', 0, 50, valinit=scene.interaction_strength)
+
+    # Botón para acelerar
+    ax_button = plt.axes([0.8, 0.05, 0.1, 0.04])
+    # Se corrige ax.button por ax_button
+    boost_button = Button(ax_button, 'Turbo!', color='red')
+
+    # Barra de color
+    cax = plt.axes([0.07, 0.2, 0.03, 0.6])
+    cmap = LinearSegmentedColormap.from_list('nebula_cmap', [(0.8, 0.5, 1.0), (1.0, 0.8, 0.5), (1.0, 0.3, 0.1)])
+    norm = plt.Normalize(0, scene.simulation_size * 1.5)
+    # Se corrige cm.ScalarMappble por cm.ScalarMappable
+    cb = plt.colorbar(cm.ScalarMappable(norm=norm, cmap=cmap), cax=cax)
+    cb.set_label('Distancia al centro')
+
+    # Variables para el efecto turbo
+    # Se corrige boosr_active por boost_active
+    boost_active = False
+    boost_factor = 3.8
+
+    def boost(event):
+        nonlocal boost_active
+        boost_active = not boost_active
+        boost_button.color = 'green' if boost_active else 'red'
+        fig.canvas.draw_idle()
+
+    boost_button.on_clicked(boost)
+
+    # Función de animación
+    def update(frame):
+        # Obtener valores de los controles
+        current_speed = speed_slider.val
+        # Se corrige color_balance por color_slider
+        color_balance = color_slider.val
+
+        # Aplicar turbo si está activo
+        effective_speed = current_speed * (boost_factor if boost_active else 1.0)
+
+        # Mover estrellas y partículas de nebulosa (el gas cercano a una estrella es empujado)
+        # y envejecer las estrellas; con --workers sólo se recoge el último frame calculado
+        with profiler.phase('fisica'):
+            if engine is not None:
+                engine.set_params(effective_speed, push_slider.val)
+                engine.sync(scene)
+            else:
+                scene.interaction_strength = push_slider.val
+                scheduler.step(scene, effective_speed, push_slider.val)
+
+        # Actualizar colores: sólo cambian con el slider o cuando una partícula cambia de banda
+        with profiler.phase('colores'):
+            stars_changed, nebula_changed = scene.update_colors(color_balance)
+
+        # Actualizar gráficos
+        # Con --adaptive puede dibujarse sólo una de cada N partículas
+        with profiler.phase('artistas'):
+            decimate = scheduler.decimate
+            if scheduler.changed:
+                # Colores y alfas por punto tienen que cambiar de longitud a la vez:
+                # con un solo color se puede cambiar antes el alfa
+                for scatter, colors, alpha in ((stars_scatter, scene.stars_colors, scene.stars_alpha),
+                                               (nebula_scatter, scene.nebula_colors, scene.nebula_alpha_adjusted)):
+                    scatter.set_color('white')
+                    scatter.set_alpha(decimate(alpha))
+                    scatter.set_color(decimate(colors))
+            else:
+                if stars_changed:
+                    stars_scatter.set_color(decimate(scene.stars_colors))
+                if nebula_changed:
+                    nebula_scatter.set_color(decimate(scene.nebula_colors))
+
+            stars_scatter.set_offsets(decimate(scene.stars_offsets))
+            stars_scatter.set_alpha(decimate(scene.stars_alpha))
+            stars_scatter.set_sizes(decimate(scene.stars_size_adjusted))
+
+            # Las partículas nacen, aparecen y se desvanecen: tamaño y alfa cambian en cada frame
+            nebula_scatter.set_offsets(decimate(scene.nebula_offsets))
+            nebula_scatter.set_alpha(decimate(scene.nebula_alpha_adjusted))
+            nebula_scatter.set_sizes(decimate(scene.nebula_size))
+    
+        # Se devuelve una tupla con los artistas que se actualizan (y el texto del perfil, si se muestra)
+        return (stars_scatter, nebula_scatter) + profiler.tick()
+
+    # Crear animación
+    # Se corrige el argumento frames, ya que no se usa en la función update
+    ani = FuncAnimation(fig, update, interval=50, blit=True)
+    profiler.instrument(ani)
+    scheduler.instrument(ani)
+    if args.profile:
+        profiler.add_overlay(ax)
+
+    def finish():
+        if args.trace:
+            profiler.save_trace(args.trace)
+        if args.schedule_log:
+            scheduler.save_metrics(args.schedule_log)
+
+        if engine is not None:
+            engine.close()
+
+    return fig, ani, finish
+
+
+def main(argv=None):
+    """Abre la simulación de la nebulosa en una ventana de matplotlib."""
+    import matplotlib.pyplot as plt
+
+    fig, ani, finish = build_window(parser.parse_args(argv))
+    plt.show()
+    finish()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import contextlib
+import json
+import os
+import time
+import tracemalloc
+import warnings
+from collections import deque
+
+import numpy as np
+
+# Contexto vacío compartido: con el perfilador apagado cada fase cuesta una llamada
+_DISABLED = contextlib.nullcontext()
+
+class _Phase:
+    """Mide una fase: tiempo de pared y, si se pide, memoria reservada durante ella."""
+
+    __slots__ = ('profiler', 'name', 'start', 'memory')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        if self.profiler.track_allocations:
+            self.memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        duration = time.perf_counter() - self.start
+        allocated = None
+        if self.profiler.track_allocations:
+            allocated = tracemalloc.get_traced_memory()[1] - self.memory
+        self.profiler.record(self.name, self.start, duration, allocated)
+        return False
+
+class FrameProfiler:
+    """
+    Tiempos por fase de cada frame de una animación.
+
+    Cada `update` marca sus fases con `with profiler.phase('fisica'): ...`.
+    Se guardan los últimos `window` valores de cada fase para calcular
+    percentiles móviles, y los eventos para exportarlos como traza de
+    Chrome (chrome://tracing o https://ui.perfetto.dev). Apagado, `phase`
+    devuelve un contexto vacío compartido y `tick` una tupla vacía.
+
+    Con `track_allocations` cada fase guarda también los bytes que llegó a
+    reservar por encima de lo que había al empezar (tracemalloc; NumPy le
+    informa de sus arrays). Es caro, así que va aparte del perfil de tiempos.
+    Las fases no deben anidarse si se miden reservas.
+
+    Args:
+        enabled (bool): Si es False, no se mide nada.
+        window (int): Frames usados para los percentiles.
+        track_allocations (bool): Medir también memoria reservada por fase.
+        max_events (int): Eventos guardados para la traza (los más recientes).
+        overlay_every (int): Frames entre actualizaciones del texto en pantalla.
+    """
+
+    def __init__(self, enabled=True, window=300, track_allocations=False, max_events=100_000, overlay_every=10):
+        self.enabled = enabled
+        self.window = window
+        self.track_allocations = enabled and track_allocations
+        self.overlay_every = overlay_every
+        self.durations = {}
+        self.allocations = {}
+        self.events = deque(maxlen=max_events)
+        self.frames = 0
+        self.overlay = None
+        self._origin = time.perf_counter()
+        if self.track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def phase(self, name):
+        """Contexto que mide la fase `name` del frame actual."""
+        if not self.enabled:
+            return _DISABLED
+        return _Phase(self, name)
+
+    def record(self, name, start, duration, allocated=None):
+        """Añade una medida de la fase `name` (segundos desde perf_counter)."""
+        if name not in self.durations:
+            self.durations[name] = deque(maxlen=self.window)
+            self.allocations[name] = deque(maxlen=self.window)
+        self.durations[name].append(duration)
+        if allocated is not None:
+            self.allocations[name].append(allocated)
+        self.events.append((name, start, duration, allocated))
+
+    def instrument(self, animation, name='dibujo'):
+        """
+        Mide también el dibujo que hace FuncAnimation después de cada `update`.
+
+        Envuelve `_post_draw`, donde matplotlib dibuja los artistas devueltos
+        (o todo el canvas sin blit) y los copia a la pantalla. Es un método
+        privado de matplotlib: si la versión instalada no lo tiene, se avisa y
+        sólo se dejan de medir los dibujos; las fases de `update` siguen.
+        """
+        if not self.enabled:
+            return animation
+        post_draw = getattr(animation, '_post_draw', None)
+        if not callable(post_draw):
+            warnings.warn(f"FuncAnimation no tiene _post_draw en esta versión de matplotlib: "
+                          f"la fase '{name}' no se mide", RuntimeWarning, stacklevel=2)
+            return animation
+
+        def timed_post_draw(*args):
+            with self.phase(name):
+                return post_draw(*args)
+
+        animation._post_draw = timed_post_draw
+        return animation
+
+    def add_overlay(self, ax):
+        """Muestra los percentiles en una esquina de `ax`."""
+        if self.enabled:
+            self.overlay = ax.text(0.01, 0.99, '', transform=ax.transAxes, ha='left', va='top',
+                                   family='monospace', fontsize=8, color='white', zorder=10)
+        return self.overlay
+
+    def tick(self):
+        """
+        Cierra un frame y refresca el texto en pantalla cada `overlay_every` frames.
+
+        Returns:
+            tuple: Artistas que `update` debe devolver además de los suyos (para blit).
+        """
+        if not self.enabled:
+            return ()
+        self.frames += 1
+        if self.overlay is None:
+            return ()
+        if self.frames % self.overlay_every == 0:
+            self.overlay.set_text(self.format())
+        return (self.overlay,)
+
+    def summary(self):
+        """
+        Percentiles móviles de cada fase.
+
+        Returns:
+            dict: fase -> {'p50', 'p95', 'p99', 'mean'} en milisegundos, más
+            'alloc_kb' (mediana) si se miden reservas.
+        """
+        stats = {}
+        for name, durations in self.durations.items():
+            ms = np.fromiter(durations, dtype=float, count=len(durations)) * 1e3
+            p50, p95, p99 = np.percentile(ms, (50, 95, 99))
+            stats[name] = {'p50': p50, 'p95': p95, 'p99': p99, 'mean': ms.mean()}
+            if self.allocations[name]:
+                stats[name]['alloc_kb'] = float(np.median(self.allocations[name])) / 1024
+        return stats
+
+    def format(self):
+        """Tabla de texto con los percentiles de cada fase."""
+        lines = [f"{'fase':<10}{'p50':>7}{'p95':>7}{'p99':>7} ms"]
+        for name, stats in self.summary().items():
+            line = f"{name:<10}{stats['p50']:7.1f}{stats['p95']:7.1f}{stats['p99']:7.1f}"
+            if 'alloc_kb' in stats:
+                line += f"{stats['alloc_kb']:9.0f} KB"
+            lines.append(line)
+        return '\n'.join(lines)
+
+    def save_trace(self, path):
+        """Exporta los eventos en formato de traza de Chrome (JSON)."""
+        pid = os.getpid()
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': 'update'}}]
+        for name, start, duration, allocated in self.events:
+            event = {'name': name, 'ph': 'X', 'pid': pid, 'tid': 0,
+                     'ts': (start - self._origin) * 1e6, 'dur': duration * 1e6}
+            if allocated is not None:
+                event['args'] = {'allocated_bytes': allocated}
+            events.append(event)
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
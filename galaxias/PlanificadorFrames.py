@@ -0,0 +1,232 @@
+import json
+import time
+import warnings
+from collections import deque
+
+# Niveles de calidad, de mejor a peor: (partes, paso, cada)
+#   partes: la física de cada frame mueve 1/partes de las partículas, por turnos
+#   paso:   se dibuja una de cada `paso` partículas
+#   cada:   se redibuja uno de cada `cada` frames
+# Primero se aligera el dibujo, que es lo más caro en matplotlib; saltar frames es el último recurso.
+LEVELS = (
+    (1, 1, 1),
+    (1, 2, 1),
+    (2, 2, 1),
+    (2, 4, 1),
+    (4, 4, 1),
+    (4, 8, 2),
+    (8, 8, 3),
+)
+
+class _NoBarrier:
+    """Barrera de un solo participante para `step_partition` fuera de MotorSimulacion."""
+
+    def wait(self):
+        return 0
+
+_NO_BARRIER = _NoBarrier()
+
+class FrameScheduler:
+    """
+    Ajusta la calidad de una animación de FuncAnimation para mantener un tiempo por frame.
+
+    Mide cada frame completo (física, artistas y dibujo) con una media móvil
+    exponencial. Si el coste pasa del objetivo durante `patience_down` frames
+    seguidos, baja un nivel de `LEVELS`: primero dibuja menos puntos, luego
+    actualiza sólo una parte rotatoria de las partículas y por último salta
+    redibujados. Si sobra margen (coste por debajo de `recover` × objetivo)
+    durante `patience_up` frames, sube un nivel. Cuando una subida hay que
+    deshacerla enseguida, la espera para volver a intentarla se duplica, así
+    que la calidad no oscila en una máquina cargada.
+
+    Las partículas que no se mueven en un frame se ponen al día en su turno
+    con la velocidad multiplicada por el número de partes, así que el
+    movimiento medio no cambia.
+
+    Apagado, el nivel es siempre el de calidad completa y `step` es `scene.step`.
+
+    Args:
+        target (float): Tiempo por frame objetivo en segundos (el `interval` de FuncAnimation).
+        enabled (bool): Si es False, no se adapta nada.
+        subsets (bool): Permitir actualizar sólo una parte de las partículas
+            (no con MotorSimulacion, donde la física va en otros procesos).
+        smoothing (float): Peso de la última medida en la media del coste.
+        recover (float): Fracción del objetivo por debajo de la cual se sube de nivel.
+        patience_down (int): Frames seguidos por encima del objetivo antes de bajar.
+        patience_up (int): Frames seguidos con margen antes de subir.
+        history (int): Cambios de nivel guardados para las métricas.
+    """
+
+    def __init__(self, target=0.05, enabled=True, subsets=True, smoothing=0.2, recover=0.6,
+                 patience_down=3, patience_up=30, history=1000):
+        self.target = target
+        self.enabled = enabled
+        self.smoothing = smoothing
+        self.recover = recover
+        self.patience_down = patience_down
+        self.patience_up = patience_up
+
+        # Sin subconjuntos, los niveles que sólo se diferencian en las partes se funden
+        levels = []
+        for parts, stride, every in LEVELS:
+            level = (parts if subsets else 1, stride, every)
+            if not levels or levels[-1] != level:
+                levels.append(level)
+        self.levels = tuple(levels)
+
+        self.level = 0
+        self.cost = None
+        self.frame = 0
+        self.drawn = 0
+        self.skipped = 0
+        self.changed = False
+        self.draw = True
+        self.changes = deque(maxlen=history)
+        self.frames_per_level = [0] * len(self.levels)
+        self._over = 0
+        self._under = 0
+        self._backoff = patience_up
+        self._raised_at = None
+        self._start = time.perf_counter()
+
+    @property
+    def update_parts(self):
+        """Partes en que se reparte la física: cada frame mueve una de ellas."""
+        return self.levels[self.level][0]
+
+    @property
+    def draw_stride(self):
+        """Se dibuja una de cada `draw_stride` partículas."""
+        return self.levels[self.level][1]
+
+    @property
+    def draw_every(self):
+        """Se redibuja uno de cada `draw_every` frames."""
+        return self.levels[self.level][2]
+
+    def instrument(self, animation):
+        """
+        Mide cada frame de `animation` y salta los redibujados que decida el nivel.
+
+        Envuelve `_draw_next_frame`: en los frames sin dibujo se llama a
+        `update` (la física sigue) pero no se limpia ni se dibuja nada, así que
+        en pantalla queda el último frame dibujado.
+
+        Son métodos privados de matplotlib: si la versión instalada no los
+        tiene, se avisa y el planificador se apaga (calidad completa siempre).
+        """
+        if not self.enabled:
+            return animation
+        if not all(callable(getattr(animation, name, None)) for name in ('_draw_next_frame', '_draw_frame')):
+            warnings.warn("FuncAnimation no tiene _draw_next_frame/_draw_frame en esta versión de matplotlib: "
+                          "la calidad adaptativa queda desactivada", RuntimeWarning, stacklevel=2)
+            self.enabled = False
+            return animation
+        draw_next_frame = animation._draw_next_frame
+
+        def scheduled_draw_next_frame(framedata, blit):
+            start = time.perf_counter()
+            if self.draw:
+                draw_next_frame(framedata, blit)
+            else:
+                animation._draw_frame(framedata)
+            self.record(time.perf_counter() - start)
+
+        animation._draw_next_frame = scheduled_draw_next_frame
+        return animation
+
+    def record(self, duration):
+        """Añade el coste de un frame (segundos) y decide el nivel del siguiente."""
+        self.frame += 1
+        self.frames_per_level[self.level] += 1
+        if self.draw:
+            self.drawn += 1
+        else:
+            self.skipped += 1
+        self.cost = duration if self.cost is None else self.smoothing * duration + (1 - self.smoothing) * self.cost
+
+        # Una subida que aguanta `patience_up` frames devuelve la espera a la normal
+        if self._raised_at is not None and self.frame - self._raised_at >= self.patience_up:
+            self._backoff = self.patience_up
+            self._raised_at = None
+
+        previous = self.level
+        if self.cost > self.target:
+            self._under = 0
+            self._over += 1
+            if self._over >= self.patience_down and self.level < len(self.levels) - 1:
+                # Una subida que no aguanta `patience_up` frames retrasa la siguiente
+                if self._raised_at is not None:
+                    self._backoff = min(self._backoff * 2, 100 * self.patience_up)
+                self._raised_at = None
+                self.level += 1
+        elif self.cost < self.recover * self.target:
+            self._over = 0
+            self._under += 1
+            if self._under >= self._backoff and self.level > 0:
+                self.level -= 1
+                self._raised_at = self.frame
+        else:
+            self._over = self._under = 0
+
+        self.changed = self.level != previous
+        if self.changed:
+            self._over = self._under = 0
+            self.cost = None
+            self.changes.append((time.perf_counter() - self._start, self.frame, previous, self.level, duration))
+        self.draw = self.frame % self.draw_every == 0
+
+    def step(self, scene, *params):
+        """
+        Avanza la física de `scene` un frame según el nivel actual.
+
+        `params` son los de `scene.step_params`; con calidad completa se
+        llama a `scene.step(params[0])`, y si no, `scene.step_partition` mueve
+        la parte que toca con la velocidad multiplicada por el número de partes.
+        """
+        parts = self.update_parts
+        if parts == 1:
+            scene.step(params[0])
+            return
+        part = self.frame % parts
+        scene.step_partition((params[0] * parts,) + tuple(params[1:]), part, parts, _NO_BARRIER)
+
+    def decimate(self, array):
+        """Vista de una de cada `draw_stride` filas de `array`."""
+        stride = self.draw_stride
+        return array if stride == 1 else array[::stride]
+
+    def metrics(self):
+        """
+        Estado y decisiones del planificador.
+
+        Returns:
+            dict: nivel actual y sus decisiones, coste medio y objetivo en ms,
+            frames dibujados y saltados, frames en cada nivel y los últimos
+            cambios de nivel (segundos, frame, nivel anterior, nivel nuevo, coste en ms).
+        """
+        return {
+            'level': self.level,
+            'update_fraction': 1 / self.update_parts,
+            'draw_fraction': 1 / self.draw_stride,
+            'draw_every': self.draw_every,
+            'cost_ms': None if self.cost is None else self.cost * 1e3,
+            'target_ms': self.target * 1e3,
+            'frames': self.frame,
+            'drawn': self.drawn,
+            'skipped': self.skipped,
+            'frames_per_level': dict(enumerate(self.frames_per_level)),
+            'changes': [{'seconds': t, 'frame': frame, 'from': old, 'to': new, 'cost_ms': cost * 1e3}
+                        for t, frame, old, new, cost in self.changes],
+        }
+
+    def format(self):
+        """Resumen de una línea de las decisiones actuales."""
+        cost = '  -- ' if self.cost is None else f"{self.cost * 1e3:5.1f}"
+        return (f"nivel {self.level}  {cost}/{self.target * 1e3:.0f} ms  física 1/{self.update_parts}  "
+                f"puntos 1/{self.draw_stride}  dibujo 1/{self.draw_every}")
+
+    def save_metrics(self, path):
+        """Guarda `metrics()` en un archivo JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.metrics(), f, indent=2)
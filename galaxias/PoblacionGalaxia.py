@@ -0,0 +1,91 @@
+import numpy as np
+
+# Flujos de números aleatorios, uno por magnitud generada
+_R, _THETA, _ACCEPT, _OFFSET, _TEMPERATURE, _SPREAD = range(6)
+
+def _draw(rng, base_state, stream, num_stars, start, count):
+    """
+    Extrae `count` uniformes [0, 1) del flujo `stream` a partir de la estrella `start`.
+
+    Cada magnitud ocupa un tramo propio de la secuencia del generador
+    (stream * num_stars + índice de estrella), así que el resultado no
+    depende del tamaño de bloque con el que se genere la galaxia.
+    """
+    rng.bit_generator.state = base_state
+    rng.bit_generator.advance(stream * num_stars + start)
+    return rng.random(count)
+
+def iter_population(num_stars, galaxy_radius=10, arm_count=4, arm_width=0.5, bulge_size=3,
+                    arm_fraction=0.7, seed=None, chunk_size=1_000_000, dtype=np.float64):
+    """
+    Genera la población de estrellas de la galaxia por bloques.
+
+    Args:
+        num_stars (int): Número total de estrellas.
+        galaxy_radius (float): Radio de la galaxia.
+        arm_count (int): Número de brazos espirales.
+        arm_width (float): Semiancho angular de cada brazo (radianes).
+        bulge_size (float): Radio del bulbo; dentro no se forman brazos.
+        arm_fraction (float): Fracción de las estrellas fuera del bulbo que se
+            reúnen en su brazo más cercano; el resto queda repartido por el disco.
+        seed (int | None): Semilla del `numpy.random.Generator`.
+        chunk_size (int): Estrellas por bloque; limita la memoria usada.
+        dtype: Tipo de los arrays devueltos.
+
+    Yields:
+        tuple: (start, r, theta, temperatures) para las estrellas [start, start + len(r)).
+    """
+    rng = np.random.Generator(np.random.PCG64(seed))
+    base_state = rng.bit_generator.state
+    arm_spacing = 2 * np.pi / arm_count
+
+    for start in range(0, num_stars, chunk_size):
+        count = min(chunk_size, num_stars - start)
+
+        # Posiciones radiales y angulares
+        r = galaxy_radius * _draw(rng, base_state, _R, num_stars, start, count)
+        theta = 2 * np.pi * _draw(rng, base_state, _THETA, num_stars, start, count)
+
+        # Añadir estructura de brazos espirales: las estrellas capturadas salen de todo el
+        # sector de su brazo más cercano y se colocan a menos de arm_width de él, con más
+        # densidad en el centro (suma de dos uniformes), así que cada brazo gana estrellas
+        nearest = np.floor(theta / arm_spacing + 0.5)
+        arm = (nearest % arm_count) * arm_spacing
+
+        in_arm = r > bulge_size
+        in_arm &= _draw(rng, base_state, _ACCEPT, num_stars, start, count) < arm_fraction
+        offset = (_draw(rng, base_state, _OFFSET, num_stars, start, count)
+                  + _draw(rng, base_state, _SPREAD, num_stars, start, count) - 1)
+        theta = np.where(in_arm, np.mod(arm + arm_width * offset, 2 * np.pi), theta)
+
+        # Temperaturas estelares (en Kelvin)
+        # Más calientes cerca del centro, más frías en los brazos
+        temperatures = 3000 + 27000 * _draw(rng, base_state, _TEMPERATURE, num_stars, start, count)
+        temperatures = temperatures * (1 - 0.5 * r / galaxy_radius) + 3000 * (r / galaxy_radius)
+
+        yield start, r.astype(dtype, copy=False), theta.astype(dtype, copy=False), temperatures.astype(dtype, copy=False)
+
+def generate_population(num_stars, galaxy_radius=10, arm_count=4, arm_width=0.5, bulge_size=3,
+                        arm_fraction=0.7, seed=None, chunk_size=1_000_000, dtype=np.float64):
+    """
+    Genera la población completa de estrellas en arrays preasignados.
+
+    Acepta los mismos argumentos que `iter_population`; con la misma semilla
+    el resultado es idéntico bit a bit sea cual sea `chunk_size`.
+
+    Returns:
+        tuple: Arrays r, theta y temperatures de longitud `num_stars`.
+    """
+    r = np.empty(num_stars, dtype=dtype)
+    theta = np.empty(num_stars, dtype=dtype)
+    temperatures = np.empty(num_stars, dtype=dtype)
+
+    for start, r_chunk, theta_chunk, temp_chunk in iter_population(
+            num_stars, galaxy_radius, arm_count, arm_width, bulge_size,
+            arm_fraction, seed, chunk_size, dtype):
+        stop = start + len(r_chunk)
+        r[start:stop] = r_chunk
+        theta[start:stop] = theta_chunk
+        temperatures[start:stop] = temp_chunk
+
+    return r, theta, temperatures
@@ -0,0 +1,168 @@
+import numpy as np
+
+class ParticlePool:
+    """
+    Partículas de capacidad fija guardadas como estructura de arrays.
+
+    Cada campo es un array de `capacity` filas que no cambia de tamaño:
+    nacer y morir sólo marca huecos, así que la memoria y el coste de cada
+    frame son los mismos al minuto que a las diez horas. Además de los campos
+    pedidos, todo pool tiene `alive`, `age` y `lifetime`; una partícula
+    retirada queda con age = lifetime, de modo que cualquier curva de
+    aparición o desvanecimiento basada en la edad la deja invisible.
+
+    Los huecos libres son los de `alive` a False. Todas las operaciones
+    aceptan un tramo de índices (`index`), así que cada parte de
+    MotorSimulacion nace, envejece y retira sólo en su tramo, sin compartir
+    una pila de huecos entre procesos.
+
+    Args:
+        capacity (int): Número máximo de partículas.
+        **fields: nombre -> dtype o (dtype, forma extra), p. ej. offsets=(float, (2,)).
+    """
+
+    def __init__(self, capacity, **fields):
+        self.capacity = capacity
+        self.columns = {}
+        for name, spec in fields.items():
+            dtype, shape = spec if isinstance(spec, tuple) else (spec, ())
+            self.columns[name] = np.zeros((capacity,) + tuple(shape), dtype=dtype)
+        self.columns['alive'] = np.zeros(capacity, dtype=bool)
+        self.columns['age'] = np.zeros(capacity)
+        self.columns['lifetime'] = np.zeros(capacity)
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Pool sobre arrays ya existentes (por ejemplo, de una instantánea)."""
+        pool = cls.__new__(cls)
+        pool.columns = dict(columns)
+        pool.capacity = len(next(iter(pool.columns.values())))
+        return pool
+
+    def __copy__(self):
+        # Copia con su propio diccionario: reemplazar una columna no afecta al original
+        pool = self.__class__.__new__(self.__class__)
+        pool.capacity = self.capacity
+        pool.columns = dict(self.columns)
+        return pool
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __setitem__(self, name, array):
+        self.columns[name] = array
+
+    def count(self, index=slice(None)):
+        """Partículas vivas en el tramo `index`."""
+        return int(np.count_nonzero(self.columns['alive'][index]))
+
+    def free_slots(self, index=slice(None), limit=None):
+        """Índices absolutos de los huecos libres del tramo `index` (como mucho `limit`)."""
+        start = index.indices(self.capacity)[0]
+        slots = np.flatnonzero(~self.columns['alive'][index])
+        if limit is not None:
+            slots = slots[:limit]
+        return slots + start
+
+    def spawn(self, count, lifetime, index=slice(None), **values):
+        """
+        Hace nacer hasta `count` partículas en los huecos libres del tramo `index`.
+
+        Args:
+            count (int): Partículas pedidas; si no hay huecos nacen menos.
+            lifetime (float | np.ndarray): Vida de cada partícula nueva.
+            index (slice): Tramo donde buscar huecos.
+            **values: campo -> valor escalar o array de `count` filas.
+
+        Returns:
+            np.ndarray: Índices de las partículas nacidas.
+        """
+        slots = self.free_slots(index, count)
+        n = len(slots)
+        if n == 0:
+            return slots
+        for name, value in (('lifetime', lifetime),) + tuple(values.items()):
+            value = np.asarray(value)
+            self.columns[name][slots] = value[:n] if value.ndim and len(value) == count else value
+        self.columns['age'][slots] = 0
+        self.columns['alive'][slots] = True
+        return slots
+
+    def retire(self, slots, index=slice(None)):
+        """Retira las partículas `slots` (índices o máscara relativos al tramo `index`) y deja sus huecos libres."""
+        self.columns['alive'][index][slots] = False
+        self.columns['age'][index][slots] = self.columns['lifetime'][index][slots]
+
+    def advance_age(self, amount, index=slice(None)):
+        """
+        Envejece el tramo `index` y retira las partículas que cumplen su vida.
+
+        Returns:
+            int: Partículas retiradas.
+        """
+        age, alive = self.columns['age'][index], self.columns['alive'][index]
+        age += amount
+        expired = alive & (age >= self.columns['lifetime'][index])
+        retired = int(np.count_nonzero(expired))
+        if retired:
+            alive[expired] = False
+        return retired
+
+    def lifetime_fraction(self, index=slice(None), out=None):
+        """Edad relativa age / lifetime del tramo `index` (1 o más para los huecos libres)."""
+        return np.divide(self.columns['age'][index], self.columns['lifetime'][index], out=out)
+
+class PoolColumn:
+    """
+    Atributo de clase que lee y escribe un campo de uno de los pools del objeto.
+
+    Example:
+        stars_age = PoolColumn('stars', 'age')  # self.stars_age es self.stars['age']
+    """
+
+    def __init__(self, pool, field):
+        self.pool = pool
+        self.field = field
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return getattr(obj, self.pool).columns[self.field]
+
+    def __set__(self, obj, value):
+        getattr(obj, self.pool).columns[self.field] = value
+
+class Emitter:
+    """
+    Fuente continua de partículas para un ParticlePool.
+
+    Cada llamada hace nacer, en promedio, `rate` partículas por unidad de
+    edad transcurrida (Poisson), con los campos que devuelve `make`.
+
+    Args:
+        rate (float): Partículas por unidad de edad en todo el pool.
+        make (callable): make(rng, n) -> dict campo -> array de n filas.
+        lifetime (tuple): (mínimo, máximo) de la vida de las partículas nuevas.
+    """
+
+    def __init__(self, rate, make, lifetime):
+        self.rate = rate
+        self.make = make
+        self.lifetime = lifetime
+
+    def emit(self, pool, elapsed, rng, index=slice(None)):
+        """
+        Hace nacer las partículas de `elapsed` unidades de edad en el tramo `index`.
+
+        El ritmo se reparte en proporción al tamaño del tramo.
+
+        Returns:
+            np.ndarray: Índices de las partículas nacidas.
+        """
+        start, stop, _ = index.indices(pool.capacity)
+        expected = self.rate * elapsed * (stop - start) / pool.capacity
+        count = min(int(rng.poisson(expected)) if expected > 0 else 0, stop - start)
+        if count == 0:
+            return np.empty(0, dtype=np.intp)
+        lifetime = rng.uniform(*self.lifetime, count)
+        return pool.spawn(count, lifetime, index, **self.make(rng, count))
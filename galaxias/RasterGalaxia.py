@@ -0,0 +1,124 @@
+import argparse
+import time
+
+import numpy as np
+
+def _pixel_index(x, y, width, height, extent):
+    """Índices planos de píxel (fila 0 arriba) de los puntos dentro de `extent`."""
+    x0, x1, y0, y1 = extent
+    col = np.floor((np.asarray(x) - x0) * (width / (x1 - x0))).astype(np.int64)
+    row = np.floor((np.asarray(y) - y0) * (height / (y1 - y0))).astype(np.int64)
+    inside = (col >= 0) & (col < width) & (row >= 0) & (row < height)
+    return (height - 1 - row[inside]) * width + col[inside]
+
+def accumulate(counts, x, y, extent, chunk_size=1_000_000):
+    """
+    Suma en `counts` (alto, ancho) el número de estrellas que caen en cada píxel.
+
+    Los puntos se procesan en bloques de `chunk_size`, así que la memoria
+    extra es la de un bloque y no la de todas las estrellas.
+    """
+    height, width = counts.shape
+    flat = counts.reshape(-1)
+    for start in range(0, len(x), chunk_size):
+        idx = _pixel_index(x[start:start + chunk_size], y[start:start + chunk_size], width, height, extent)
+        flat += np.bincount(idx, minlength=flat.size)
+    return counts
+
+def composite(image, counts, color, alpha, gain=1.0):
+    """
+    Añade una población a `image` (alto, ancho, 3) con alfa aditivo.
+
+    Un píxel con n estrellas de opacidad `alpha` queda cubierto en
+    1 - (1 - alpha)**(n * gain), lo mismo que superponer n puntos
+    semitransparentes. Con gain='auto' la exposición se ajusta para que el
+    percentil 99 de los píxeles ocupados no llegue a saturar.
+    """
+    from matplotlib.colors import to_rgb
+
+    if gain == 'auto':
+        occupied = counts[counts > 0]
+        gain = np.log(0.05) / (np.percentile(occupied, 99) * np.log(1 - alpha)) if len(occupied) else 1.0
+    coverage = 1 - np.power(np.float32(1 - alpha), counts * np.float32(gain), dtype=np.float32)
+    image += coverage[..., None] * np.asarray(to_rgb(color), dtype=np.float32)
+    return image
+
+def rasterize(populations, width=1024, height=1024, extent=None, chunk_size=1_000_000, gain=1.0):
+    """
+    Rasteriza poblaciones de estrellas directamente en una imagen RGB.
+
+    El coste de dibujo depende del número de píxeles y no del de estrellas:
+    cada población se acumula en un histograma 2D y se compone una sola vez.
+
+    Args:
+        populations (list): Tuplas (x, y, color, alpha) o (chunks, color, alpha),
+            donde `chunks` es un iterable de pares (x, y).
+        width (int): Ancho de la imagen en píxeles.
+        height (int): Alto de la imagen en píxeles.
+        extent (tuple | None): (x0, x1, y0, y1) del área dibujada; por defecto,
+            un cuadrado centrado que contiene todas las estrellas.
+        chunk_size (int): Estrellas procesadas a la vez.
+        gain (float | str): Exposición de `composite`; 'auto' la ajusta a la densidad.
+
+    Returns:
+        np.ndarray: Imagen float32 (alto, ancho, 3) con valores entre 0 y 1.
+    """
+    if extent is None:
+        arrays = [a for pop in populations if len(pop) == 4 for a in pop[:2] if len(a)]
+        if len(arrays) == 0:
+            raise ValueError("Se necesita `extent` para rasterizar poblaciones por bloques")
+        # Un poco más ancho (más que el redondeo de float32): la estrella más
+        # lejana caería justo fuera del último píxel
+        limit = max(float(np.max(np.abs(a))) for a in arrays) * (1 + 1e-6)
+        extent = (-limit, limit, -limit, limit)
+
+    image = np.zeros((height, width, 3), dtype=np.float32)
+    counts = np.zeros((height, width), dtype=np.int64)
+    for pop in populations:
+        counts.fill(0)
+        if len(pop) == 4:
+            x, y, color, alpha = pop
+            accumulate(counts, x, y, extent, chunk_size)
+        else:
+            chunks, color, alpha = pop
+            for x, y in chunks:
+                accumulate(counts, x, y, extent, chunk_size)
+        composite(image, counts, color, alpha, gain)
+
+    return np.clip(image, 0, 1, out=image)
+
+def save_image(path, image):
+    """Guarda una imagen RGB float (alto, ancho, 3) como PNG."""
+    import matplotlib.image as mpimg
+    mpimg.imsave(path, image)
+
+def main(argv=None):
+    """Renderiza una galaxia de GalaxiaGM con decenas de millones de estrellas en un PNG."""
+    from .GalaxiaGM import INNER, iter_galaxy_chunks
+
+    parser = argparse.ArgumentParser(description="Render de densidad de GalaxiaGM.create_galaxy")
+    parser.add_argument('output')
+    parser.add_argument('--inner', type=int, default=10_000_000, help="Estrellas del bulbo")
+    parser.add_argument('--outer', type=int, default=40_000_000, help="Estrellas de los brazos")
+    parser.add_argument('--size', type=int, default=2048, help="Lado de la imagen en píxeles")
+    parser.add_argument('--chunk', type=int, default=1_000_000, help="Estrellas generadas por bloque")
+    args = parser.parse_args(argv)
+
+    extent = (-10.5, 10.5, -10.5, 10.5)
+    inner = np.zeros((args.size, args.size), dtype=np.int64)
+    outer = np.zeros((args.size, args.size), dtype=np.int64)
+
+    start_time = time.perf_counter()
+    for chunk in iter_galaxy_chunks(args.inner, args.outer, chunk_size=args.chunk):
+        is_inner = chunk['population'] == INNER
+        accumulate(inner, chunk['x'][is_inner], chunk['y'][is_inner], extent)
+        accumulate(outer, chunk['x'][~is_inner], chunk['y'][~is_inner], extent)
+
+    image = np.zeros((args.size, args.size, 3), dtype=np.float32)
+    composite(image, inner, 'gold', 0.6, gain='auto')
+    composite(image, outer, 'cyan', 0.4, gain='auto')
+    save_image(args.output, np.clip(image, 0, 1, out=image))
+    print(f"{args.inner + args.outer} estrellas en {time.perf_counter() - start_time:.1f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .BarraCarga import BarraProgreso
+
+SCENES = ('galaxia', 'nebulosa')
+
+def _galaxy_frames(options):
+    """Figura y funciones de avance/dibujo para la rotación de GalaxiaV2."""
+    import matplotlib.pyplot as plt
+    from .EscenaGalaxia import GalaxyScene
+
+    if options['snapshot']:
+        scene = GalaxyScene.from_snapshot(options['snapshot'])
+    else:
+        scene = GalaxyScene(options['num_stars'] or 2000, seed=options['seed'])
+    radius = scene.galaxy_radius
+
+    fig, ax = plt.subplots(figsize=(8, 8), dpi=options['dpi'])
+    scatter = ax.scatter(scene.offsets[:, 0], scene.offsets[:, 1], c=scene.colors(options['filter']),
+                         s=scene.sizes, alpha=0.8, edgecolors='none')
+    ax.set_xlim(-radius * 1.2, radius * 1.2)
+    ax.set_ylim(-radius * 1.2, radius * 1.2)
+    ax.set_title('Simulación de Galaxia con Filtros de Color', pad=20)
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    def advance(frames):
+        # La rotación tiene forma cerrada: saltar N frames cuesta lo mismo que uno
+        scene.step(options['speed'], frames)
+
+    def draw():
+        scatter.set_offsets(scene.offsets)
+
+    return fig, advance, draw
+
+def _nebula_frames(options):
+    """Figura y funciones de avance/dibujo para la animación de Nebulosa."""
+    import matplotlib.pyplot as plt
+    from .EscenaNebulosa import NebulaScene
+
+    if options['snapshot']:
+        scene = NebulaScene.from_snapshot(options['snapshot'])
+    else:
+        scene = NebulaScene(options['num_stars'] or 3000, options['num_nebula_particles'] or 2000, seed=options['seed'])
+    size = scene.simulation_size
+    speed = options['speed'] * (3.8 if options['boost'] else 1.0)
+    if options['push'] is not None:
+        scene.interaction_strength = options['push']
+
+    stars_colors, nebula_colors = scene.initial_colors()
+    fig, ax = plt.subplots(figsize=(8, 8), dpi=options['dpi'])
+    stars_scatter = ax.scatter(scene.stars_offsets[:, 0], scene.stars_offsets[:, 1], c=stars_colors,
+                               s=scene.stars_size, alpha=0.9, edgecolors='none')
+    nebula_scatter = ax.scatter(scene.nebula_x, scene.nebula_y, c=nebula_colors,
+                                s=scene.nebula_size, alpha=scene.nebula_alpha_adjusted, edgecolors='none')
+    ax.set_xlim(-size * 1.5, size * 1.5)
+    ax.set_ylim(-size * 1.5, size * 1.5)
+    ax.set_title('Nebulosa con Estrellas - Simulación', pad=20)
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    def advance(frames):
+        # El ruido de cada frame está sembrado con su número: avanzar sólo la física reproduce el estado
+        for _ in range(frames):
+            scene.step(speed)
+
+    def draw():
+        stars_changed, nebula_changed = scene.update_colors(options['color_balance'])
+        if stars_changed:
+            stars_scatter.set_color(scene.stars_colors)
+        if nebula_changed:
+            nebula_scatter.set_color(scene.nebula_colors)
+        stars_scatter.set_offsets(scene.stars_offsets)
+        stars_scatter.set_alpha(scene.stars_alpha)
+        stars_scatter.set_sizes(scene.stars_size_adjusted)
+        nebula_scatter.set_offsets(scene.nebula_offsets)
+        nebula_scatter.set_alpha(scene.nebula_alpha_adjusted)
+        nebula_scatter.set_sizes(scene.nebula_size)
+
+    return fig, advance, draw
+
+_BUILDERS = {'galaxia': _galaxy_frames, 'nebulosa': _nebula_frames}
+
+def frame_path(out_dir, index):
+    return os.path.join(out_dir, f'frame_{index:05d}.png')
+
+def render_range(scene, start, stop, out_dir, options):
+    """
+    Renderiza los frames [start, stop) de una escena en PNG dentro de un proceso.
+
+    Cada proceso tiene su propia figura con el backend Agg; el estado del
+    frame `start` se obtiene avanzando la física sin dibujar.
+
+    Returns:
+        int: Número de frames escritos.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    plt.style.use('dark_background')
+    fig, advance, draw = _BUILDERS[scene](options)
+
+    # El frame i de FuncAnimation muestra el estado tras i + 1 pasos
+    advance(start)
+    for index in range(start, stop):
+        advance(1)
+        draw()
+        fig.savefig(frame_path(out_dir, index), facecolor=fig.get_facecolor())
+    plt.close(fig)
+    return stop - start
+
+def render(scene, frames, out_dir, workers=None, chunks_per_worker=4, **options):
+    """
+    Renderiza `frames` frames de una escena en PNG repartidos en un pool de procesos.
+
+    Args:
+        scene (str): 'galaxia' (rotación de GalaxiaV2) o 'nebulosa'.
+        frames (int): Número de frames a renderizar.
+        out_dir (str): Carpeta de salida para frame_00000.png, frame_00001.png, ...
+        workers (int | None): Procesos del pool; por defecto, uno por núcleo.
+        chunks_per_worker (int): Tramos contiguos de frames por proceso, para repartir la carga.
+        **options: num_stars, num_nebula_particles, seed, snapshot, speed, dpi, filter, color_balance, boost, push.
+
+    Returns:
+        float: Segundos empleados.
+    """
+    if scene not in _BUILDERS:
+        raise ValueError(f"Escena desconocida: {scene!r} (opciones: {', '.join(SCENES)})")
+    options = {'num_stars': None, 'num_nebula_particles': None, 'seed': 42, 'snapshot': None, 'speed': 0.02, 'dpi': 100, 'filter': 'Visible',
+               'color_balance': 0.5, 'boost': False, 'push': None, **options}
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(out_dir, exist_ok=True)
+
+    num_chunks = max(1, min(frames, workers * chunks_per_worker))
+    bounds = [frames * i // num_chunks for i in range(num_chunks + 1)]
+
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool, BarraProgreso(total=frames, unidad='frames') as barra:
+        futures = [pool.submit(render_range, scene, bounds[i], bounds[i + 1], out_dir, options)
+                   for i in range(num_chunks)]
+        for future in as_completed(futures):
+            barra.avanzar(future.result())
+    return time.perf_counter() - start_time
+
+def encode_video(out_dir, video_path, fps=20):
+    """Une la secuencia de PNG en un vídeo con ffmpeg."""
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None:
+        raise RuntimeError("No se encontró ffmpeg para codificar el vídeo")
+    subprocess.run([ffmpeg, '-y', '-loglevel', 'error', '-framerate', str(fps),
+                    '-i', os.path.join(out_dir, 'frame_%05d.png'),
+                    '-pix_fmt', 'yuv420p', video_path], check=True)
+
+def main(argv=None):
+    """Exporta frames de las animaciones sin ventana (backend Agg)."""
+    parser = argparse.ArgumentParser(description="Render sin pantalla de las animaciones de galaxias")
+    parser.add_argument('scene', choices=SCENES)
+    parser.add_argument('--frames', type=int, default=200)
+    parser.add_argument('--out', help="Carpeta de PNG (por defecto, temporal si se pide --video)")
+    parser.add_argument('--video', help="Archivo de vídeo de salida (requiere ffmpeg)")
+    parser.add_argument('--fps', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--stars', type=int, default=None, dest='num_stars')
+    parser.add_argument('--gas', type=int, default=None, dest='num_nebula_particles',
+                        help="Partículas de nebulosa (por defecto, 2000)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--snapshot', help="Instantánea de la escena (SnapshotGalaxia) en lugar de generarla")
+    parser.add_argument('--speed', type=float, default=0.02)
+    parser.add_argument('--dpi', type=int, default=100)
+    parser.add_argument('--filter', default='Visible')
+    parser.add_argument('--color-balance', type=float, default=0.5)
+    parser.add_argument('--boost', action='store_true')
+    parser.add_argument('--push', type=float, default=None,
+                        help="Empuje estelar de la nebulosa (por defecto, el de la escena, como en la ventana)")
+    args = parser.parse_args(argv)
+
+    if args.out is None and args.video is None:
+        parser.error("Indica --out, --video o ambos")
+
+    options = dict(num_stars=args.num_stars, num_nebula_particles=args.num_nebula_particles, seed=args.seed,
+                   snapshot=args.snapshot, speed=args.speed, dpi=args.dpi, filter=args.filter,
+                   color_balance=args.color_balance, boost=args.boost, push=args.push)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = args.out or tmp
+        elapsed = render(args.scene, args.frames, out_dir, args.workers, **options)
+        print(f"{args.frames} frames en {elapsed:.1f} s ({args.frames / elapsed:.1f} frames/s)")
+        if args.video:
+            encode_video(out_dir, args.video, args.fps)
+            print(f"Vídeo guardado en {args.video}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import json
+import struct
+
+import numpy as np
+
+# Formato de instantánea:
+#   MAGIC (8 bytes) | longitud de la cabecera (uint32 little-endian) | cabecera JSON
+#   | columnas binarias contiguas, cada una alineada a ALIGNMENT bytes
+# La cabecera guarda dtype, forma y posición de cada columna y los atributos
+# escalares de la escena, así que cada columna se abre con numpy.memmap sin copiarla.
+MAGIC = b'GALSNAP1'
+ALIGNMENT = 64
+_PREFIX = struct.Struct('<8sI')
+
+def _align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+def save_snapshot(path, columns, **attrs):
+    """
+    Guarda columnas de arrays y atributos escalares en un archivo de instantánea.
+
+    Args:
+        path (str): Archivo de salida.
+        columns (dict): Nombre -> array (se guarda en orden C).
+        **attrs: Atributos serializables en JSON (radio, semilla, frame, ...).
+    """
+    columns = {name: np.ascontiguousarray(array) for name, array in columns.items()}
+
+    # La cabecera incluye las posiciones de las columnas, que dependen de su propio tamaño:
+    # se repite hasta que la cabecera escrita es exactamente la que describe esas posiciones
+    layout = {}
+    header = b''
+    while True:
+        offset = _align(_PREFIX.size + len(header))
+        for name, array in columns.items():
+            layout[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+            offset = _align(offset + array.nbytes)
+        new_header = json.dumps({'version': 1, 'attrs': attrs, 'columns': layout}).encode()
+        if new_header == header:
+            break
+        header = new_header
+
+    with open(path, 'wb') as f:
+        f.write(_PREFIX.pack(MAGIC, len(header)))
+        f.write(header)
+        for name, array in columns.items():
+            f.seek(layout[name]['offset'])
+            array.tofile(f)
+        f.truncate(offset)
+
+def read_header(path):
+    """Devuelve la cabecera (dict con 'attrs' y 'columns') de una instantánea."""
+    with open(path, 'rb') as f:
+        magic, length = _PREFIX.unpack(f.read(_PREFIX.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} no es una instantánea de galaxia")
+        return json.loads(f.read(length))
+
+def load_snapshot(path, mode='r'):
+    """
+    Abre una instantánea sin copiar los datos.
+
+    Args:
+        path (str): Archivo de instantánea.
+        mode (str): Modo de numpy.memmap; 'r' sólo lectura, 'c' copia al escribir
+            (los cambios quedan en memoria y el archivo no se toca).
+
+    Returns:
+        tuple: (columns, attrs), con columns un dict nombre -> numpy.memmap.
+    """
+    header = read_header(path)
+    columns = {}
+    for name, info in header['columns'].items():
+        dtype, shape = np.dtype(info['dtype']), tuple(info['shape'])
+        if np.prod(shape) == 0:
+            # mmap no admite regiones vacías
+            columns[name] = np.empty(shape, dtype=dtype)
+        else:
+            columns[name] = np.memmap(path, dtype=dtype, mode=mode, offset=info['offset'], shape=shape)
+    return columns, header['attrs']
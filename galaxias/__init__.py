@@ -0,0 +1,49 @@
+"""
+Simulaciones y renders de galaxias y nebulosas.
+
+Importar el paquete no carga NumPy, matplotlib ni pygame: cada nombre de
+`__all__` se importa de su módulo la primera vez que se usa, así que los
+trabajos por lotes sólo pagan lo que necesitan. Todos los generadores son
+funciones sin efectos: no dibujan, no leen argumentos y no tocan el
+estado aleatorio global.
+
+    from galaxias import create_galaxy, rasterize
+
+La línea de órdenes única es `python -m galaxias` (ver galaxias.cli).
+"""
+import importlib
+
+# Nombre público -> módulo del paquete que lo define
+_EXPORTS = {
+    'BarraProgreso': 'BarraCarga',
+    'FrameProfiler': 'PerfilFrames',
+    'FrameScheduler': 'PlanificadorFrames',
+    'GalaxyScene': 'EscenaGalaxia',
+    'NebulaScene': 'EscenaNebulosa',
+    'NBodySimulation': 'BarnesHut',
+    'SimulationEngine': 'MotorSimulacion',
+    'create_galaxy': 'GalaxiaGM',
+    'iter_galaxy_chunks': 'GalaxiaGM',
+    'filter_colors': 'ColorEstelar',
+    'generar_brazos': 'GalaxiaGPT',
+    'generar_bulbo': 'GalaxiaGPT',
+    'generate_population': 'PoblacionGalaxia',
+    'generate_spiral': 'GalaxiaCP',
+    'load_snapshot': 'SnapshotGalaxia',
+    'rasterize': 'RasterGalaxia',
+    'render_field': 'GalaxiaDS',
+    'save_snapshot': 'SnapshotGalaxia',
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,7 @@
+import sys
+
+from .cli import main
+
+# Las ayudas de los módulos de destino muestran la orden real en lugar de __main__.py
+sys.argv[0] = 'python -m galaxias'
+main()
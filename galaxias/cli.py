@@ -0,0 +1,69 @@
+import argparse
+import importlib
+import sys
+
+# Escena -> salida -> (módulo, argumentos que se anteponen a los del usuario).
+# La primera salida de cada escena es la predeterminada.
+SCENES = {
+    'galaxia': {
+        'ventana': ('GalaxiaV2', ()),
+        'frames': ('RenderHeadless', ('galaxia',)),
+        'pygame': ('EstrellasPygame', ('galaxia',)),
+    },
+    'nebulosa': {
+        'ventana': ('Nebulosa', ()),
+        'frames': ('RenderHeadless', ('nebulosa',)),
+        'pygame': ('EstrellasPygame', ('nebulosa',)),
+    },
+    'andromeda': {
+        'ventana': ('GalaxiaGM', ()),
+        'png': ('RasterGalaxia', ()),
+    },
+    'espiral': {'ventana': ('GalaxiaCP', ())},
+    'campo': {'ventana': ('GalaxiaDS', ())},
+    'brazos': {'ventana': ('GalaxiaGPT', ())},
+}
+
+# Herramientas por lotes que no dibujan una escena
+TOOLS = {
+    'barrido': 'BarridoParametros',
+    'benchmark': 'BenchmarkGalaxia',
+}
+
+def build_parser():
+    """Parser de `python -m galaxias`: una suborden por escena y por herramienta."""
+    parser = argparse.ArgumentParser(
+        prog='python -m galaxias',
+        description="Escenas de galaxias y nebulosas. Los argumentos que siguen a la escena "
+                    "pasan al módulo que la dibuja (usa -h después de la escena para verlos).")
+    commands = parser.add_subparsers(dest='command', required=True, metavar='orden')
+    for scene, outputs in SCENES.items():
+        # Sin -h propio: la ayuda de la escena es la del módulo de destino
+        sub = commands.add_parser(scene, add_help=False, allow_abbrev=False,
+                                  help=f"salidas: {', '.join(outputs)}")
+        sub.add_argument('--output', '-o', choices=tuple(outputs), default=next(iter(outputs)),
+                         help="Dónde se muestra la escena")
+    for tool, module in TOOLS.items():
+        commands.add_parser(tool, add_help=False, help=f"herramienta de {module}")
+    return parser
+
+def resolve(argv):
+    """
+    Módulo y argumentos que corresponden a una línea de órdenes, sin importar nada más.
+
+    Returns:
+        tuple: (nombre del módulo, lista de argumentos para su main).
+    """
+    args, rest = build_parser().parse_known_args(argv)
+    if args.command in TOOLS:
+        return TOOLS[args.command], rest
+    module, prefix = SCENES[args.command][args.output]
+    return module, [*prefix, *rest]
+
+def main(argv=None):
+    """Elige la escena y la salida y ejecuta el main del módulo; sólo se importa ese módulo."""
+    module, args = resolve(sys.argv[1:] if argv is None else argv)
+    importlib.import_module(f'.{module}', __package__).main(args)
+
+if __name__ == "__main__":
+    main()
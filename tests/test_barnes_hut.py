@@ -0,0 +1,141 @@
+import threading
+
+import numpy as np
+import pytest
+
+from galaxias.BarnesHut import NBodySimulation, QuadTree, circular_velocities
+from galaxias.EscenaGalaxia import GalaxyScene
+
+
+def direct_accelerations(x, y, mass, softening, G=1.0):
+    """Suma directa O(N²) con el mismo suavizado de Plummer."""
+    dx = x[None, :] - x[:, None]
+    dy = y[None, :] - y[:, None]
+    inv_s3 = G * mass[None, :] / (dx * dx + dy * dy + softening * softening) ** 1.5
+    return (dx * inv_s3).sum(axis=1), (dy * inv_s3).sum(axis=1)
+
+
+def uniform_disc(n, radius=10.0, seed=0):
+    rng = np.random.default_rng(seed)
+    r = radius * np.sqrt(rng.random(n))
+    angle = 2 * np.pi * rng.random(n)
+    return r * np.cos(angle), r * np.sin(angle), np.full(n, radius / n)
+
+
+def galaxy(n):
+    scene = GalaxyScene(n, seed=1)
+    return (np.array(scene.offsets[:, 0], dtype=float), np.array(scene.offsets[:, 1], dtype=float),
+            np.full(n, scene.galaxy_radius / n))
+
+
+def force_errors(x, y, mass, softening=0.05, **options):
+    """Error absoluto de cada cuerpo, en unidades de la fuerza mediana: (percentil 99, máximo)."""
+    ex, ey = direct_accelerations(x, y, mass, softening)
+    ax, ay = QuadTree(x, y, mass).accelerations(softening=softening, **options)
+    error = np.hypot(ax - ex, ay - ey) / np.median(np.hypot(ex, ey))
+    return np.percentile(error, 99), error.max()
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_uniform_disc_matches_direct_summation(seed):
+    _, worst = force_errors(*uniform_disc(3000, radius=1.0, seed=seed), theta=0.7)
+    assert worst < 0.09
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_sparse_disc_matches_direct_summation(seed):
+    # Con el suavizado pequeño frente a la separación entre cuerpos mandan los encuentros cercanos
+    p99, worst = force_errors(*uniform_disc(3000, radius=10.0, seed=seed), theta=0.7)
+    assert p99 < 0.1
+    assert worst < 0.5
+
+
+def test_galaxy_matches_direct_summation():
+    p99, worst = force_errors(*galaxy(3000), theta=0.7)
+    assert p99 < 0.15
+    assert worst < 0.4
+
+
+def test_float32_near_field_keeps_the_accuracy():
+    p99, worst = force_errors(*galaxy(3000), theta=0.7, dtype=np.float32)
+    assert p99 < 0.15
+    assert worst < 0.4
+    x, y, mass = galaxy(3000)
+    tree = QuadTree(x, y, mass)
+    exact = np.hypot(*tree.accelerations(theta=0.7))
+    single = np.hypot(*tree.accelerations(theta=0.7, dtype=np.float32))
+    np.testing.assert_allclose(single, exact, rtol=1e-4)
+
+
+@pytest.mark.parametrize('num_parts', [2, 3, 7])
+def test_parts_cover_every_body_once(num_parts):
+    x, y, mass = galaxy(4000)
+    tree = QuadTree(x, y, mass)
+    ax, ay = tree.accelerations(theta=0.7)
+    written = np.zeros(len(x), dtype=int)
+    part_x, part_y = np.zeros(len(x)), np.zeros(len(x))
+    for part in range(num_parts):
+        px, py = tree.accelerations(theta=0.7, part=part, num_parts=num_parts)
+        written += (px != 0) | (py != 0)
+        tree.accelerations(theta=0.7, part=part, num_parts=num_parts, out=(part_x, part_y))
+    assert (written == 1).all()
+    np.testing.assert_array_equal(part_x, ax)
+    np.testing.assert_array_equal(part_y, ay)
+
+
+def test_more_parts_than_groups():
+    x, y, mass = uniform_disc(20)
+    ax, ay = QuadTree(x, y, mass).accelerations(theta=0.7)
+    out = (np.zeros(20), np.zeros(20))
+    for part in range(50):
+        QuadTree(x, y, mass).accelerations(theta=0.7, part=part, num_parts=50, out=out)
+    np.testing.assert_array_equal(out[0], ax)
+    np.testing.assert_array_equal(out[1], ay)
+
+
+def _disc_simulation(n=3000):
+    x, y, mass = uniform_disc(n, seed=3)
+    vx, vy = circular_velocities(np.hypot(x, y), np.arctan2(y, x), mass)
+    return NBodySimulation(x, y, vx, vy, mass, theta=0.7)
+
+
+def test_partitioned_steps_match_the_serial_steps():
+    serial = _disc_simulation()
+    shared = _disc_simulation()
+    for _ in range(3):
+        serial.step(0.01)
+
+    # Tres partes en hilos con una barrera, como los procesos de MotorSimulacion
+    barrier = threading.Barrier(3)
+    def run(part):
+        for _ in range(3):
+            shared.step_partition(0.01, part, 3, barrier)
+            barrier.wait()
+    threads = [threading.Thread(target=run, args=(part,)) for part in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    np.testing.assert_array_equal(shared.offsets, serial.offsets)
+    np.testing.assert_array_equal(shared.vx, serial.vx)
+
+
+def test_error_shrinks_with_the_opening_angle():
+    bodies = uniform_disc(2000, seed=4)
+    errors = [force_errors(*bodies, theta=theta)[0] for theta in (0.9, 0.6, 0.3)]
+    assert errors[0] > errors[1] > errors[2]
+    assert errors[2] < 0.01
+
+
+def test_coincident_bodies():
+    # 40 cuerpos en el mismo punto caen en un solo nodo del nivel más profundo
+    x = np.r_[np.zeros(40), np.linspace(1, 2, 40)]
+    y = np.zeros(80)
+    mass = np.ones(80)
+    ex, ey = direct_accelerations(x, y, mass, 0.05)
+    ax, ay = QuadTree(x, y, mass).accelerations(theta=0.01, softening=0.05)
+    np.testing.assert_allclose(ax, ex, atol=1e-9 * np.abs(ex).max())
+    np.testing.assert_allclose(ay, ey, atol=1e-9)
+    ax, ay = QuadTree(x, y, mass).accelerations(theta=0.7, softening=0.05)
+    assert np.abs(ax - ex).max() < 0.05 * np.abs(ex).max()
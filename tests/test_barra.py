@@ -0,0 +1,59 @@
+import io
+import time
+
+import pytest
+
+from galaxias.BarraCarga import BarraProgreso
+
+
+def _sources(n):
+    return {
+        'range': range(n),
+        'list': list(range(n)),
+        'tuple': tuple(range(n)),
+        'iterator': iter(list(range(n))),
+        'generator': (i for i in range(n)),
+    }
+
+
+@pytest.mark.parametrize('kind', ['range', 'list', 'tuple', 'iterator', 'generator'])
+@pytest.mark.parametrize('n', [0, 1, 2, 3, 17, 1000, 100_003])
+def test_every_item_is_delivered_and_counted(kind, n):
+    barra = BarraProgreso(_sources(n)[kind], stream=io.StringIO())
+    assert list(barra) == list(range(n))
+    assert barra.n == n
+
+
+@pytest.mark.parametrize('kind', ['range', 'list', 'generator'])
+def test_slow_loop_counts_every_item(kind):
+    # Con un intervalo corto los bloques se redimensionan varias veces durante el recorrido
+    barra = BarraProgreso(_sources(300)[kind], intervalo=0.002, stream=io.StringIO())
+    items = []
+    for item in barra:
+        items.append(item)
+        time.sleep(0.0001)
+    assert items == list(range(300))
+    assert barra.n == 300
+
+
+def test_stepped_range():
+    barra = BarraProgreso(range(5, 1000, 7), stream=io.StringIO())
+    assert list(barra) == list(range(5, 1000, 7))
+    assert barra.n == len(range(5, 1000, 7))
+
+
+def test_break_does_not_lose_source_items():
+    fuente = iter(list(range(100)))
+    for item in BarraProgreso(fuente, stream=io.StringIO()):
+        if item == 10:
+            break
+    # El bloque en curso no se copia: la fuente sigue justo después del último elemento entregado
+    assert next(fuente) == 11
+
+
+def test_final_line_shows_the_total():
+    stream = io.StringIO()
+    for _ in BarraProgreso(range(1234), stream=stream):
+        pass
+    assert stream.getvalue().endswith('\n')
+    assert '1234/1234' in stream.getvalue().rsplit('\r', 1)[-1]
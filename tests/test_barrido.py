@@ -0,0 +1,67 @@
+import json
+import os
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.image as mpimg
+import numpy as np
+import pytest
+
+from galaxias.BarridoParametros import contact_sheet, parameter_grid, render_variant, sweep, variant_key
+
+OPTIONS = dict(num_stars_inner=300, num_stars_outer=900, size=24, seed=0)
+
+
+def test_grid_is_the_cartesian_product_in_order():
+    grid = parameter_grid(num_arms=[2, 3], arm_spread=[0.1, 0.2, 0.3])
+    assert len(grid) == 6
+    assert grid[0] == {'num_arms': 2, 'arm_spread': 0.1}
+    assert grid[-1] == {'num_arms': 3, 'arm_spread': 0.3}
+    with pytest.raises(ValueError, match='arm_count'):
+        parameter_grid(arm_count=[2])
+
+
+def test_variant_key_is_stable_and_covers_params_and_options():
+    key = variant_key({'num_arms': 2, 'arm_spread': 0.1}, OPTIONS)
+    assert key == variant_key({'arm_spread': 0.1, 'num_arms': 2}, dict(reversed(list(OPTIONS.items()))))
+    assert key != variant_key({'num_arms': 3, 'arm_spread': 0.1}, OPTIONS)
+    assert key != variant_key({'num_arms': 2, 'arm_spread': 0.1}, {**OPTIONS, 'seed': 1})
+
+
+def test_render_variant_writes_only_the_final_file(tmp_path):
+    path = str(tmp_path / 'variante.png')
+    assert render_variant({'num_arms': 3}, OPTIONS, path) == path
+    assert os.listdir(tmp_path) == ['variante.png']
+    assert mpimg.imread(path).shape[:2] == (24, 24)
+
+
+def test_contact_sheet_places_cells_by_rows(tmp_path):
+    paths = []
+    for i, value in enumerate((0.2, 0.4, 0.6)):
+        paths.append(str(tmp_path / f'{i}.png'))
+        mpimg.imsave(paths[-1], np.full((4, 4, 3), value, dtype=np.float32))
+    sheet = contact_sheet(paths, columns=2, size=4, padding=1)
+    assert sheet.shape == (2 * 5 + 1, 2 * 5 + 1, 3)
+    np.testing.assert_allclose(sheet[1:5, 6:10], 0.4, atol=1 / 255)
+    np.testing.assert_allclose(sheet[6:10, 1:5], 0.6, atol=1 / 255)
+    assert sheet[6:10, 6:10].max() == 0
+    assert sheet[0].max() == 0
+
+
+def test_sweep_reuses_computed_variants(tmp_path):
+    out = str(tmp_path)
+    first = sweep(parameter_grid(num_arms=[2, 3]), out, workers=1, **OPTIONS)
+    assert (first['computed'], first['cached']) == (2, 0)
+
+    # Ampliar la rejilla sólo calcula las variantes nuevas
+    grid = parameter_grid(num_arms=[2, 3, 4])
+    second = sweep(grid, out, workers=1, **OPTIONS)
+    assert (second['computed'], second['cached']) == (1, 2)
+
+    with open(second['index']) as f:
+        index = json.load(f)
+    assert index['columns'] == 2
+    assert [(v['row'], v['col'], v['params']) for v in index['variants']] == [
+        (0, 0, {'num_arms': 2}), (0, 1, {'num_arms': 3}), (1, 0, {'num_arms': 4})]
+    assert all(os.path.exists(os.path.join(out, 'variantes', v['key'] + '.png')) for v in index['variants'])
+    assert mpimg.imread(second['sheet']).shape[:2] == (2 * 26 + 2, 2 * 26 + 2)
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from galaxias.ColorEstelar import (FILTERS, LUT_SIZE, T_MAX, T_MIN, colors_from_index, filter_colors, filter_lut,
+                                   temperature_index, temperature_to_rgb)
+from galaxias.ColorEstelar import _FILTER_FUNCS
+
+
+def scalar_rgb(temperature):
+    """La conversión original de GalaxiaV2.0, estrella a estrella."""
+    temperature = np.clip(temperature, 1000, 40000)
+    t = (temperature - 1000) / 39000
+    r = np.clip(1.0 - 0.8 * (t - 0.1) if t > 0.1 else 1.0, 0, 1)
+    g = np.clip(1.0 - 2.0 * abs(t - 0.5), 0, 1)
+    b = np.clip(1.0 - 0.8 * (0.9 - t) if t < 0.9 else 1.0, 0, 1)
+    return (r, g, b)
+
+
+# Pendiente máxima de cada filtro (color por Kelvin)
+SLOPES = {'Visible': 2 / 39000, 'Infrarrojo': 1 / 2000, 'Ultravioleta': 1 / 38000, 'H-Alpha': 1 / 10000}
+
+
+def temperatures(n=20000):
+    return np.random.default_rng(0).uniform(500, 45000, n)
+
+
+def test_vectorized_matches_the_scalar_conversion():
+    t = temperatures(3000)
+    expected = np.array([scalar_rgb(value) for value in t])
+    np.testing.assert_allclose(temperature_to_rgb(t), expected, atol=1e-6)
+
+
+def test_keeps_the_input_shape():
+    t = temperatures(12).reshape(3, 4)
+    rgb = temperature_to_rgb(t)
+    assert rgb.shape == (3, 4, 3)
+    assert rgb.dtype == np.float32
+    np.testing.assert_array_equal(rgb[1, 2], temperature_to_rgb(t[1, 2]))
+
+
+@pytest.mark.parametrize('label', FILTERS)
+def test_lut_error_is_bounded_by_half_a_step(label):
+    t = temperatures()
+    direct = _FILTER_FUNCS[label](np.clip(t, T_MIN, T_MAX).astype(np.float32))
+    # Media entrada de la tabla por la pendiente máxima del filtro
+    bound = SLOPES[label] * (T_MAX - T_MIN) / (LUT_SIZE - 1) / 2 + 1e-6
+    assert np.abs(filter_colors(t, label) - direct).max() <= bound
+
+
+def test_index_clips_to_the_table():
+    index = temperature_index([0, T_MIN, T_MAX, 1e6])
+    assert index.dtype == np.uint16
+    assert list(index) == [0, 0, LUT_SIZE - 1, LUT_SIZE - 1]
+
+
+def test_switching_filters_reuses_the_index():
+    t = temperatures(500)
+    index = temperature_index(t)
+    for label in FILTERS:
+        np.testing.assert_array_equal(colors_from_index(index, label), filter_colors(t, label))
+
+
+def test_lut_is_cached_and_read_only():
+    lut = filter_lut('Infrarrojo')
+    assert filter_lut('Infrarrojo') is lut
+    assert lut.shape == (LUT_SIZE, 3)
+    with pytest.raises(ValueError):
+        lut[0, 0] = 1
+
+
+def test_writes_into_out():
+    t = temperatures(100)
+    out = np.empty((100, 3), dtype=np.float32)
+    assert filter_colors(t, 'Ultravioleta', out=out) is out
+    np.testing.assert_array_equal(out, filter_colors(t, 'Ultravioleta'))
+
+
+def test_unknown_filter():
+    with pytest.raises(ValueError, match='Filtro desconocido'):
+        filter_lut('Rayos X')
@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from galaxias.EscenaGalaxia import GalaxyScene
+from galaxias.EscenaNebulosa import NebulaScene
+from galaxias.EstrellasPygame import GalaxyView, NebulaView, Viewport, draw_layers, pack_colors
+
+# Constantes de pygame que usan las vistas (pygame no hace falta para probarlas)
+KEYS = SimpleNamespace(K_UP=1, K_DOWN=2, K_LEFT=3, K_RIGHT=4, K_t=5, K_LEFTBRACKET=6, K_RIGHTBRACKET=7, K_1=49)
+RGB24 = ((16, 8, 0), (0, 0, 0))
+
+
+def test_pack_colors_rgb24():
+    packed = pack_colors([[1, 0.5, 0], [0, 0, 1], [2, -1, 0.2]], *RGB24)
+    assert packed.dtype == np.uint32
+    assert list(packed) == [0xFF7F00, 0x0000FF, 0xFF0033]
+
+
+def test_pack_colors_with_losses_and_out():
+    # RGB565: 5, 6 y 5 bits
+    out = np.full(2, 0xFFFFFFFF, dtype=np.uint32)
+    packed = pack_colors([[1, 1, 1], [1, 0, 0]], (11, 5, 0), (3, 2, 3), out=out)
+    assert packed is out
+    assert list(packed) == [0xFFFF, 0xF800]
+
+
+def test_pixel_index_drops_points_outside():
+    viewport = Viewport(200, 100, radius=10)
+    assert viewport.scale == 5
+    # Medio píxel fuera por la izquierda y por abajo, y justo dentro por la derecha y por arriba
+    x = np.array([0.0, 19.9, -20.1, 0.0, 0.0])
+    y = np.array([0.0, 0.0, 0.0, 9.9, -10.1])
+    index, visible = viewport.pixel_index(x, y)
+    assert list(visible) == [True, True, False, True, False]
+    assert list(index) == [50 * 200 + 100, 50 * 200 + 199, 0 * 200 + 100]
+    _, visible = viewport.pixel_index(np.array([0.0, 0.0]), np.array([0.0, 10.1]))
+    assert list(visible) == [True, False]
+    # Todo dentro: sin máscara
+    index, visible = viewport.pixel_index(x[:2], y[:2])
+    assert visible is None
+
+
+def test_later_layers_draw_on_top():
+    viewport = Viewport(4, 4, radius=2)
+    pixels = np.zeros(16, dtype=np.uint32)
+    x = np.array([0.0, 5.0])
+    y = np.array([0.0, 0.0])
+    draw_layers(pixels, viewport, [(x, y, np.array([1, 1], dtype=np.uint32)),
+                                   (x[:1], y[:1], np.array([2], dtype=np.uint32))])
+    assert pixels[2 * 4 + 2] == 2
+    assert np.count_nonzero(pixels) == 1
+
+
+def test_galaxy_view_follows_the_scene_rotation():
+    scene = GalaxyScene(2000, seed=3)
+    view = GalaxyView(GalaxyScene(2000, seed=3), speed=0.03)
+    # Un paso de 50 ms es un frame de GalaxiaV2; tras wrap_every pasos el ángulo se reduce
+    for _ in range(7):
+        view.step(10, 0.05)
+    assert view.theta.max() < 2 * np.pi
+    for _ in range(3):
+        view.step(10, 0.05)
+    scene.step(0.03, 100)
+    x, y, colors = view.layers(*RGB24)[0]
+    np.testing.assert_allclose(np.c_[x, y], scene.offsets, atol=2e-3)
+    assert len(colors) == 2000
+
+
+def test_galaxy_view_keys():
+    view = GalaxyView(GalaxyScene(100, seed=0), speed=0.098)
+    view.handle_key(KEYS.K_UP, KEYS)
+    assert view.speed == view.max_speed
+    view.handle_key(KEYS.K_1 + 2, KEYS)
+    assert view.label == 'Ultravioleta'
+    first = view.layers(*RGB24)[0][2].copy()
+    view.handle_key(KEYS.K_1, KEYS)
+    assert not np.array_equal(view.layers(*RGB24)[0][2], first)
+
+
+def test_nebula_view_steps_with_its_push_and_draws_gas_under_stars():
+    scene = NebulaScene(300, 200, seed=1)
+    view = NebulaView(scene, push=0)
+    view.handle_key(KEYS.K_RIGHTBRACKET, KEYS)
+    view.handle_key(KEYS.K_t, KEYS)
+    before = scene.stars_offsets.copy()
+    view.step(2, 0.05)
+    assert scene.interaction_strength == 5
+    assert not np.array_equal(scene.stars_offsets, before)
+    gas, stars = view.layers(*RGB24)
+    assert len(gas[2]) == 200 and len(stars[2]) == 300
+    assert 'TURBO' in view.status()
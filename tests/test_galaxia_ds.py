@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from galaxias import GalaxiaDS
+from galaxias.GalaxiaDS import field_geometry, render_field
+
+
+def reference_field(size, extent=(-5, 5, -5, 5), core_width=0.5, arm_frequency=2, arm_count=5, arm_decay=3):
+    """La fórmula original con meshgrid en float64."""
+    x0, x1, y0, y1 = extent
+    x, y = np.meshgrid(np.linspace(x0, x1, size), np.linspace(y0, y1, size))
+    radio = np.sqrt(x**2 + y**2)
+    angulo = np.arctan2(y, x)
+    return (np.exp(-radio**2 / core_width)
+            + np.sin(arm_frequency * radio + arm_count * angulo) * np.exp(-radio / arm_decay))
+
+
+def test_matches_the_meshgrid_formula():
+    image = render_field(300, tile=64)
+    assert image.dtype == np.float32
+    np.testing.assert_allclose(image, reference_field(300), atol=2e-5)
+
+
+def test_cached_and_uncached_outputs_match():
+    uncached = render_field(257, arm_count=3, tile=100)
+    cached = render_field(257, arm_count=3, tile=100, cache=True)
+    np.testing.assert_array_equal(cached, uncached)
+    # Cambiar los brazos reutiliza la geometría cacheada
+    again = render_field(257, arm_count=4, tile=100, cache=True)
+    np.testing.assert_array_equal(again, render_field(257, arm_count=4, tile=100))
+
+
+def test_tiles_and_workers_do_not_change_the_image():
+    whole = render_field(200, tile=200, workers=1)
+    np.testing.assert_array_equal(render_field(200, tile=37, workers=4), whole)
+
+
+def test_large_images_skip_the_cache(monkeypatch):
+    monkeypatch.setattr(GalaxiaDS, 'GEOMETRY_CACHE_BYTES', 8 * 100 * 100)
+    field_geometry.cache_clear()
+    render_field(100, cache=True)
+    assert field_geometry.cache_info().currsize == 1
+    image = render_field(101, cache=True)
+    assert field_geometry.cache_info().currsize == 1
+    np.testing.assert_array_equal(image, render_field(101))
+    field_geometry.cache_clear()
+
+
+def test_writes_into_out():
+    out = np.full((64, 64), np.nan, dtype=np.float32)
+    assert render_field(64, tile=16, out=out) is out
+    np.testing.assert_array_equal(out, render_field(64))
+
+
+@pytest.mark.parametrize('extent', [(-5, 5, -5, 5), (0, 2, -1, 3)])
+def test_extent_sets_the_coordinates(extent):
+    np.testing.assert_allclose(render_field(120, extent, tile=50), reference_field(120, extent), atol=2e-5)
+
+
+def test_star_field_is_seeded_and_inside_the_extent():
+    from galaxias.GalaxiaDS import star_field
+    x, y, sizes, alphas = star_field(1000, extent=(0, 2, -1, 1), seed=4)
+    np.testing.assert_array_equal(star_field(1000, extent=(0, 2, -1, 1), seed=4)[0], x)
+    assert ((x >= 0) & (x <= 2) & (y >= -1) & (y <= 1)).all()
+    assert ((sizes >= 0.1) & (sizes <= 1.5)).all()
+    assert ((alphas >= 0.3) & (alphas <= 1.0)).all()
+
+
+def test_draw_stars_is_one_scatter_with_per_star_alpha():
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from galaxias.GalaxiaDS import draw_stars, star_field
+
+    fig, ax = plt.subplots()
+    try:
+        x, y, sizes, alphas = star_field(500, seed=1)
+        artist = draw_stars(ax, x, y, sizes, alphas)
+        assert len(ax.collections) == 1
+        np.testing.assert_allclose(artist.get_facecolors()[:, 3], alphas)
+        np.testing.assert_allclose(artist.get_facecolors()[:, :3], 1.0)
+        np.testing.assert_allclose(artist.get_offsets(), np.c_[x, y])
+    finally:
+        plt.close(fig)
+
+
+def test_composite_stars_layers_the_alphas():
+    from galaxias.GalaxiaDS import composite_stars
+    image = np.zeros((4, 4, 3), dtype=np.float32)
+    # Dos estrellas en el píxel (fila 0, columna 0) y una en (fila 3, columna 2), con origin='lower'
+    composite_stars(image, [0.1, 0.2, 2.6], [0.1, 0.3, 3.9], [0.5, 0.5, 0.2], extent=(0, 4, 0, 4))
+    np.testing.assert_allclose(image[0, 0], 0.75, rtol=1e-6)
+    np.testing.assert_allclose(image[3, 2], 0.2, rtol=1e-6)
+    assert image.sum() == pytest.approx(3 * (0.75 + 0.2))
+
+
+def test_composite_stars_ignores_stars_outside_and_keeps_the_background():
+    from galaxias.GalaxiaDS import composite_stars
+    image = np.full((2, 2, 3), 0.25, dtype=np.float32)
+    composite_stars(image, [-1.0, 5.0, 1.5], [0.5, 0.5, 1.5], [1.0, 1.0, 0.4], extent=(0, 2, 0, 2), color='red')
+    np.testing.assert_allclose(image[1, 1], [0.25 * 0.6 + 0.4, 0.25 * 0.6, 0.25 * 0.6], rtol=1e-6)
+    np.testing.assert_allclose(image[0, 0], 0.25)
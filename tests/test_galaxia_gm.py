@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from galaxias.GalaxiaGM import BLOCK_SIZE, INNER, OUTER, STAR_DTYPE, create_galaxy, iter_galaxy_chunks
+
+INNER_STARS, OUTER_STARS = 50_000, 100_001
+
+
+@pytest.fixture(scope='module')
+def whole():
+    return create_galaxy(INNER_STARS, OUTER_STARS, num_arms=3, seed=5)
+
+
+@pytest.mark.parametrize('chunk_size', [7_919, BLOCK_SIZE, 100_000, 10**6])
+def test_chunks_concatenate_to_the_whole_galaxy(whole, chunk_size):
+    chunks = list(iter_galaxy_chunks(INNER_STARS, OUTER_STARS, num_arms=3, chunk_size=chunk_size, seed=5))
+    assert all(chunk.dtype == STAR_DTYPE for chunk in chunks)
+    assert all(len(chunk) == chunk_size for chunk in chunks[:-1])
+    assert 0 < len(chunks[-1]) <= chunk_size
+    stars = np.concatenate(chunks)
+    inner, outer = stars[:INNER_STARS], stars[INNER_STARS:]
+    for column, expected in zip((inner['x'], inner['y'], outer['x'], outer['y']), whole):
+        np.testing.assert_array_equal(column, expected)
+
+
+def test_populations_and_counts():
+    stars = np.concatenate(list(iter_galaxy_chunks(1000, 2999, num_arms=3, chunk_size=700, seed=1)))
+    # Las estrellas de los brazos se reparten por igual: sobran las que no llegan a un brazo más
+    assert len(stars) == 1000 + 2997
+    assert (stars['population'][:1000] == INNER).all()
+    assert (stars['population'][1000:] == OUTER).all()
+    x_inner, y_inner, x_outer, y_outer = create_galaxy(1000, 2999, num_arms=3, seed=1)
+    assert (len(x_inner), len(x_outer)) == (1000, 2997)
+    assert x_inner.dtype == np.float32 and x_inner.flags.c_contiguous
+
+
+def test_radii_follow_the_populations(whole):
+    x_inner, y_inner, x_outer, y_outer = whole
+    assert np.hypot(x_inner, y_inner).max() <= 2.0 + 1e-5
+    r_outer = np.hypot(x_outer, y_outer)
+    assert r_outer.min() >= 2.0 - 1e-5 and r_outer.max() <= 10.0 + 1e-5
+
+
+def test_seed_and_generator_are_reproducible():
+    np.random.seed(3)
+    expected = np.random.random()
+    np.random.seed(3)
+    a = create_galaxy(500, 1500, seed=9)
+    assert np.random.random() == expected
+    b = create_galaxy(500, 1500, seed=np.random.default_rng(9))
+    for u, v in zip(a, b):
+        np.testing.assert_array_equal(u, v)
+
+
+def test_empty_galaxy():
+    assert list(iter_galaxy_chunks(0, 0)) == []
+    assert all(len(column) == 0 for column in create_galaxy(0, 0))
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from galaxias.GalaxiaGPT import generar_brazos, generar_bulbo
+
+
+def test_bulge_is_reproducible_and_leaves_the_global_state_alone():
+    np.random.seed(7)
+    expected = np.random.random(3)
+    np.random.seed(7)
+    first = generar_bulbo(500, radio_bulbo=2, seed=3)
+    np.testing.assert_array_equal(np.random.random(3), expected)
+    np.testing.assert_array_equal(generar_bulbo(500, radio_bulbo=2, seed=3), first)
+    assert first.shape == (500, 3)
+    # Aplanado en Z
+    assert first[:, 2].std() < 0.2 * first[:, 0].std()
+
+
+def test_bulge_and_arms_share_a_generator():
+    a = np.random.default_rng(5)
+    b = np.random.default_rng(5)
+    np.testing.assert_array_equal(generar_bulbo(100, 2, seed=a), generar_bulbo(100, 2, seed=b))
+    np.testing.assert_array_equal(generar_brazos(90, 3, seed=a), generar_brazos(90, 3, seed=b))
+
+
+def test_levels_are_prefixes_of_one_shuffle():
+    from galaxias.GalaxiaGPT import LevelOfDetail
+    points = generar_brazos(100_000, 3, seed=0)
+    lod = LevelOfDetail(points, factor=4, min_points=1000, seed=1)
+    assert lod.counts == [100_000, 25_000, 6_250, 1_562]
+    # Barajado, no recortado: los mismos puntos
+    np.testing.assert_array_equal(np.sort(lod.points, axis=0), np.sort(points, axis=0))
+    assert not np.array_equal(lod.points[:100], points[:100])
+
+
+def test_level_fits_the_visible_points_in_the_budget():
+    from galaxias.GalaxiaGPT import LevelOfDetail
+    points = np.random.default_rng(2).uniform(-1, 1, (40_000, 3))
+    lod = LevelOfDetail(points, factor=2, min_points=1000, seed=0)
+    assert lod.level(40_000) == 40_000
+    assert lod.level(15_000) == 10_000
+    assert lod.level(10) == lod.counts[-1]
+    # Con un octavo de la nube a la vista caben ocho veces más puntos
+    limits = ((0, 1), (0, 1), (0, 1))
+    assert abs(lod.visible_fraction(limits) - 1 / 8) < 0.03
+    assert lod.level(5_000, limits) == 40_000
+
+
+def test_viewer_switches_levels_and_keeps_the_brightness():
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from galaxias.GalaxiaGPT import LevelOfDetail, LODViewer
+
+    fig = plt.figure()
+    try:
+        ax = fig.add_subplot(111, projection='3d')
+        lod = LevelOfDetail(generar_brazos(20_000, 3, seed=0), factor=4, min_points=500, seed=0)
+        viewer = LODViewer(ax, [(lod, dict(s=1, color='blue', alpha=0.3))], interactive_budget=2_000)
+        assert viewer.counts == [20_000]
+        viewer.draw(True)
+        assert viewer.counts[0] <= 2_000
+        assert len(ax.collections) == 1
+        expected = 1 - 0.7 ** (20_000 / viewer.counts[0])
+        assert ax.collections[0].get_alpha() == pytest.approx(expected)
+        viewer.draw(False)
+        assert viewer.counts == [20_000]
+        assert len(ax.collections) == 1
+        assert ax.collections[0].get_alpha() == pytest.approx(0.3)
+    finally:
+        plt.close(fig)
+
+
+def spiral(n, n_brazos, rotacion, radio_max):
+    """Las espirales sin ruido de la versión original, brazo a brazo."""
+    counts = [n // n_brazos + (i < n % n_brazos) for i in range(n_brazos)]
+    arms = []
+    for i, count in enumerate(counts):
+        θ = np.linspace(0, rotacion * 2*np.pi, count) + (i * 2*np.pi/n_brazos)
+        r = np.linspace(0, radio_max, count)
+        arms.append(np.c_[r * np.cos(θ), r * np.sin(θ), np.zeros(count)])
+    return np.vstack(arms)
+
+
+@pytest.mark.parametrize('n, n_brazos', [(9000, 3), (8000, 3), (10, 4), (3, 5)])
+def test_arms_return_exactly_n_stars(n, n_brazos):
+    stars = generar_brazos(n, n_brazos, seed=0)
+    assert stars.shape == (n, 3)
+    assert stars.dtype == np.float32
+
+
+def test_arms_follow_the_original_spirals():
+    stars = generar_brazos(8000, 3, rotacion=2.5, dispersión=0.0, radio_max=12, seed=0)
+    np.testing.assert_allclose(stars, spiral(8000, 3, 2.5, 12), atol=2e-5)
+
+
+def test_noise_has_the_requested_spread():
+    stars = generar_brazos(300_000, 3, dispersión=0.8, seed=1)
+    noise = stars - spiral(300_000, 3, 2, 10)
+    np.testing.assert_allclose(noise.std(axis=0), [0.8, 0.8, 0.08], rtol=0.02)
+
+
+def test_out_is_reused():
+    out = np.empty((5000, 3), dtype=np.float32)
+    assert generar_brazos(5000, 4, seed=3, out=out) is out
+    np.testing.assert_array_equal(out, generar_brazos(5000, 4, seed=3))
+    # Otra galaxia en el mismo buffer no arrastra nada de la anterior
+    generar_brazos(5000, 4, rotacion=1, seed=4, out=out)
+    np.testing.assert_array_equal(out, generar_brazos(5000, 4, rotacion=1, seed=4))
+
+
+@pytest.mark.parametrize('out', [np.empty((10, 3)), np.empty((11, 3), dtype=np.float32),
+                                 np.empty((3, 10), dtype=np.float32).T])
+def test_out_must_be_a_contiguous_float32_buffer(out):
+    with pytest.raises(ValueError):
+        generar_brazos(10, 2, out=out)
@@ -0,0 +1,112 @@
+import io
+
+import numpy as np
+import pytest
+
+from LongituCirculoTramo import _formatear_csv, calcular_lote, leer_bloques, procesar_archivo
+
+ROWS = np.array([[1.0, 2.0, 3.0], [2.0, 3.0, 4.0], [0.5, 10.0, 0.0]])
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+def _read_all(path, chunk_rows=1_000_000):
+    blocks = list(leer_bloques(path, chunk_rows))
+    return np.column_stack([np.concatenate(column) for column in zip(*blocks)])
+
+
+def test_calcular_lote_matches_the_formulas():
+    radio, tramo, tiempo = ROWS.T
+    result = calcular_lote(radio, tramo, tiempo)
+    rotaciones = tramo / (2 * np.pi * radio)
+    np.testing.assert_allclose(result[:2, 0], rotaciones[:2])
+    np.testing.assert_allclose(result[:2, 1], tramo[:2] / tiempo[:2])
+    np.testing.assert_allclose(result[:2, 2], rotaciones[:2] * 360 / tiempo[:2])
+    # Sin tiempo no hay velocidades
+    assert result[2, 0] == rotaciones[2]
+    assert np.isnan(result[2, 1:]).all()
+
+
+def test_calcular_lote_reuses_out():
+    out = np.empty((3, 3))
+    assert calcular_lote(*ROWS.T, out=out) is out
+
+
+@pytest.mark.parametrize('text', [
+    'radio,tramo,tiempo\n1,2,3\n2,3,4\n0.5,10,0\n',
+    'radio,tramo,tiempo\n1,2,3\n2,3,4\n0.5,10,0',
+    'radio,tramo,tiempo\n1,2,3\n\n2,3,4\n   \n0.5,10,0\n\n',
+    '1,2,3\n2,3,4\n0.5,10,0\n',
+    'tiempo,radio,tramo\n3,1,2\n4,2,3\n0,0.5,10\n',
+])
+@pytest.mark.parametrize('chunk_rows', [1, 2, 1000])
+def test_leer_bloques_csv(tmp_path, text, chunk_rows):
+    np.testing.assert_array_equal(_read_all(_write(tmp_path, 'datos.csv', text), chunk_rows), ROWS)
+
+
+@pytest.mark.parametrize('structured', [False, True])
+def test_leer_bloques_npy(tmp_path, structured):
+    path = str(tmp_path / 'datos.npy')
+    if structured:
+        data = np.zeros(len(ROWS), dtype=[('tiempo', 'f4'), ('radio', 'f8'), ('tramo', 'f8')])
+        data['radio'], data['tramo'], data['tiempo'] = ROWS.T
+        np.save(path, data)
+    else:
+        np.save(path, ROWS)
+    np.testing.assert_array_equal(_read_all(path, 2), ROWS)
+
+
+def test_trailing_blank_line_adds_no_row(tmp_path):
+    path = _write(tmp_path, 'datos.csv', 'radio,tramo,tiempo\n1,2,3\n2,3,4\n\n')
+    output = str(tmp_path / 'salida.npy')
+    assert procesar_archivo(path, output) == 2
+    np.testing.assert_array_equal(np.load(output), calcular_lote([1, 2], [2, 3], [3, 4]))
+
+
+@pytest.mark.parametrize('text', [
+    'radio,tramo,tiempo\n1,2,3\n2,3,4\n0.5,10,0\n',
+    '1,2,3\n\n2,3,4\n0.5,10,0',
+    'radio,tramo,tiempo\n',
+])
+@pytest.mark.parametrize('output', ['salida.npy', 'salida.csv'])
+def test_procesar_archivo_csv(tmp_path, text, output):
+    path = _write(tmp_path, 'datos.csv', text)
+    output = str(tmp_path / output)
+    expected = ROWS[:text.count(',') // 2 - (1 if text.startswith('radio') else 0)]
+    assert procesar_archivo(path, output, chunk_rows=2) == len(expected)
+
+    result = calcular_lote(*expected.T)
+    if output.endswith('.npy'):
+        np.testing.assert_array_equal(np.load(output), result)
+    else:
+        reference = io.StringIO()
+        np.savetxt(reference, np.column_stack((expected, result)), delimiter=',', fmt='%.9g')
+        with open(output) as f:
+            assert f.readline() == 'radio,tramo,tiempo,rotaciones,velocidad_lineal,velocidad_angular\n'
+            assert f.read() == reference.getvalue()
+
+
+def test_procesar_archivo_structured_npy(tmp_path):
+    path = str(tmp_path / 'datos.npy')
+    data = np.zeros(len(ROWS), dtype=[('radio', 'f8'), ('tramo', 'f8'), ('tiempo', 'f8'), ('rueda', 'i4')])
+    data['radio'], data['tramo'], data['tiempo'] = ROWS.T
+    np.save(path, data)
+    output = str(tmp_path / 'salida.npy')
+    assert procesar_archivo(path, output, chunk_rows=2) == 3
+    np.testing.assert_array_equal(np.load(output), calcular_lote(*ROWS.T))
+
+
+def test_csv_values_are_formatted_like_printf():
+    rng = np.random.default_rng(0)
+    values = np.concatenate([
+        rng.uniform(-1e3, 1e3, 600), 10.0 ** rng.uniform(-320, 308, 600) * rng.choice([-1, 1], 600),
+        rng.integers(-1000, 1000, 600), rng.uniform(0, 1, 600).round(3),
+        [0.0, -0.0, np.nan, np.inf, -np.inf, 1e-5, 1e-4, 123456789, 999999999.7, 1e9, 0.00009999999999,
+         5e-324, 1.5, 100, 1e100, 1e-100, 2.5e-7, 1.7976931348623157e308]])
+    block = values[:len(values) // 6 * 6].reshape(-1, 6)
+    expected = ''.join(','.join('%.9g' % value for value in row) + '\n' for row in block)
+    assert _formatear_csv(block).decode() == expected
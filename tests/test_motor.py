@@ -0,0 +1,63 @@
+import time
+
+import numpy as np
+import pytest
+
+from galaxias.EscenaGalaxia import GalaxyScene
+from galaxias.EscenaNebulosa import NebulaScene
+from galaxias.MotorSimulacion import SimulationEngine, default_start_method
+
+
+def _wait_for_frames(engine, scene, frames, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        done = engine.sync(scene)
+        if done >= frames:
+            return done
+        time.sleep(0.01)
+    raise AssertionError(f"el motor no llegó a {frames} pasos")
+
+
+@pytest.mark.parametrize('start_method', ['fork', 'spawn'])
+def test_galaxy_matches_the_serial_steps(start_method):
+    scene = GalaxyScene(1000, seed=4)
+    reference = GalaxyScene(1000, seed=4)
+    with SimulationEngine(scene, workers=2, interval=0.0, start_method=start_method) as engine:
+        engine.start(0.03)
+        done = _wait_for_frames(engine, scene, 5)
+    # El frame publicado es el de `done` pasos completos, sea cual sea el reparto entre procesos
+    for _ in range(done):
+        reference.step(0.03)
+    np.testing.assert_allclose(scene.offsets, reference.offsets, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize('start_method', ['fork', 'spawn'])
+def test_nebula_runs_in_the_workers(start_method):
+    scene = NebulaScene(400, 300, seed=2)
+    initial = scene.stars_offsets.copy()
+    with SimulationEngine(scene, workers=2, interval=0.0, start_method=start_method) as engine:
+        engine.start(0.02, 5.0)
+        _wait_for_frames(engine, scene, 3)
+    assert not np.array_equal(scene.stars_offsets, initial)
+    assert np.isfinite(scene.nebula_offsets).all()
+
+
+def test_default_start_method_is_available():
+    import multiprocessing as mp
+    assert default_start_method() in mp.get_all_start_methods()
+
+
+@pytest.mark.parametrize('start_method', ['fork', 'spawn'])
+def test_nbody_galaxy_matches_the_serial_steps(start_method):
+    # Las fuerzas se reparten por grupos del árbol entre los procesos
+    scene = GalaxyScene(1500, seed=4)
+    reference = GalaxyScene(1500, seed=4)
+    scene.enable_nbody()
+    reference.enable_nbody()
+    with SimulationEngine(scene, workers=3, interval=0.0, start_method=start_method) as engine:
+        engine.start(0.03)
+        done = _wait_for_frames(engine, scene, 4)
+    assert scene.nbody.vx is not None
+    for _ in range(done):
+        reference.step(0.03)
+    np.testing.assert_allclose(scene.offsets, reference.offsets, rtol=1e-9, atol=1e-9)
@@ -0,0 +1,187 @@
+import matplotlib
+import numpy as np
+import pytest
+
+matplotlib.use('Agg')
+
+from galaxias import EscenaNebulosa
+from galaxias.EscenaNebulosa import NebulaScene
+from galaxias.EstrellasPygame import NebulaView
+from galaxias.RenderHeadless import _BUILDERS
+
+
+def _options(**changes):
+    options = {'num_stars': 300, 'num_nebula_particles': None, 'seed': 42, 'snapshot': None, 'speed': 0.02, 'dpi': 20,
+               'filter': 'Visible', 'color_balance': 0.5, 'boost': False, 'push': None}
+    options.update(changes)
+    return options
+
+
+def test_scene_pushes_by_default():
+    pushed = NebulaScene(300, 300, seed=1)
+    still = NebulaScene(300, 300, seed=1, interaction_strength=0.0)
+    assert pushed.interaction_strength == EscenaNebulosa.interaction_strength > 0
+    pushed.step(0.02)
+    still.step(0.02)
+    assert not np.array_equal(pushed.nebula_offsets, still.nebula_offsets)
+
+
+def test_snapshot_keeps_the_push(tmp_path):
+    path = tmp_path / 'nebulosa.snap'
+    NebulaScene(100, 100, seed=1, interaction_strength=3.0).save_snapshot(path)
+    assert NebulaScene.from_snapshot(path).interaction_strength == 3.0
+
+
+def test_pygame_view_uses_the_scene_push():
+    assert NebulaView(NebulaScene(100, 100, seed=1)).push == EscenaNebulosa.interaction_strength
+    assert NebulaView(NebulaScene(100, 100, seed=1), push=0.0).push == 0.0
+
+
+@pytest.mark.parametrize('push', [None, 0.0, 25.0])
+def test_headless_render_matches_the_window(push):
+    import matplotlib.pyplot as plt
+
+    fig, advance, draw = _BUILDERS['nebulosa'](_options(push=push))
+    advance(3)
+    draw()
+    drawn = np.asarray(fig.axes[0].collections[1].get_offsets())
+    plt.close(fig)
+
+    reference = NebulaScene(300, seed=42, **({} if push is None else {'interaction_strength': push}))
+    for _ in range(3):
+        reference.step(0.02)
+    np.testing.assert_array_equal(drawn, reference.nebula_offsets)
+
+
+def test_headless_gas_count_is_an_option():
+    import matplotlib.pyplot as plt
+
+    fig, _, _ = _BUILDERS['nebulosa'](_options(num_nebula_particles=123))
+    assert len(fig.axes[0].collections[1].get_offsets()) == 123
+    plt.close(fig)
+
+
+@pytest.mark.parametrize('n', [300, 3000])
+def test_benchmark_scales_the_gas_with_the_stars(n):
+    import matplotlib.pyplot as plt
+    from galaxias.BenchmarkGalaxia import _update
+
+    _update('nebulosa')(n)
+    stars, gas = plt.gcf().axes[0].collections[:2]
+    plt.close('all')
+    assert len(stars.get_offsets()) == n
+    assert len(gas.get_offsets()) == 2 * n // 3
+
+
+def test_render_without_push_option(tmp_path):
+    from galaxias.RenderHeadless import render
+
+    render('nebulosa', 2, tmp_path, workers=1, num_stars=200, num_nebula_particles=100, dpi=20)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['frame_00000.png', 'frame_00001.png']
+
+
+@pytest.mark.parametrize('scene', ['galaxia', 'nebulosa'])
+def test_render_with_default_options(tmp_path, scene):
+    from galaxias.RenderHeadless import render
+
+    render(scene, 2, tmp_path, workers=1, dpi=20)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['frame_00000.png', 'frame_00001.png']
+
+
+def _push_pairs_per_gas(scene):
+    x, y = scene.stars_offsets[:, 0], scene.stars_offsets[:, 1]
+    gas, _, _ = scene.star_grid.update(x, y).query_radius(scene.nebula_x, scene.nebula_y, scene.push_radius)
+    inside = np.hypot(scene.nebula_x, scene.nebula_y) < scene.simulation_size
+    return np.isin(gas, np.flatnonzero(inside)).sum() / inside.sum()
+
+
+def test_default_scene_keeps_the_full_push_radius():
+    scene = NebulaScene(seed=1)
+    assert scene.push_radius == scene.interaction_radius
+
+
+@pytest.mark.parametrize('num_stars', [30_000, 100_000, 300_000])
+def test_push_pairs_stay_bounded_with_many_stars(num_stars):
+    scene = NebulaScene(num_stars, 5000, seed=1)
+    assert scene.push_radius < scene.interaction_radius
+    assert _push_pairs_per_gas(scene) < 2 * NebulaScene.max_push_neighbors
+
+
+def _push_seconds(num_stars, num_gas):
+    import time
+
+    scene = NebulaScene(num_stars, num_gas, seed=1)
+    x, y = scene.nebula_x, scene.nebula_y
+    scene._push_gas(0.02, x, y)
+    best = np.inf
+    for _ in range(5):
+        start = time.perf_counter()
+        scene._push_gas(0.02, x, y)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_push_cost_is_near_linear_at_100k_stars():
+    # Con el alcance fijo, 100 000 estrellas costaban casi 4 veces más que 3000 con el mismo gas
+    # (y los pares crecían con estrellas × gas); ahora el coste depende casi sólo del gas
+    assert _push_seconds(100_000, 20_000) < 2.5 * _push_seconds(3000, 20_000)
+
+
+def test_star_colors_are_kept_while_the_slider_is_unchanged(monkeypatch):
+    scene = NebulaScene(500, 300, seed=1)
+    scene.update_colors(0.5)
+    calls = []
+    original = EscenaNebulosa.adjusted_color
+
+    def counting(distance, *args, **kwargs):
+        calls.append(len(distance))
+        return original(distance, *args, **kwargs)
+    monkeypatch.setattr(EscenaNebulosa, 'adjusted_color', counting)
+
+    # Sin nacimientos ni cambios en el deslizador no se recalcula ningún color
+    assert scene.update_colors(0.5) == (False, False)
+    assert calls == []
+
+    # Al mover el deslizador se recalculan todas las estrellas y la paleta de bandas
+    assert scene.update_colors(0.7)[0]
+    assert calls == [500, scene.num_color_bands]
+
+
+def test_only_born_stars_are_recolored():
+    scene = NebulaScene(500, 300, seed=1)
+    scene.update_colors(0.5)
+    before = scene.stars_colors.copy()
+    born = np.array([3, 70, 411])
+    scene.stars_r[born] += 1.0
+
+    stars_changed, _ = scene.update_colors(0.5)
+    assert stars_changed
+    changed = np.flatnonzero((scene.stars_colors != before).any(axis=1))
+    np.testing.assert_array_equal(changed, born)
+    np.testing.assert_array_equal(
+        scene.stars_colors, EscenaNebulosa.adjusted_color(scene.stars_r, 0.5, scene.simulation_size))
+
+
+def test_gas_changing_band_is_recolored():
+    scene = NebulaScene(100, 300, seed=1)
+    scene.update_colors(0.5)
+    scene.nebula_x[0] = scene.nebula_y[0] = 0.0
+    scene.nebula_x[1], scene.nebula_y[1] = scene.simulation_size * 2, 0.0
+
+    _, nebula_changed = scene.update_colors(0.5)
+    assert nebula_changed
+    np.testing.assert_array_equal(scene.nebula_colors[0], scene.band_palette[0])
+    np.testing.assert_array_equal(scene.nebula_colors[1], scene.band_palette[scene._nebula_band[1]])
+    assert scene._nebula_band[0] == 0
+
+
+def _frame_seconds(num_stars):
+    from galaxias.BenchmarkGalaxia import _step_nebulosa, measure
+
+    return measure(_step_nebulosa(num_stars), repeat=10, min_time=0)['seconds']
+
+
+def test_frame_at_100k_stars_stays_near_the_small_scene():
+    # Reconstruir la rejilla de estrellas y el seno/coseno en float64 hacían el frame
+    # de 100 000 estrellas unas 9 veces más lento que el de 3000, con el mismo gas
+    assert _frame_seconds(100_000) < 6 * _frame_seconds(3000)
@@ -0,0 +1,54 @@
+import subprocess
+import sys
+
+import pytest
+
+import galaxias
+from galaxias import cli
+
+
+def _loaded_modules(code):
+    """Módulos de terceros cargados tras ejecutar `code` en un intérprete limpio."""
+    result = subprocess.run(
+        [sys.executable, '-c', code + "\nimport sys; print(' '.join(sorted(sys.modules)))"],
+        capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+def test_importing_the_package_loads_no_heavy_modules():
+    loaded = _loaded_modules('import galaxias')
+    assert 'matplotlib' not in loaded
+    assert 'numpy' not in loaded
+    assert 'pygame' not in loaded
+
+
+def test_every_export_resolves_without_matplotlib():
+    loaded = _loaded_modules('import galaxias\nfor name in galaxias.__all__: getattr(galaxias, name)')
+    assert 'matplotlib' not in loaded
+    assert 'pygame' not in loaded
+
+
+def test_exports_come_from_their_modules():
+    from galaxias.BarnesHut import NBodySimulation
+    from galaxias.GalaxiaGPT import generar_bulbo
+    assert galaxias.NBodySimulation is NBodySimulation
+    assert galaxias.generar_bulbo is generar_bulbo
+    assert set(galaxias.__all__) <= set(dir(galaxias))
+    with pytest.raises(AttributeError):
+        galaxias.no_existe
+
+
+@pytest.mark.parametrize('argv, expected', [
+    (['galaxia'], ('GalaxiaV2', [])),
+    (['galaxia', '--nbody'], ('GalaxiaV2', ['--nbody'])),
+    (['nebulosa', '-o', 'frames', '--frames', '3'], ('RenderHeadless', ['nebulosa', '--frames', '3'])),
+    (['andromeda', '--output', 'png'], ('RasterGalaxia', [])),
+    (['benchmark', 'run', '--cases', 'step_nbody'], ('BenchmarkGalaxia', ['run', '--cases', 'step_nbody'])),
+])
+def test_cli_resolves_scene_and_output(argv, expected):
+    assert cli.resolve(argv) == expected
+
+
+def test_cli_rejects_unknown_output():
+    with pytest.raises(SystemExit):
+        cli.resolve(['espiral', '-o', 'png'])
@@ -0,0 +1,44 @@
+import matplotlib
+import numpy as np
+import pytest
+
+matplotlib.use('Agg')
+
+from galaxias.PerfilFrames import FrameProfiler
+
+
+def test_instrumented_animation_measures_the_draw():
+    import matplotlib.pyplot as plt
+    from matplotlib.animation import FuncAnimation
+
+    fig, ax = plt.subplots()
+    scatter = ax.scatter(np.zeros(10), np.zeros(10))
+    profiler = FrameProfiler()
+
+    def update(frame):
+        with profiler.phase('fisica'):
+            scatter.set_offsets(np.full((10, 2), frame))
+        return (scatter,)
+
+    ani = FuncAnimation(fig, update, frames=10, blit=False, cache_frame_data=False)
+    profiler.instrument(ani)
+    for frame in range(3):
+        ani._draw_next_frame(frame, blit=False)
+    plt.close(fig)
+    assert len(profiler.durations['dibujo']) == 3
+    assert len(profiler.durations['fisica']) >= 3
+
+
+def test_missing_post_draw_only_skips_the_draw_phase():
+    class Animation:
+        pass
+
+    animation = Animation()
+    profiler = FrameProfiler()
+    with pytest.warns(RuntimeWarning, match="'dibujo' no se mide"):
+        assert profiler.instrument(animation) is animation
+    assert not hasattr(animation, '_post_draw')
+    assert profiler.enabled
+    with profiler.phase('fisica'):
+        pass
+    assert len(profiler.durations['fisica']) == 1
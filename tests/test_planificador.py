@@ -0,0 +1,50 @@
+import matplotlib
+import numpy as np
+import pytest
+
+matplotlib.use('Agg')
+
+from galaxias.PlanificadorFrames import FrameScheduler
+
+
+def _animation():
+    import matplotlib.pyplot as plt
+    from matplotlib.animation import FuncAnimation
+
+    fig, ax = plt.subplots()
+    scatter = ax.scatter(np.zeros(10), np.zeros(10))
+    frames = []
+
+    def update(frame):
+        frames.append(frame)
+        return (scatter,)
+
+    return fig, FuncAnimation(fig, update, frames=10, interval=50, blit=False, cache_frame_data=False), frames
+
+
+def test_instrumented_animation_records_every_frame():
+    import matplotlib.pyplot as plt
+
+    fig, ani, frames = _animation()
+    scheduler = FrameScheduler(0.05)
+    scheduler.instrument(ani)
+    for frame in range(3):
+        ani._draw_next_frame(frame, blit=False)
+    plt.close(fig)
+    assert scheduler.frame == 3
+    assert frames[-3:] == [0, 1, 2]
+
+
+def test_missing_private_hooks_disable_the_scheduler():
+    class Animation:
+        pass
+
+    animation = Animation()
+    scheduler = FrameScheduler(0.05)
+    with pytest.warns(RuntimeWarning, match='calidad adaptativa'):
+        assert scheduler.instrument(animation) is animation
+    assert not scheduler.enabled
+    assert not hasattr(animation, '_draw_next_frame')
+    # Apagado, no decima nada
+    points = np.arange(10)
+    assert scheduler.decimate(points) is points
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from galaxias.PoblacionGalaxia import generate_population
+
+
+def _angular_histogram(r, theta, bulge_size=3, bins=24):
+    counts, _ = np.histogram(theta[r > bulge_size], bins, (0, 2 * np.pi))
+    return counts
+
+
+def test_every_arm_gains_density():
+    r, theta, _ = generate_population(200_000, arm_count=4, arm_width=0.5, arm_fraction=0.7, seed=1)
+    counts = _angular_histogram(r, theta)
+    # Cada brazo (0, π/2, π, 3π/2) queda entre dos bins; los huecos, en medio de cada cuarto
+    at_arms = counts[[0, 5, 6, 11, 12, 17, 18, 23]]
+    between = counts[[2, 3, 8, 9, 14, 15, 20, 21]]
+    assert at_arms.min() > 4 * between.max()
+
+
+def test_without_arms_the_disc_is_uniform():
+    r, theta, _ = generate_population(200_000, arm_fraction=0.0, seed=1)
+    counts = _angular_histogram(r, theta)
+    assert counts.max() < 1.1 * counts.min()
+
+
+def test_narrower_arms_are_denser():
+    wide = _angular_histogram(*generate_population(200_000, arm_width=0.5, seed=2)[:2], bins=96)
+    narrow = _angular_histogram(*generate_population(200_000, arm_width=0.2, seed=2)[:2], bins=96)
+    assert narrow.max() > 1.5 * wide.max()
+
+
+def test_angles_stay_in_range():
+    _, theta, _ = generate_population(50_000, seed=3)
+    assert theta.min() >= 0 and theta.max() < 2 * np.pi
+
+
+@pytest.mark.parametrize('chunk_size', [1, 999, 4096])
+def test_chunk_size_does_not_change_the_galaxy(chunk_size):
+    reference = generate_population(10_000, seed=5)
+    chunked = generate_population(10_000, seed=5, chunk_size=chunk_size)
+    for expected, actual in zip(reference, chunked):
+        np.testing.assert_array_equal(actual, expected)
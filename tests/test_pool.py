@@ -0,0 +1,113 @@
+import copy
+
+import numpy as np
+import pytest
+
+from galaxias.PoolParticulas import Emitter, ParticlePool, PoolColumn
+
+
+def make_pool(capacity=10):
+    return ParticlePool(capacity, size=np.float32, offsets=(float, (2,)))
+
+
+def test_columns_have_fixed_capacity():
+    pool = make_pool()
+    assert pool['size'].shape == (10,) and pool['size'].dtype == np.float32
+    assert pool['offsets'].shape == (10, 2)
+    assert pool.count() == 0
+    assert list(pool.free_slots()) == list(range(10))
+
+
+def test_spawn_fills_free_slots_in_order():
+    pool = make_pool()
+    slots = pool.spawn(3, 2.0, size=[1, 2, 3], offsets=(5.0, 6.0))
+    assert list(slots) == [0, 1, 2]
+    assert list(pool['size'][:4]) == [1, 2, 3, 0]
+    np.testing.assert_array_equal(pool['offsets'][:3], [[5, 6]] * 3)
+    assert (pool['age'][slots] == 0).all() and (pool['lifetime'][slots] == 2).all()
+    assert pool.count() == 3
+
+    # Los huecos retirados se reutilizan primero
+    pool.retire([1])
+    assert list(pool.spawn(2, 1.0, size=9)) == [1, 3]
+
+
+def test_spawn_is_limited_by_the_free_slots_of_the_range():
+    pool = make_pool()
+    slots = pool.spawn(8, np.arange(8.0) + 1, index=slice(4, 10), size=np.arange(8))
+    assert list(slots) == [4, 5, 6, 7, 8, 9]
+    # Los valores por partícula se toman en orden
+    assert list(pool['lifetime'][4:]) == [1, 2, 3, 4, 5, 6]
+    assert list(pool['size'][4:]) == [0, 1, 2, 3, 4, 5]
+    assert pool.count(slice(0, 4)) == 0
+    assert len(pool.spawn(1, 1.0, index=slice(4, 10))) == 0
+
+
+def test_retired_particles_are_invisible():
+    pool = make_pool()
+    pool.spawn(4, 3.0)
+    pool.advance_age(1.0)
+    pool.retire(np.array([True, False, True, False]), index=slice(0, 4))
+    assert list(pool['alive'][:4]) == [False, True, False, True]
+    fraction = pool.lifetime_fraction(slice(0, 4))
+    assert fraction[0] == 1 and fraction[2] == 1
+    assert fraction[1] == pytest.approx(1 / 3)
+
+
+def test_advance_age_retires_expired_particles():
+    pool = make_pool()
+    pool.spawn(3, [1.0, 2.0, 3.0])
+    assert pool.advance_age(1.5) == 1
+    assert list(pool['alive'][:3]) == [False, True, True]
+    assert pool.advance_age(1.0) == 1
+    assert pool.advance_age(0.1, index=slice(0, 2)) == 0
+    assert pool.count() == 1
+
+
+def test_long_run_keeps_the_invariants():
+    rng = np.random.default_rng(0)
+    pool = make_pool(200)
+    arrays = {name: array for name, array in pool.columns.items()}
+    for _ in range(500):
+        k = int(rng.integers(0, 20))
+        pool.spawn(k, rng.uniform(0.5, 3.0, k), size=rng.random(k))
+        pool.advance_age(0.1)
+        alive = pool['alive']
+        assert pool.count() == alive.sum() <= pool.capacity
+        assert len(pool.free_slots()) + pool.count() == pool.capacity
+        assert (pool['age'][alive] < pool['lifetime'][alive]).all()
+        used = np.flatnonzero(~alive & (pool['lifetime'] > 0))
+        assert (pool.lifetime_fraction(used) >= 1).all()
+    # Nacer y morir no reasigna memoria
+    assert all(pool.columns[name] is array for name, array in arrays.items())
+
+
+def test_emitter_rate_and_range():
+    rng = np.random.default_rng(1)
+    pool = make_pool(1000)
+    emitter = Emitter(rate=400, make=lambda rng, n: {'size': rng.random(n)}, lifetime=(2.0, 4.0))
+    born = [len(emitter.emit(pool, 0.1, rng, index=slice(500, 1000))) for _ in range(20)]
+    # Medio pool: la mitad del ritmo, 20 partículas por llamada en promedio
+    assert np.mean(born) == pytest.approx(20, rel=0.2)
+    assert pool.count(slice(0, 500)) == 0
+    lifetimes = pool['lifetime'][pool['alive']]
+    assert ((lifetimes >= 2) & (lifetimes <= 4)).all()
+    # Nunca más partículas que huecos
+    full = make_pool(5)
+    assert len(Emitter(1e6, lambda rng, n: {}, (1, 2)).emit(full, 1.0, rng)) == 5
+    assert len(Emitter(0, lambda rng, n: {}, (1, 2)).emit(make_pool(), 1.0, rng)) == 0
+
+
+def test_copy_and_columns():
+    class Scene:
+        stars_size = PoolColumn('stars', 'size')
+
+    scene = Scene()
+    scene.stars = make_pool()
+    scene.stars.spawn(2, 1.0, size=7)
+    assert list(scene.stars_size[:3]) == [7, 7, 0]
+    shared = copy.copy(scene.stars)
+    shared['size'] = np.ones(10, dtype=np.float32)
+    assert scene.stars['size'][2] == 0
+    rebuilt = ParticlePool.from_columns(scene.stars.columns)
+    assert rebuilt.capacity == 10 and rebuilt.count() == 2
@@ -0,0 +1,82 @@
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pytest
+
+from galaxias.RasterGalaxia import accumulate, composite, main, rasterize
+
+EXTENT = (-10.0, 10.0, -10.0, 10.0)
+
+
+def points(n=50_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(0, 4, n).astype(np.float32), rng.normal(0, 4, n).astype(np.float32)
+
+
+def test_counts_every_star_inside_once():
+    x, y = points()
+    counts = accumulate(np.zeros((64, 96), dtype=np.int64), x, y, EXTENT, chunk_size=7000)
+    inside = (x >= -10) & (x < 10) & (y >= -10) & (y < 10)
+    assert counts.sum() == inside.sum()
+
+
+def test_matches_histogram2d_with_the_top_row_first():
+    x, y = points(20_000, seed=1)
+    counts = accumulate(np.zeros((50, 40), dtype=np.int64), x, y, EXTENT)
+    expected, _, _ = np.histogram2d(y, x, bins=(50, 40), range=((-10, 10), (-10, 10)))
+    # Casos en el borde exacto de un bin pueden caer en el vecino por redondeo
+    assert np.abs(counts - expected[::-1]).sum() <= 2
+    assert counts.sum() == expected.sum()
+
+
+def test_chunk_size_does_not_change_the_counts():
+    x, y = points()
+    whole = accumulate(np.zeros((32, 32), dtype=np.int64), x, y, EXTENT, chunk_size=len(x))
+    pieces = accumulate(np.zeros((32, 32), dtype=np.int64), x, y, EXTENT, chunk_size=999)
+    np.testing.assert_array_equal(pieces, whole)
+
+
+def test_composite_is_additive_alpha():
+    counts = np.array([[0, 1, 3]])
+    image = composite(np.zeros((1, 3, 3), dtype=np.float32), counts, 'white', 0.4)
+    np.testing.assert_allclose(image[0, :, 0], [0, 0.4, 1 - 0.6 ** 3], rtol=1e-6)
+
+
+def test_auto_gain_keeps_dense_pixels_below_saturation():
+    x, y = points()
+    counts = accumulate(np.zeros((64, 64), dtype=np.int64), x, y, EXTENT)
+    image = composite(np.zeros((64, 64, 3), dtype=np.float32), counts, 'white', 0.5, gain='auto')
+    assert np.percentile(image[counts > 0, 0], 99) <= 0.95 + 1e-6
+
+
+def test_arrays_and_chunks_render_the_same_image():
+    x, y = points()
+    arrays = rasterize([(x, y, 'gold', 0.3)], 48, 48, EXTENT)
+    chunks = ((x[i:i + 5000], y[i:i + 5000]) for i in range(0, len(x), 5000))
+    np.testing.assert_array_equal(rasterize([(chunks, 'gold', 0.3)], 48, 48, EXTENT), arrays)
+    assert arrays.dtype == np.float32
+    assert 0 <= arrays.min() and arrays.max() <= 1
+
+
+def test_default_extent_covers_every_star():
+    x, y = points(5000)
+    x[0], y[0] = 30.0, 0.0
+    x[1], y[1] = 0.0, -30.0
+    image = rasterize([(x, y, 'white', 1.0)], 61, 61)
+    # Las dos estrellas más lejanas caen en el último píxel de su fila y de su columna
+    assert image[30, 60, 0] == 1.0
+    assert image[60, 30, 0] == 1.0
+    assert image[:, :, 0].sum() == len(np.unique(np.c_[np.floor((x + 30) * 61 / 60), np.floor((y + 30) * 61 / 60)],
+                                                 axis=0))
+
+
+def test_chunked_populations_need_an_extent():
+    with pytest.raises(ValueError):
+        rasterize([(iter([points(10)]), 'white', 0.5)])
+
+
+def test_main_writes_a_png(tmp_path):
+    path = tmp_path / 'galaxia.png'
+    main([str(path), '--inner', '2000', '--outer', '6000', '--size', '64', '--chunk', '3000'])
+    import matplotlib.image as mpimg
+    assert mpimg.imread(path).shape[:2] == (64, 64)
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from galaxias.RejillaEspacial import SpatialGrid
+
+
+def _brute_force(x, y, qx, qy, radius):
+    d2 = (x[None, :] - qx[:, None]) ** 2 + (y[None, :] - qy[:, None]) ** 2
+    q, p = np.nonzero(d2 <= radius * radius)
+    return set(zip(q.tolist(), p.tolist()))
+
+
+@pytest.mark.parametrize('cell_size, radius', [(1.0, 1.0), (0.5, 1.2), (2.0, 0.7)])
+def test_query_radius_matches_brute_force(cell_size, radius):
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(-10, 10, (2, 3000))
+    # Algunas consultas fuera del área indexada
+    qx, qy = rng.uniform(-12, 12, (2, 500))
+    grid = SpatialGrid(cell_size, (-10, 10, -10, 10)).build(x, y)
+    q, p, d2 = grid.query_radius(qx, qy, radius)
+    assert set(zip(q.tolist(), p.tolist())) == _brute_force(x, y, qx, qy, radius)
+    np.testing.assert_allclose(d2, (x[p] - qx[q]) ** 2 + (y[p] - qy[q]) ** 2)
+
+
+def test_update_after_moving_points():
+    rng = np.random.default_rng(1)
+    x, y = rng.uniform(-10, 10, (2, 2000))
+    grid = SpatialGrid(1.0, (-10, 10, -10, 10)).build(x, y)
+    x += rng.normal(0, 0.3, 2000)
+    y += rng.normal(0, 0.3, 2000)
+    grid.update(x, y)
+    q, p, _ = grid.query_radius(x[:200], y[:200], 1.5)
+    assert set(zip(q.tolist(), p.tolist())) == _brute_force(x, y, x[:200], y[:200], 1.5)
+
+
+def test_knn_matches_brute_force():
+    rng = np.random.default_rng(2)
+    x, y = rng.uniform(-5, 5, (2, 1000))
+    grid = SpatialGrid(0.5, (-5, 5, -5, 5)).build(x, y)
+    neighbors, dist2 = grid.query_knn(x[:50], y[:50], 6)
+    expected = np.sort((x[None, :] - x[:50, None]) ** 2 + (y[None, :] - y[:50, None]) ** 2, axis=1)[:, :6]
+    np.testing.assert_allclose(dist2, expected)
+
+
+@pytest.mark.parametrize('num_queries', [10, 2000])
+def test_few_and_many_queries_match_brute_force(num_queries):
+    # Pocas consultas leen las coordenadas de los candidatos; muchas, las copian antes en orden de celda
+    rng = np.random.default_rng(3)
+    x, y = rng.uniform(-10, 10, (2, 3000))
+    qx, qy = rng.uniform(-10, 10, (2, num_queries))
+    q, p, _ = SpatialGrid(1.0, (-10, 10, -10, 10)).build(x, y).query_radius(qx, qy, 1.0)
+    assert set(zip(q.tolist(), p.tolist())) == _brute_force(x, y, qx, qy, 1.0)
+
+
+@pytest.mark.parametrize('moved', [5, 1500])
+def test_update_matches_a_fresh_build(moved):
+    # Pocas celdas cambiadas se reinsertan en su sitio; muchas, reordenan todo el índice
+    rng = np.random.default_rng(4)
+    x, y = rng.uniform(-10, 10, (2, 2000))
+    grid = SpatialGrid(1.0, (-10, 10, -10, 10)).build(x, y)
+    x, y = x.copy(), y.copy()
+    x[:moved] = rng.uniform(-10, 10, moved)
+    grid.update(x, y)
+    fresh = SpatialGrid(1.0, (-10, 10, -10, 10)).build(x, y)
+    np.testing.assert_array_equal(grid.cell_start, fresh.cell_start)
+    np.testing.assert_array_equal(grid.cell[grid.order], fresh.cell[fresh.order])
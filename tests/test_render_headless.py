@@ -0,0 +1,54 @@
+import os
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.image as mpimg
+import numpy as np
+import pytest
+
+from galaxias.RenderHeadless import frame_path, main, render, render_range
+
+OPTIONS = {'num_stars': 200, 'num_nebula_particles': 150, 'seed': 42, 'snapshot': None, 'speed': 0.05, 'dpi': 20,
+           'filter': 'Visible', 'color_balance': 0.5, 'boost': False, 'push': None}
+
+
+def frames(out_dir, count):
+    return [mpimg.imread(frame_path(out_dir, index)) for index in range(count)]
+
+
+def test_frame_path_is_numbered():
+    assert frame_path('out', 7) == os.path.join('out', 'frame_00007.png')
+
+
+@pytest.mark.parametrize('scene', ['galaxia', 'nebulosa'])
+def test_parallel_render_matches_one_process(tmp_path, scene):
+    serial, parallel = tmp_path / 'serial', tmp_path / 'parallel'
+    render(scene, 5, str(serial), workers=1, chunks_per_worker=1, **OPTIONS)
+    render(scene, 5, str(parallel), workers=2, chunks_per_worker=2, **OPTIONS)
+    assert sorted(os.listdir(parallel)) == [f'frame_{index:05d}.png' for index in range(5)]
+    for a, b in zip(frames(serial, 5), frames(parallel, 5)):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_range_starts_from_the_advanced_state(tmp_path):
+    whole, tail = tmp_path / 'whole', tmp_path / 'tail'
+    whole.mkdir()
+    tail.mkdir()
+    assert render_range('galaxia', 0, 4, str(whole), OPTIONS) == 4
+    assert render_range('galaxia', 2, 4, str(tail), OPTIONS) == 2
+    assert not os.path.exists(frame_path(str(tail), 0))
+    for index in (2, 3):
+        np.testing.assert_array_equal(mpimg.imread(frame_path(str(tail), index)),
+                                      mpimg.imread(frame_path(str(whole), index)))
+    # La rotación avanza: dos frames seguidos no son iguales
+    assert not np.array_equal(*frames(whole, 2))
+
+
+def test_unknown_scene(tmp_path):
+    with pytest.raises(ValueError, match='Escena desconocida'):
+        render('cometa', 1, str(tmp_path))
+
+
+def test_main_needs_an_output():
+    with pytest.raises(SystemExit):
+        main(['galaxia', '--frames', '1'])
@@ -0,0 +1,58 @@
+import math
+import os
+import turtle
+
+import numpy as np
+import pytest
+
+from LongituCirculoTramo import exportar_rotacion, trayectoria
+
+
+def replay(radio, tramo, direccion, distancia_por_paso=1, inicio=(-300, 0)):
+    """Los pasos de la animación original con la tortuga (sin ventana): avanzar y girar."""
+    circulo = turtle.TNavigator()
+    circulo.goto(*inicio)
+    grados_por_paso = (360 * distancia_por_paso) / (2 * math.pi * radio)
+    if direccion == "derecha":
+        grados_por_paso *= -1
+    positions, headings = [circulo.pos()], [circulo.heading()]
+    for _ in range(int(tramo / distancia_por_paso)):
+        circulo.forward(distancia_por_paso)
+        circulo.left(grados_por_paso)
+        positions.append(circulo.pos())
+        headings.append(circulo.heading())
+    return np.array(positions), np.array(headings)
+
+
+@pytest.mark.parametrize('direccion', ['izquierda', 'derecha'])
+@pytest.mark.parametrize('radio, tramo, distancia', [(50, 500, 1), (3, 200, 1), (20, 333, 2.5)])
+def test_matches_the_turtle_replay(direccion, radio, tramo, distancia):
+    x, y, heading = trayectoria(radio, tramo, direccion, distancia_por_paso=distancia)
+    positions, headings = replay(radio, tramo, direccion, distancia)
+    np.testing.assert_allclose(np.c_[x, y], positions, atol=1e-6)
+    # Mismo ángulo, salvo la vuelta de 360
+    np.testing.assert_allclose(np.cos(np.radians(heading - headings)), 1, atol=1e-9)
+
+
+def test_frames_are_a_subset_of_the_steps():
+    x, y, heading = trayectoria(40, 1000)
+    fx, fy, fheading = trayectoria(40, 1000, frames=30)
+    assert len(fx) == 31
+    steps = np.linspace(0, 1000, 31).round().astype(int)
+    np.testing.assert_allclose(fx, x[steps], atol=1e-9)
+    np.testing.assert_allclose(fy, y[steps], atol=1e-9)
+    np.testing.assert_allclose(fheading, heading[steps], atol=1e-9)
+    # Más frames que pasos: uno por paso
+    assert len(trayectoria(40, 10, frames=100)[0]) == 11
+
+
+def test_without_turning_it_moves_in_a_straight_line():
+    x, y, heading = trayectoria(math.inf, 5, inicio=(1, 2))
+    np.testing.assert_array_equal(x, [1, 2, 3, 4, 5, 6])
+    np.testing.assert_array_equal(y, 2)
+    np.testing.assert_array_equal(heading, 0)
+
+
+def test_export_writes_one_png_per_frame(tmp_path):
+    assert exportar_rotacion(20, 100, str(tmp_path), frames=4, dpi=20) == 5
+    assert sorted(os.listdir(tmp_path)) == [f'frame_{i:05d}.png' for i in range(5)]
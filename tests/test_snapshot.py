@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from galaxias.EscenaGalaxia import GalaxyScene
+from galaxias.SnapshotGalaxia import load_snapshot, read_header, save_snapshot
+
+
+@pytest.mark.parametrize('n', [1, 7, 25, 33, 44, 63, 64, 65, 100, 257, 1000, 4099])
+def test_galaxy_scene_round_trip(tmp_path, n):
+    path = tmp_path / 'escena.snap'
+    scene = GalaxyScene(n, seed=3)
+    scene.save_snapshot(path)
+    loaded = GalaxyScene.from_snapshot(path)
+    for name in GalaxyScene.snapshot_columns:
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(scene, name), err_msg=name)
+
+
+@pytest.mark.parametrize('label_length', range(0, 200, 7))
+@pytest.mark.parametrize('rows', [0, 1, 5, 17, 300])
+def test_round_trip_with_string_attrs(tmp_path, label_length, rows):
+    path = tmp_path / 'columnas.snap'
+    rng = np.random.default_rng(label_length + rows)
+    columns = {'a': rng.random(rows), 'b': rng.integers(0, 255, (rows, 3), dtype=np.uint8),
+               'c': rng.random((rows, 2)).astype(np.float32)}
+    attrs = {'label': 'x' * label_length, 'frame': rows}
+    save_snapshot(path, columns, **attrs)
+
+    loaded, loaded_attrs = load_snapshot(path)
+    assert loaded_attrs == attrs
+    for name, array in columns.items():
+        np.testing.assert_array_equal(loaded[name], array, err_msg=name)
+
+
+def test_header_offsets_are_aligned(tmp_path):
+    path = tmp_path / 'alineado.snap'
+    save_snapshot(path, {'a': np.arange(26.0), 'b': np.arange(90, dtype=np.int32)}, label='y' * 26)
+    for info in read_header(path)['columns'].values():
+        assert info['offset'] % 64 == 0